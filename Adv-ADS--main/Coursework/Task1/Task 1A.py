@@ -1,6 +1,5 @@
 from adjacency_list_graph import AdjacencyListGraph
-from dijkstra import dijkstra
-from print_path import print_path
+from dijkstra import shortest_path
 
 # Define the station names and map them to indices
 station_names = ["A", "B", "C", "D", "E", "F"]  # A=0, B=1, C=2, D=3, E=4, F=5
@@ -15,14 +14,11 @@ edges = [
     ("D", "F", 9), ("E", "F", 2)
 ]
 
-# Initialize the graph with n nodes (n being the size of the network/vertices)
-stations_graph = AdjacencyListGraph(len(station_names), directed=False, weighted=True)
-
-# Insert edges from the array into an adjacency list graph
-for start, end, duration in edges:
-    start_index = station_to_index[start]
-    end_index = station_to_index[end]
-    stations_graph.insert_edge(start_index, end_index, duration)
+# Build an adjacency list graph with n nodes (n being the size of the network/vertices)
+# from the edges in the array, loaded in one pass
+starts, ends, durations = zip(*edges)
+stations_graph = AdjacencyListGraph.from_edges(len(station_names), [station_to_index[start] for start in starts],
+                                               [station_to_index[end] for end in ends], durations, directed=False)
 
 # Get user input for starting and destination station in upper/lowercase removing space
 starting_station = input("Enter the starting station (A, B, C, D, E, F): ").strip().upper()
@@ -36,13 +32,12 @@ else:
     starting_in = station_to_index[starting_station]
     destination_in = station_to_index[destination_station]
 
-    # Utilize Dijkstra's Algorithm to find the shortest route from starting index(station)
-    duration, predecessors = dijkstra(stations_graph, starting_in)
+    # Utilize Dijkstra's Algorithm to find the shortest route, stopping once the destination is reached
+    # (converts station indices to names along the path)
+    duration, path = shortest_path(stations_graph, starting_in, destination_in, lambda x: station_names[x])
 
-    if duration[destination_in] == float('inf'):
+    if path is None:
         print(f"No path from {starting_station} to {destination_station}.")
     else:
-        # Call print_path function to display the route (converts station indices to names)
-        path = print_path(predecessors, starting_in, destination_in, lambda x: station_names[x])
         print(f"Shortest path from {starting_station} to {destination_station}: {' -> '.join(path)}")
-        print(f"Duration of Journey: {duration[destination_in]} minutes")
+        print(f"Duration of Journey: {duration} minutes")
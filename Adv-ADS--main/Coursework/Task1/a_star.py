@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# a_star.py
+
+from single_source_shortest_paths import initialize_single_source, relax
+from min_heap_priority_queue import MinHeapPriorityQueue
+from print_path import print_path
+
+
+def a_star(G, s, t, heuristic, mapping_func=None):
+	"""Find a shortest path from s to t with A* search, which is Dijkstra's
+	algorithm with each vertex keyed by its distance from s plus a lower bound
+	on its distance to t.
+
+	Arguments:
+	G -- a weighted graph
+	s -- index of source vertex
+	t -- index of destination vertex
+	heuristic -- function returning a lower bound on the weight of a shortest path
+	from a vertex to t. It must be consistent: heuristic(u) <= w(u, v) + heuristic(v)
+	for every edge (u, v), and heuristic(t) == 0. Called once per reached vertex.
+	mapping_func -- optional function to map vertex numbers on the path,
+	default is to leave them as vertex numbers
+	Assumption:
+	All weights are nonnegative
+
+	Returns:
+	distance -- weight of a shortest path from s to t, infinity if there is none
+	path -- list of the vertices on the path from s to t, None if there is none
+	"""
+	if mapping_func is None:
+		mapping_func = lambda v: v
+
+	d, pi = initialize_single_source(G, s)
+	# f[v] is d[v] plus the lower bound on the distance from v to t.
+	h = [None] * G.get_card_V()
+	f = [float('inf')] * G.get_card_V()
+	settled = [False] * G.get_card_V()
+	h[s] = heuristic(s)
+	f[s] = h[s]
+
+	# Vertices are inserted into the priority queue only when first reached.
+	queue = MinHeapPriorityQueue(lambda u: f[u])
+	queue.insert(s)
+
+	def reached(v):
+		"""Insert v, reached for the first time, keyed by its estimated path weight."""
+		h[v] = heuristic(v)
+		f[v] = d[v] + h[v]
+		queue.insert(v)
+
+	def improved(v):
+		"""Decrease the key of v after its distance from s decreased."""
+		f[v] = d[v] + h[v]
+		queue.decrease_key(v, f[v])
+
+	while queue.get_size() > 0:
+		u = queue.extract_min()
+		settled[u] = True
+		if u == t:
+			return d[t], print_path(pi, s, t, mapping_func)
+		if f[u] == float('inf'):  # remaining vertices cannot reach t
+			break
+
+		for edge in G.get_adj_list(u):
+			v = edge.get_v()
+			# A consistent heuristic never finds a shorter path to a settled vertex.
+			# Settled vertices are skipped anyway, since a heuristic may be
+			# inconsistent on vertices that cannot reach t, which never matter.
+			if not settled[v]:
+				relax(u, v, edge.get_weight(), d, pi, reached if h[v] is None else improved)
+
+	return float('inf'), None
+
+
+# Testing
+if __name__ == "__main__":
+
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+	from dijkstra import dijkstra
+
+	# Textbook example with the zero heuristic, which makes A* into Dijkstra's algorithm.
+	vertices = ['s', 't', 'x', 'y', 'z']
+	edges = [('s', 't', 10), ('s', 'y', 5), ('t', 'x', 1), ('t', 'y', 2), ('x', 'z', 4),
+			('y', 't', 3), ('y', 'x', 9), ('y', 'z', 2), ('z', 's', 7), ('z', 'x', 6)]
+	graph1 = AdjacencyListGraph(len(vertices), True, True)
+	for edge in edges:
+		graph1.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]), edge[2])
+	for v in vertices:
+		distance, path = a_star(graph1, 0, vertices.index(v), lambda u: 0, lambda i: vertices[i])
+		print("s to " + v + ": " + str(distance) + " via " + " -> ".join(path))
+	print()
+
+	# Exact distances to t are the best possible heuristic.
+	card_V = 100
+	graph2 = generate_random_graph(card_V, 0.04, True, False, True, 0, 15)
+	all_equal = True
+	for t in range(card_V):
+		exact, exact_pi = dijkstra(graph2, t)
+		for s in range(card_V):
+			distance, path = a_star(graph2, s, t, lambda u: exact[u])
+			if distance != exact[s]:
+				print("Shortest-path distance mismatch from", s, "to", t)
+				all_equal = False
+	print("All shortest-path distances are " + ("not " if not all_equal else "") + "equal")
@@ -33,26 +33,90 @@
 import numpy as np
 
 
+class DictOfKeysMatrix:
+
+	def __init__(self, shape, no_edge, dtype):
+		"""Initialize a sparse matrix that stores only its entries other than
+		no_edge, in a dictionary keyed by (row, column). Supports the m[i, j]
+		indexing and copy() that AdjacencyMatrixGraph and its callers use.
+
+		Arguments:
+		shape -- (rows, columns) of the matrix
+		no_edge -- value of every entry not stored
+		dtype -- NumPy data type of the entries
+		"""
+		self.shape = shape
+		self.no_edge = no_edge
+		self.dtype = dtype
+		self.entries = {}
+
+	def __getitem__(self, key):
+		"""Return the entry at key = (i, j)."""
+		return self.entries.get(key, self.no_edge)
+
+	def __setitem__(self, key, value):
+		"""Set the entry at key = (i, j), removing it from storage if it is no_edge."""
+		if value == self.no_edge:
+			self.entries.pop(key, None)
+		else:
+			self.entries[key] = self.dtype.type(value)
+
+	def keys(self):
+		"""Return the (i, j) positions of the stored entries."""
+		return self.entries.keys()
+
+	def copy(self):
+		"""Return a copy of this matrix."""
+		c = DictOfKeysMatrix(self.shape, self.no_edge, self.dtype)
+		c.entries = self.entries.copy()
+		return c
+
+	def toarray(self):
+		"""Return this matrix as a dense NumPy array."""
+		array = np.full(self.shape, self.no_edge, dtype=self.dtype)
+		for (i, j), value in self.entries.items():
+			array[i, j] = value
+		return array
+
+	def __str__(self):
+		"""Return the stored entries in row-major order."""
+		return str({key: self.entries[key] for key in sorted(self.entries)})
+
+
 class AdjacencyMatrixGraph:
 
-	def __init__(self, card_V, directed=True, weighted=False):
+	def __init__(self, card_V, directed=True, weighted=False, dtype=None, sparse=False):
 		"""Initialize a graph implemented by an adjacency matrix. 
 
 		Arguments:
 		card_V -- number of vertices in this graph
 		directed -- boolean whether or not graph is directed
 		weighted -- boolean whether or not edges are weighted
+		dtype -- NumPy data type of the matrix, default float64 for weighted graphs
+		and int for unweighted graphs. A weighted graph may use float32, or an integer
+		type such as uint16 for whole minutes, in which case the largest value of
+		the type stands for no edge instead of infinity.
+		sparse -- boolean whether to store only the edges, in a DictOfKeysMatrix,
+		so that memory grows with the number of edges rather than card_V squared
 		"""
 		self.directed = directed
-		if weighted:
+		if dtype is None:
+			dtype = np.float64 if weighted else int
+		self.dtype = np.dtype(dtype)
+		if not weighted:
+			# For unweighted graphs, adj_matrix will default to 0 for no edge.
+			self.no_edge = 0
+		elif np.issubdtype(self.dtype, np.integer):
+			# Integer types have no infinity, so use the largest value for no edge.
+			self.no_edge = np.iinfo(self.dtype).max
+		else:
 			# For weighted graphs, adj_matrix will default to infinity for no edge.
-			self.adj_matrix = np.ndarray((card_V, card_V))
 			self.no_edge = float('inf')
-			self.adj_matrix.fill(self.no_edge)
+		self.sparse = sparse
+		if sparse:
+			self.adj_matrix = DictOfKeysMatrix((card_V, card_V), self.no_edge, self.dtype)
 		else:
-			# For unweighted graphs, adj_matrix will default to 0 for no edge.
-			self.adj_matrix = np.zeros(shape=(card_V, card_V), dtype=int)
-			self.no_edge = 0
+			self.adj_matrix = np.full((card_V, card_V), self.no_edge, dtype=self.dtype)
 		self.card_V = card_V
 		self.weighted = weighted
 		self.card_E = 0
@@ -66,9 +130,27 @@ class AdjacencyMatrixGraph:
 		return self.card_E
 
 	def get_adj_matrix(self):
-		"""Return the adjacency matrix for this graph."""
+		"""Return the adjacency matrix for this graph, a DictOfKeysMatrix if it is sparse."""
 		return self.adj_matrix
 
+	def get_no_edge(self):
+		"""Return the matrix entry that stands for no edge."""
+		return self.no_edge
+
+	def get_float_adj_matrix(self):
+		"""Return the adjacency matrix of this weighted graph as a dense float64
+		array with infinity for no edge. An integer matrix is converted, so that
+		sums of weights neither overflow nor treat its no-edge value as a weight."""
+		if self.sparse:
+			matrix = self.adj_matrix.toarray()
+		else:
+			matrix = self.adj_matrix
+		if not np.issubdtype(self.dtype, np.integer):
+			return matrix.astype(np.float64)
+		W = matrix.astype(np.float64)
+		W[matrix == self.no_edge] = float('inf')
+		return W
+
 	def is_directed(self):
 		"""Return a boolean indicating whether this graph is directed."""
 		return self.directed
@@ -88,6 +170,11 @@ class AdjacencyMatrixGraph:
 		if self.weighted:
 			if weight is None:
 				raise RuntimeError("Inserting unweighted edge (" + str(u) + ", " + str(v) + ") in weighted graph.")
+			# An integer matrix can only hold whole weights below its no-edge value.
+			if np.issubdtype(self.dtype, np.integer) and \
+					not (weight == int(weight) and np.iinfo(self.dtype).min <= weight < self.no_edge):
+				raise RuntimeError("Weight " + str(weight) + " of edge (" + str(u) + ", " + str(v)
+								   + ") does not fit in " + str(self.dtype) + ".")
 		else:  # unweighted
 			if weight is not None:
 				raise RuntimeError("Inserting weighted edge (" + str(u) + ", " + str(v) + ") in unweighted graph.")
@@ -124,13 +211,17 @@ class AdjacencyMatrixGraph:
 
 	def copy(self):
 		"""Return a copy of this graph."""
-		c = AdjacencyMatrixGraph(self.card_V, self.directed, self.weighted)
+		c = AdjacencyMatrixGraph(0, self.directed, self.weighted, self.dtype, self.sparse)
+		c.card_V = self.card_V
 		c.adj_matrix = self.adj_matrix.copy()  # deep copy
 		c.card_E = self.card_E
 		return c
 
 	def get_edge_list(self):
 		"""Return a Python list containing the edges of this graph."""
+		if self.sparse:  # only the stored entries need to be checked
+			return [(u, v) for u, v in sorted(self.adj_matrix.keys()) if self.directed or u < v]
+
 		edge_list = []
 		for u in range(self.card_V):
 			if self.directed:
@@ -218,3 +309,18 @@ if __name__ == "__main__":
 
 	# Test get_edge_list.
 	print(graph3.get_edge_list())
+
+	# Sparse storage and a uint16 matrix hold the same edges.
+	for dtype, sparse in [(np.float64, True), (np.uint16, False), (np.uint16, True)]:
+		graph4 = AdjacencyMatrixGraph(10, True, True, dtype, sparse)
+		for i in range(0, len(array1) - 1, 2):
+			try:
+				graph4.insert_edge(array1[i], array1[i + 1], array1[i])
+			except RuntimeError as e:
+				pass
+		print(graph4.get_edge_list() == graph3.get_edge_list())
+		print(np.array_equal(graph4.get_float_adj_matrix(), graph3.get_float_adj_matrix()))
+	try:  # a weight that does not fit in uint16
+		graph4.insert_edge(0, 0, 2.5)
+	except RuntimeError as e:
+		print(e)
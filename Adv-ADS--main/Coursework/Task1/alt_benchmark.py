@@ -0,0 +1,54 @@
+import time
+from dijkstra import shortest_path
+from landmarks import Landmarks
+from generate_random_graph import generate_random_graph
+from benchmark_networks import load_underground_network, random_journeys
+
+
+# Function to measure landmark preprocessing and the average time of ALT queries
+# against plain point-to-point Dijkstra queries over the same journeys
+def compare_alt(network, journeys, num_landmarks):
+    start_time = time.time()
+    landmarks = Landmarks.build(network, num_landmarks)
+    preprocessing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+
+    dijkstra_time = 0
+    alt_time = 0
+    for start, destination in journeys:
+        start_time = time.time()
+        duration, path = shortest_path(network, start, destination)
+        dijkstra_time += (time.time() - start_time) * 1000
+
+        start_time = time.time()
+        alt_duration, alt_path = landmarks.shortest_path(network, start, destination)
+        alt_time += (time.time() - start_time) * 1000
+
+        # Both searches must agree on the journey duration
+        if duration != alt_duration:
+            raise RuntimeError(f"Mismatch between Station {start} and Station {destination}: "
+                               f"{duration} != {alt_duration}")
+
+    return preprocessing_time, dijkstra_time / len(journeys), alt_time / len(journeys)
+
+
+def print_comparison(name, network, preprocessing_time, dijkstra_avg, alt_avg):
+    print(f"{name:>22} {network.get_card_V():>9} {preprocessing_time:>19.1f} {dijkstra_avg:>14.3f}"
+          f" {alt_avg:>9.3f} {dijkstra_avg / alt_avg:>7.2f}x")
+
+
+if __name__ == "__main__":
+    trials = 200
+    num_landmarks = 8
+    print(f"{'Network':>22} {'Stations':>9} {'Preprocessing (ms)':>19} {'Dijkstra (ms)':>14}"
+          f" {'ALT (ms)':>9} {'Speedup':>8}")
+
+    # London Underground network
+    network, stations = load_underground_network()
+    journeys = random_journeys(network.get_card_V(), trials)
+    print_comparison("London Underground", network, *compare_alt(network, journeys, num_landmarks))
+
+    # Synthetic networks with about 3 connections per station
+    for network_size in [500, 1000, 2000, 4000]:
+        network = generate_random_graph(network_size, 3 / network_size, True, False, True, 1, 10)
+        journeys = random_journeys(network_size, trials)
+        print_comparison(f"Random ({network_size})", network, *compare_alt(network, journeys, num_landmarks))
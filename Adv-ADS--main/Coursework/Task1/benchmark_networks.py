@@ -0,0 +1,51 @@
+import os
+import random
+import pandas as pd
+from adjacency_list_graph import AdjacencyListGraph
+
+# The Underground spreadsheet ships with Task 3 and Task 4
+UNDERGROUND_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Task3',
+                                'London Underground data.xlsx')
+
+
+# Function to generate a connected random network the same way as Task 1B:
+# a spanning path through all stations plus extra random edges
+def generate_network(network_size, edge_probability, min_weight=1, max_weight=10):
+    network = AdjacencyListGraph(network_size, directed=False, weighted=True)
+
+    # Ensure connectivity by creating a spanning tree
+    for i in range(network_size - 1):
+        network.insert_edge(i, i + 1, weight=random.randint(min_weight, max_weight))
+
+    # Add extra random edges based on edge probability
+    for u in range(network_size):
+        for v in range(u + 2, network_size):
+            if random.random() <= edge_probability:
+                network.insert_edge(u, v, weight=random.randint(min_weight, max_weight))
+
+    return network
+
+
+# Function to pick random (start, destination) pairs with start != destination
+def random_journeys(network_size, trials):
+    journeys = []
+    for run in range(trials):
+        start = random.randint(0, network_size - 1)
+        destination = start
+        while start == destination:
+            destination = random.randint(0, network_size - 1)
+        journeys.append((start, destination))
+    return journeys
+
+
+# Function to load the London Underground network the same way as Task 3A
+def load_underground_network(file=UNDERGROUND_FILE):
+    underground_data = pd.read_excel(file, sheet_name='Sheet1')
+    underground_data.columns = ["Line", "Start", "Destination", "Duration"]
+    underground_data = underground_data.dropna(subset=["Duration", "Start", "Destination"])
+
+    codes, stations = pd.factorize(pd.concat([underground_data["Start"], underground_data["Destination"]]))
+    network = AdjacencyListGraph.from_edges(len(stations), codes[:len(underground_data)], codes[len(underground_data):],
+                                            underground_data["Duration"].to_numpy(), directed=False, lightest=True)
+
+    return network, stations.to_numpy()
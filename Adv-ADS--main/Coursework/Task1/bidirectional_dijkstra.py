@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# bidirectional_dijkstra.py
+
+from single_source_shortest_paths import initialize_single_source, relax
+from min_heap_priority_queue import MinHeapPriorityQueue
+from print_path import print_path
+
+
+class SearchFrontier:
+
+	def __init__(self, G, source):
+		"""Initialize one direction of a bidirectional search.
+
+		Arguments:
+		G -- the graph searched in this direction
+		source -- index of the vertex this direction starts from
+		"""
+		self.G = G
+		self.d, self.pi = initialize_single_source(G, source)
+		self.settled = [False] * G.get_card_V()
+		# Vertices are inserted into the priority queue only when first reached.
+		self.queue = MinHeapPriorityQueue(lambda u: self.d[u])
+		self.queue.insert(source)
+
+	def get_size(self):
+		"""Return the number of reached but unsettled vertices."""
+		return self.queue.get_size()
+
+	def min_distance(self):
+		"""Return the smallest distance among the unsettled vertices."""
+		return self.d[self.queue.minimum()]
+
+	def settle_next(self, other, best, meet):
+		"""Settle the closest unsettled vertex and relax its edges. Whenever a
+		relaxed vertex has also been reached by the other direction, the
+		shortest path seen through it is compared against the best so far.
+
+		Arguments:
+		other -- the SearchFrontier running in the opposite direction
+		best -- weight of the best path found so far
+		meet -- vertex where the best path so far joins the two directions
+
+		Returns:
+		best, meet -- updated best path weight and meeting vertex
+		"""
+		d = self.d
+		u = self.queue.extract_min()
+		self.settled[u] = True
+		for edge in self.G.get_adj_list(u):
+			v = edge.get_v()
+			if self.settled[v]:
+				continue
+			if d[v] == float('inf'):
+				relax(u, v, edge.get_weight(), d, self.pi, self.queue.insert)
+			else:
+				relax(u, v, edge.get_weight(), d, self.pi,
+						lambda v: self.queue.decrease_key(v, d[u] + edge.get_weight()))
+			if d[v] + other.d[v] < best:
+				best = d[v] + other.d[v]
+				meet = v
+		return best, meet
+
+
+def bidirectional_dijkstra(G, s, t, mapping_func=None, reverse_G=None):
+	"""Find a shortest path from s to t by running Dijkstra's algorithm forward
+	from s and backward from t, stopping once the two searches meet.
+
+	Arguments:
+	G -- a weighted graph
+	s -- index of source vertex
+	t -- index of destination vertex
+	mapping_func -- optional function to map vertex numbers on the path,
+	default is to leave them as vertex numbers
+	reverse_G -- for a directed graph, its transpose, which the backward search
+	runs on. Computed if omitted, so pass it in when making repeated queries.
+	An undirected graph is its own transpose.
+	Assumption:
+	All weights are nonnegative
+
+	Returns:
+	distance -- weight of a shortest path from s to t, infinity if there is none
+	path -- list of the vertices on the path from s to t, None if there is none
+	"""
+	if mapping_func is None:
+		mapping_func = lambda v: v
+	if reverse_G is None:
+		reverse_G = G.transpose() if G.is_directed() else G
+
+	if s == t:
+		return 0, [mapping_func(s)]
+
+	forward = SearchFrontier(G, s)
+	backward = SearchFrontier(reverse_G, t)
+	best = float('inf')
+	meet = None
+
+	while forward.get_size() > 0 and backward.get_size() > 0:
+		# No path through an unsettled vertex can beat the best path found so far.
+		if forward.min_distance() + backward.min_distance() >= best:
+			break
+		# Advance the direction with the smaller frontier.
+		if forward.get_size() <= backward.get_size():
+			best, meet = forward.settle_next(backward, best, meet)
+		else:
+			best, meet = backward.settle_next(forward, best, meet)
+
+	if meet is None:
+		return best, None
+
+	# Join the path from s to the meeting vertex with the path from there to t.
+	path = print_path(forward.pi, s, meet, mapping_func)
+	v = backward.pi[meet]
+	while v is not None:
+		path.append(mapping_func(v))
+		v = backward.pi[v]
+	return best, path
+
+
+# Testing
+if __name__ == "__main__":
+
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+	from dijkstra import dijkstra
+
+	# Textbook example.
+	vertices = ['s', 't', 'x', 'y', 'z']
+	edges = [('s', 't', 10), ('s', 'y', 5), ('t', 'x', 1), ('t', 'y', 2), ('x', 'z', 4),
+			('y', 't', 3), ('y', 'x', 9), ('y', 'z', 2), ('z', 's', 7), ('z', 'x', 6)]
+	graph1 = AdjacencyListGraph(len(vertices), True, True)
+	for edge in edges:
+		graph1.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]), edge[2])
+	d, pi = dijkstra(graph1, vertices.index('s'))
+	for v in vertices:
+		distance, path = bidirectional_dijkstra(graph1, vertices.index('s'), vertices.index(v),
+												lambda i: vertices[i])
+		print("s to " + v + ": " + str(distance) + " via " + " -> ".join(path))
+		print(distance == d[vertices.index(v)])
+	print()
+
+	# Larger undirected and directed examples, compared against dijkstra from every source.
+	card_V = 100
+	for directed in [False, True]:
+		graph2 = generate_random_graph(card_V, 0.04, True, directed, True, 0, 15)
+		reverse_graph2 = graph2.transpose() if directed else graph2
+		all_equal = True
+		for s in range(card_V):
+			dijkstra_d, dijkstra_pi = dijkstra(graph2, s)
+			for t in range(card_V):
+				distance, path = bidirectional_dijkstra(graph2, s, t, reverse_G=reverse_graph2)
+				if distance != dijkstra_d[t]:
+					print("Shortest-path distance mismatch from", s, "to", t)
+					all_equal = False
+				elif path is not None and len(path) > 1:
+					# The path must be made of edges whose weights add up to the distance.
+					weight = sum(graph2.find_edge(path[i], path[i + 1]).get_weight() for i in range(len(path) - 1))
+					if weight != distance:
+						print("Path weight mismatch from", s, "to", t)
+						all_equal = False
+		print("All " + ("directed" if directed else "undirected") + " shortest-path distances are "
+			  + ("not " if not all_equal else "") + "equal")
@@ -0,0 +1,50 @@
+import time
+from dijkstra import shortest_path
+from bidirectional_dijkstra import bidirectional_dijkstra
+from generate_random_graph import generate_random_graph
+from benchmark_networks import load_underground_network, random_journeys
+
+
+# Function to measure the average time of one-directional point-to-point queries
+# against bidirectional queries over the same journeys
+def compare_bidirectional(network, journeys):
+    forward_time = 0
+    bidirectional_time = 0
+
+    for start, destination in journeys:
+        start_time = time.time()
+        duration, path = shortest_path(network, start, destination)
+        forward_time += (time.time() - start_time) * 1000  # Convert to milliseconds
+
+        start_time = time.time()
+        bidirectional_duration, bidirectional_path = bidirectional_dijkstra(network, start, destination)
+        bidirectional_time += (time.time() - start_time) * 1000
+
+        # Both searches must agree on the journey duration
+        if duration != bidirectional_duration:
+            raise RuntimeError(f"Mismatch between Station {start} and Station {destination}: "
+                               f"{duration} != {bidirectional_duration}")
+
+    return forward_time / len(journeys), bidirectional_time / len(journeys)
+
+
+def print_comparison(name, network, forward_avg, bidirectional_avg):
+    print(f"{name:>22} {network.get_card_V():>9} {network.get_card_E():>8} {forward_avg:>14.3f}"
+          f" {bidirectional_avg:>19.3f} {forward_avg / bidirectional_avg:>7.2f}x")
+
+
+if __name__ == "__main__":
+    trials = 200
+    print(f"{'Network':>22} {'Stations':>9} {'Edges':>8} {'Dijkstra (ms)':>14}"
+          f" {'Bidirectional (ms)':>19} {'Speedup':>8}")
+
+    # London Underground network
+    network, stations = load_underground_network()
+    journeys = random_journeys(network.get_card_V(), trials)
+    print_comparison("London Underground", network, *compare_bidirectional(network, journeys))
+
+    # Synthetic networks with about 3 connections per station
+    for network_size in [500, 1000, 2000, 4000]:
+        network = generate_random_graph(network_size, 3 / network_size, True, False, True, 1, 10)
+        journeys = random_journeys(network_size, trials)
+        print_comparison(f"Random ({network_size})", network, *compare_bidirectional(network, journeys))
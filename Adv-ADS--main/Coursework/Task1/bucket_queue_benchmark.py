@@ -0,0 +1,46 @@
+import time
+from dijkstra import dijkstra
+from benchmark_networks import generate_network, load_underground_network, random_journeys
+
+
+# Function to measure the average time of full single-source runs with the
+# MinHeapPriorityQueue against the same runs with the bucket queue
+def compare_bucket_queue(network, journeys):
+    heap_time = 0
+    bucket_time = 0
+
+    for start, destination in journeys:
+        start_time = time.time()
+        distances, predecessors = dijkstra(network, start, priority_queue="heap")
+        heap_time += (time.time() - start_time) * 1000  # Convert to milliseconds
+
+        start_time = time.time()
+        bucket_distances, bucket_predecessors = dijkstra(network, start, priority_queue="bucket")
+        bucket_time += (time.time() - start_time) * 1000
+
+        # Both runs must agree on every journey duration
+        if distances != bucket_distances:
+            raise RuntimeError(f"Mismatch in journey durations from Station {start}")
+
+    return heap_time / len(journeys), bucket_time / len(journeys)
+
+
+def print_comparison(name, network, heap_avg, bucket_avg):
+    print(f"{name:>22} {network.get_card_V():>9} {network.get_card_E():>8} {heap_avg:>10.2f}"
+          f" {bucket_avg:>12.2f} {heap_avg / bucket_avg:>7.2f}x")
+
+
+if __name__ == "__main__":
+    trials = 20
+    print(f"{'Network':>22} {'Stations':>9} {'Edges':>8} {'Heap (ms)':>10} {'Bucket (ms)':>12} {'Speedup':>8}")
+
+    # London Underground network, whose durations are whole minutes
+    network, stations = load_underground_network()
+    journeys = random_journeys(network.get_card_V(), trials)
+    print_comparison("London Underground", network, *compare_bucket_queue(network, journeys))
+
+    # Task 1B-style networks with weights from randint(1, 10)
+    for network_size in range(250, 2250, 250):
+        network = generate_network(network_size, edge_probability=3 / network_size)
+        journeys = random_journeys(network_size, trials)
+        print_comparison(f"Random ({network_size})", network, *compare_bucket_queue(network, journeys))
@@ -0,0 +1,45 @@
+import time
+import random
+import numpy as np
+from adjacency_list_graph import AdjacencyListGraph
+
+
+# Function to draw random edges between stations, with repeats, like the rows of a timetable
+def random_rows(network_size, num_rows):
+    starts = np.random.randint(0, network_size - 1, num_rows)
+    ends = starts + np.random.randint(1, network_size - starts)
+    return starts, ends, np.random.randint(1, 11, num_rows)
+
+
+# Function to build a graph one validated insert_edge call at a time, skipping repeated edges
+def build_by_insertion(network_size, starts, ends, weights):
+    graph = AdjacencyListGraph(network_size, directed=False, weighted=True)
+    for start, end, weight in zip(starts.tolist(), ends.tolist(), weights.tolist()):
+        if not graph.has_edge(start, end):
+            graph.insert_edge(start, end, weight)
+    return graph
+
+
+def build_in_bulk(network_size, starts, ends, weights):
+    return AdjacencyListGraph.from_edges(network_size, starts, ends, weights, directed=False)
+
+
+def measure(build, *args):
+    start_time = time.time()
+    graph = build(*args)
+    return graph, (time.time() - start_time) * 1000  # Convert to milliseconds
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    np.random.seed(0)
+    print(f"{'Stations':>10} {'Rows':>9} {'Edges':>9} {'Insert (ms)':>12} {'Bulk (ms)':>10} {'Speedup':>8}")
+    for network_size in [1000, 10000, 100000]:
+        rows = network_size * 5
+        starts, ends, weights = random_rows(network_size, rows)
+        inserted, insert_time = measure(build_by_insertion, network_size, starts, ends, weights)
+        bulk, bulk_time = measure(build_in_bulk, network_size, starts, ends, weights)
+        if str(inserted) != str(bulk):
+            raise RuntimeError(f"Bulk-loaded graph differs for {network_size} stations")
+        print(f"{network_size:>10} {rows:>9} {bulk.get_card_E():>9} {insert_time:>12.1f} {bulk_time:>10.1f}"
+              f" {insert_time / bulk_time:>7.2f}x")
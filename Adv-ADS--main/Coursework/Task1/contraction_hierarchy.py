@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# contraction_hierarchy.py
+
+from min_heap_priority_queue import MinHeapPriorityQueue
+
+
+class ContractionHierarchy:
+
+	def __init__(self, G, settle_limit=50):
+		"""Preprocess an undirected, weighted graph into a contraction hierarchy.
+		Vertices are contracted one at a time in order of importance. Contracting
+		v removes it from the remaining graph, and for each pair of remaining
+		neighbors u, w whose only shortest path runs through v, a shortcut edge
+		(u, w) is added with the weight of that path.
+
+		Arguments:
+		G -- an undirected, weighted graph
+		settle_limit -- the most vertices a witness search settles before giving up
+		and adding the shortcut anyway. Lower limits preprocess faster but may add
+		unnecessary shortcuts; queries remain exact either way.
+		"""
+		if G.is_directed():
+			raise RuntimeError("Graph should be undirected.")
+
+		self.card_V = G.get_card_V()
+		self.settle_limit = settle_limit
+		# adj[u][v] is the weight of edge (u, v) among the vertices not yet contracted.
+		self.adj = [{} for u in range(self.card_V)]
+		for u in range(self.card_V):
+			for edge in G.get_adj_list(u):
+				v = edge.get_v()
+				self.adj[u][v] = min(edge.get_weight(), self.adj[u].get(v, float('inf')))
+		# middle[(u, w)] with u < w is the vertex a shortcut (u, w) bypasses.
+		self.middle = {}
+		self.num_shortcuts = 0
+		self.rank = [None] * self.card_V
+		self.up = self.contract()
+
+	def witness_distances(self, u, v, max_distance):
+		"""Run Dijkstra's algorithm from u over the remaining graph without v,
+		stopping beyond max_distance or after settle_limit vertices.
+		Return a dictionary of the distances found."""
+		dist = {u: 0}
+		queue = MinHeapPriorityQueue(lambda x: dist[x])
+		queue.insert(u)
+		settled = 0
+		while queue.get_size() > 0 and settled < self.settle_limit:
+			x = queue.extract_min()
+			if dist[x] > max_distance:
+				break
+			settled += 1
+			for y, weight in self.adj[x].items():
+				if y == v:
+					continue
+				if y not in dist:
+					dist[y] = dist[x] + weight
+					queue.insert(y)
+				elif dist[x] + weight < dist[y]:
+					dist[y] = dist[x] + weight
+					queue.decrease_key(y, dist[y])
+		return dist
+
+	def shortcuts_needed(self, v):
+		"""Return a list of the shortcuts (u, w, weight) that contracting v requires."""
+		neighbors = list(self.adj[v].items())
+		shortcuts = []
+		for i in range(len(neighbors) - 1):
+			u, u_weight = neighbors[i]
+			max_distance = u_weight + max(weight for w, weight in neighbors[i + 1:])
+			dist = self.witness_distances(u, v, max_distance)
+			for w, w_weight in neighbors[i + 1:]:
+				if dist.get(w, float('inf')) > u_weight + w_weight:
+					shortcuts.append((u, w, u_weight + w_weight))
+		return shortcuts
+
+	def contract(self):
+		"""Contract every vertex and return the upward graph, in which up[u] lists
+		(v, weight) for every original or shortcut edge to a higher-ranked v."""
+		# Importance is the edge difference plus the number of contracted neighbors,
+		# which spreads contraction evenly over the graph.
+		contracted_neighbors = [0] * self.card_V
+		priority = [len(self.shortcuts_needed(v)) - len(self.adj[v]) for v in range(self.card_V)]
+		queue = MinHeapPriorityQueue(lambda v: priority[v])
+		for v in range(self.card_V):
+			queue.insert(v)
+
+		# Edges to higher-ranked vertices, kept as the vertices are contracted.
+		up = [None] * self.card_V
+		next_rank = 0
+		while queue.get_size() > 0:
+			v = queue.extract_min()
+			shortcuts = self.shortcuts_needed(v)
+
+			# Priorities are updated lazily, so recompute before contracting.
+			new_priority = len(shortcuts) - len(self.adj[v]) + contracted_neighbors[v]
+			if queue.get_size() > 0 and new_priority > priority[queue.minimum()]:
+				priority[v] = new_priority
+				queue.insert(v)
+				continue
+
+			self.rank[v] = next_rank
+			next_rank += 1
+			up[v] = list(self.adj[v].items())
+			for u, w, weight in shortcuts:
+				if weight < self.adj[u].get(w, float('inf')):
+					self.adj[u][w] = weight
+					self.adj[w][u] = weight
+					self.middle[(min(u, w), max(u, w))] = v
+					self.num_shortcuts += 1
+			for u in self.adj[v]:
+				del self.adj[u][v]
+				contracted_neighbors[u] += 1
+			self.adj[v] = {}
+
+		return up
+
+	def get_rank(self, v):
+		"""Return the position of v in the contraction order."""
+		return self.rank[v]
+
+	def get_num_shortcuts(self):
+		"""Return the number of shortcut edges added during preprocessing."""
+		return self.num_shortcuts
+
+	def upward_search(self, dist, pi, queue, other_dist, best, meet):
+		"""Settle the closest vertex of one direction of the query and relax its
+		upward edges. Return the updated best path weight and meeting vertex."""
+		u = queue.extract_min()
+		for v, weight in self.up[u]:
+			if v not in dist:
+				dist[v] = dist[u] + weight
+				pi[v] = u
+				queue.insert(v)
+			elif dist[u] + weight < dist[v]:
+				dist[v] = dist[u] + weight
+				pi[v] = u
+				queue.decrease_key(v, dist[v])
+		if u in other_dist and dist[u] + other_dist[u] < best:
+			best = dist[u] + other_dist[u]
+			meet = u
+		return best, meet
+
+	def unpack(self, u, w, path, mapping_func):
+		"""Append the original vertices of edge (u, w), not including u, to path."""
+		stack = [(u, w)]
+		while len(stack) > 0:
+			a, b = stack.pop()
+			v = self.middle.get((min(a, b), max(a, b)))
+			if v is None:  # an original edge
+				path.append(mapping_func(b))
+			else:  # replace the shortcut by the two edges it bypasses, first one on top
+				stack.append((v, b))
+				stack.append((a, v))
+
+	def shortest_path(self, s, t, mapping_func=None):
+		"""Find a shortest path from s to t with a bidirectional search that only
+		follows edges to higher-ranked vertices, then unpack the shortcuts on it.
+
+		Arguments:
+		s -- index of source vertex
+		t -- index of destination vertex
+		mapping_func -- optional function to map vertex numbers on the path,
+		default is to leave them as vertex numbers
+
+		Returns:
+		distance -- weight of a shortest path from s to t, infinity if there is none
+		path -- list of the vertices on the path from s to t, None if there is none
+		"""
+		if mapping_func is None:
+			mapping_func = lambda v: v
+
+		forward_dist, forward_pi = {s: 0}, {s: None}
+		backward_dist, backward_pi = {t: 0}, {t: None}
+		forward_queue = MinHeapPriorityQueue(lambda v: forward_dist[v])
+		backward_queue = MinHeapPriorityQueue(lambda v: backward_dist[v])
+		forward_queue.insert(s)
+		backward_queue.insert(t)
+		best = 0 if s == t else float('inf')
+		meet = s if s == t else None
+
+		# Each direction stops once its closest vertex is no closer than the best path.
+		forward_active = True
+		backward_active = True
+		while forward_active or backward_active:
+			if forward_active:
+				if forward_queue.get_size() == 0 or forward_dist[forward_queue.minimum()] >= best:
+					forward_active = False
+				else:
+					best, meet = self.upward_search(forward_dist, forward_pi, forward_queue,
+													backward_dist, best, meet)
+			if backward_active:
+				if backward_queue.get_size() == 0 or backward_dist[backward_queue.minimum()] >= best:
+					backward_active = False
+				else:
+					best, meet = self.upward_search(backward_dist, backward_pi, backward_queue,
+													forward_dist, best, meet)
+
+		if meet is None:
+			return best, None
+
+		# Walk back to s and to t from the meeting vertex, then unpack each edge.
+		up_path = [meet]
+		while forward_pi[up_path[-1]] is not None:
+			up_path.append(forward_pi[up_path[-1]])
+		up_path.reverse()
+		v = backward_pi[meet]
+		while v is not None:
+			up_path.append(v)
+			v = backward_pi[v]
+
+		path = [mapping_func(s)]
+		for i in range(len(up_path) - 1):
+			self.unpack(up_path[i], up_path[i + 1], path, mapping_func)
+		return best, path
+
+
+# Testing
+if __name__ == "__main__":
+
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+	from dijkstra import dijkstra
+
+	# Example from the MST chapter of the textbook, used here as a road map.
+	vertices = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']
+	edges = [('a', 'b', 4), ('a', 'h', 8), ('b', 'c', 8), ('b', 'h', 11), ('c', 'd', 7),
+			 ('c', 'f', 4), ('c', 'i', 2), ('d', 'e', 9), ('d', 'f', 14), ('e', 'f', 10),
+			 ('f', 'g', 2), ('g', 'h', 1), ('g', 'i', 6), ('h', 'i', 7)]
+	graph1 = AdjacencyListGraph(len(vertices), False, True)
+	for edge in edges:
+		graph1.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]), edge[2])
+	ch1 = ContractionHierarchy(graph1)
+	print("Contraction order:", sorted(vertices, key=lambda v: ch1.get_rank(vertices.index(v))))
+	print("Shortcuts:", ch1.get_num_shortcuts())
+	distance, path = ch1.shortest_path(vertices.index('a'), vertices.index('e'), lambda i: vertices[i])
+	print("a to e: " + str(distance) + " via " + " -> ".join(path))
+	print()
+
+	# Larger example, compared against dijkstra from every source.
+	card_V = 200
+	graph2 = generate_random_graph(card_V, 0.02, True, False, True, 0, 15)
+	ch2 = ContractionHierarchy(graph2)
+	all_equal = True
+	for s in range(card_V):
+		d, pi = dijkstra(graph2, s)
+		for t in range(card_V):
+			distance, path = ch2.shortest_path(s, t)
+			if distance != d[t]:
+				print("Shortest-path distance mismatch from", s, "to", t)
+				all_equal = False
+			elif path is not None:
+				# The unpacked path must use original edges whose weights add up to the distance.
+				weight = sum(graph2.find_edge(path[i], path[i + 1]).get_weight() for i in range(len(path) - 1))
+				if path[0] != s or path[-1] != t or weight != distance:
+					print("Unpacked path mismatch from", s, "to", t)
+					all_equal = False
+	print("All shortest-path distances are " + ("not " if not all_equal else "") + "equal")
@@ -0,0 +1,73 @@
+import time
+from dijkstra import dijkstra, shortest_path
+from contraction_hierarchy import ContractionHierarchy
+from generate_random_graph import generate_random_graph
+from benchmark_networks import load_underground_network, random_journeys
+
+
+# Function to measure contraction hierarchy preprocessing and the average time of
+# its queries against plain point-to-point Dijkstra queries over the same journeys
+def compare_contraction_hierarchy(network, journeys):
+    start_time = time.time()
+    hierarchy = ContractionHierarchy(network)
+    preprocessing_time = time.time() - start_time
+
+    dijkstra_time = 0
+    hierarchy_time = 0
+    for start, destination in journeys:
+        start_time = time.time()
+        duration, path = shortest_path(network, start, destination)
+        dijkstra_time += (time.time() - start_time) * 1000  # Convert to milliseconds
+
+        start_time = time.time()
+        hierarchy_duration, hierarchy_path = hierarchy.shortest_path(start, destination)
+        hierarchy_time += (time.time() - start_time) * 1000
+
+        # Both searches must agree on the journey duration and the unpacked path must be a real route
+        if duration != hierarchy_duration:
+            raise RuntimeError(f"Mismatch between Station {start} and Station {destination}: "
+                               f"{duration} != {hierarchy_duration}")
+        if hierarchy_path is not None:
+            route_duration = sum(network.find_edge(hierarchy_path[i], hierarchy_path[i + 1]).get_weight()
+                                 for i in range(len(hierarchy_path) - 1))
+            if route_duration != duration:
+                raise RuntimeError(f"Unpacked route between Station {start} and Station {destination}"
+                                   f" takes {route_duration} rather than {duration}")
+
+    return hierarchy, preprocessing_time, dijkstra_time / len(journeys), hierarchy_time / len(journeys)
+
+
+# Function to validate every journey from a few sources against full Dijkstra runs
+def validate_sources(network, hierarchy, sources):
+    for start in sources:
+        distances, predecessors = dijkstra(network, start)
+        for destination in range(network.get_card_V()):
+            if hierarchy.shortest_path(start, destination)[0] != distances[destination]:
+                raise RuntimeError(f"Mismatch between Station {start} and Station {destination}")
+
+
+def print_comparison(name, network, hierarchy, preprocessing_time, dijkstra_avg, hierarchy_avg):
+    print(f"{name:>22} {network.get_card_V():>9} {hierarchy.get_num_shortcuts():>10}"
+          f" {preprocessing_time:>18.2f} {dijkstra_avg:>14.3f} {hierarchy_avg:>9.3f}"
+          f" {dijkstra_avg / hierarchy_avg:>7.2f}x")
+
+
+if __name__ == "__main__":
+    trials = 200
+    print(f"{'Network':>22} {'Stations':>9} {'Shortcuts':>10} {'Preprocessing (s)':>18}"
+          f" {'Dijkstra (ms)':>14} {'CH (ms)':>9} {'Speedup':>8}")
+
+    # London Underground network
+    network, stations = load_underground_network()
+    journeys = random_journeys(network.get_card_V(), trials)
+    results = compare_contraction_hierarchy(network, journeys)
+    validate_sources(network, results[0], range(network.get_card_V()))
+    print_comparison("London Underground", network, *results)
+
+    # Synthetic networks with about 3 connections per station
+    for network_size in [500, 1000, 2000, 4000]:
+        network = generate_random_graph(network_size, 3 / network_size, True, False, True, 1, 10)
+        journeys = random_journeys(network_size, trials)
+        results = compare_contraction_hierarchy(network, journeys)
+        validate_sources(network, results[0], range(0, network_size, network_size // 10))
+        print_comparison(f"Random ({network_size})", network, *results)
@@ -0,0 +1,65 @@
+import time
+import random
+import tracemalloc
+from dijkstra import dijkstra
+from adjacency_list_graph import AdjacencyListGraph
+from csr_graph import CSRGraph
+
+
+# Function to draw the edges of a connected random network the same way as Task 1B:
+# a spanning path through all stations plus about extra_degree / 2 random edges per station
+def random_edges(network_size, extra_degree):
+    edges = {(i, i + 1) for i in range(network_size - 1)}
+    while len(edges) < (network_size - 1) + network_size * extra_degree // 2:
+        u, v = random.sample(range(network_size), 2)
+        edges.add((min(u, v), max(u, v)))
+    return [(u, v, random.randint(1, 10)) for u, v in edges]
+
+
+# Function to build a graph and report the memory it holds in bytes per edge
+def measure_build(build, edges):
+    tracemalloc.start()
+    graph = build(edges)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return graph, memory / len(edges)
+
+
+def build_adjacency_list_graph(network_size):
+    def build(edges):
+        graph = AdjacencyListGraph(network_size, directed=False, weighted=True)
+        for u, v, weight in edges:
+            graph.insert_edge(u, v, weight)
+        return graph
+    return build
+
+
+def build_csr_graph(network_size):
+    def build(edges):
+        sources, targets, weights = zip(*edges)
+        return CSRGraph.from_edges(network_size, sources, targets, weights, directed=False)
+    return build
+
+
+# Function to measure the average time of full single-source runs on a graph, with the
+# indexed heap so that the time spent walking the edges is not hidden by the queue
+def measure_dijkstra(graph, sources):
+    start_time = time.time()
+    for start in sources:
+        dijkstra(graph, start, priority_queue="indexed")
+    return (time.time() - start_time) * 1000 / len(sources)  # Convert to milliseconds
+
+
+if __name__ == "__main__":
+    trials = 5
+    print(f"{'Stations':>10} {'Edges':>8} {'List (B/edge)':>14} {'CSR (B/edge)':>13}"
+          f" {'List (ms)':>10} {'CSR (ms)':>9}")
+    for network_size in [1000, 5000, 20000]:
+        edges = random_edges(network_size, extra_degree=3)
+        sources = random.sample(range(network_size), trials)
+        list_graph, list_memory = measure_build(build_adjacency_list_graph(network_size), edges)
+        csr_graph, csr_memory = measure_build(build_csr_graph(network_size), edges)
+        list_time = measure_dijkstra(list_graph, sources)
+        csr_time = measure_dijkstra(csr_graph, sources)
+        print(f"{network_size:>10} {len(edges):>8} {list_memory:>14.1f} {csr_memory:>13.1f}"
+              f" {list_time:>10.2f} {csr_time:>9.2f}")
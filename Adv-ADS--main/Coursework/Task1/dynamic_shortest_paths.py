@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# dynamic_shortest_paths.py
+
+from dijkstra import lazy_dijkstra
+from min_heap_priority_queue import MinHeapPriorityQueue
+from print_path import print_path
+
+
+class DynamicShortestPaths:
+
+	def __init__(self, G, s):
+		"""Compute a shortest-path tree from s and keep it up to date as edges
+		of G are inserted, deleted or reweighted through this object. Each
+		update repairs only the vertices whose distance it changes, in the
+		style of Ramalingam and Reps, rather than rerunning Dijkstra's algorithm.
+
+		Arguments:
+		G -- a weighted AdjacencyListGraph with no negative-weight edges,
+		changed only through this object while it is in use
+		s -- index of source vertex
+		"""
+		self.G = G
+		self.s = s
+		self.d, self.pi = lazy_dijkstra(G, s, priority_queue="heap")
+
+		# children[u] is the set of vertices whose predecessor is u.
+		self.children = [set() for u in range(G.get_card_V())]
+		for v, u in enumerate(self.pi):
+			if u is not None:
+				self.children[u].add(v)
+
+		# A directed graph also needs the edges entering each vertex, which
+		# for an undirected graph are just its adjacency list.
+		self.in_edges = None
+		if G.is_directed():
+			self.in_edges = [{} for v in range(G.get_card_V())]
+			for u in range(G.get_card_V()):
+				for edge in G.get_adj_list(u):
+					self.in_edges[edge.get_v()][u] = edge.get_weight()
+
+	def get_distances(self):
+		"""Return the list of distances from the source."""
+		return self.d
+
+	def get_predecessors(self):
+		"""Return the list of predecessors in the shortest-path tree."""
+		return self.pi
+
+	def shortest_path(self, t, mapping_func=None):
+		"""Return the weight of a shortest path from the source to t and the path
+		itself, None if there is none, as in dijkstra.shortest_path."""
+		if mapping_func is None:
+			mapping_func = lambda v: v
+		if self.d[t] == float('inf'):
+			return self.d[t], None
+		return self.d[t], print_path(self.pi, self.s, t, mapping_func)
+
+	def entering(self, v):
+		"""Return an iterator of (u, weight) for the edges (u, v) entering v."""
+		if self.in_edges is not None:
+			return iter(self.in_edges[v].items())
+		return ((edge.get_v(), edge.get_weight()) for edge in self.G.get_adj_list(v))
+
+	def set_predecessor(self, v, u):
+		"""Make u the predecessor of v, updating the tree."""
+		if self.pi[v] is not None:
+			self.children[self.pi[v]].discard(v)
+		self.pi[v] = u
+		if u is not None:
+			self.children[u].add(v)
+
+	def insert_edge(self, u, v, weight):
+		"""Insert edge (u, v) into the graph and repair the shortest paths.
+		Returns the set of vertices whose distance changed."""
+		self.G.insert_edge(u, v, weight)
+		if self.in_edges is not None:
+			self.in_edges[v][u] = weight
+		changed = self.decrease(u, v, weight)
+		if not self.G.is_directed():
+			changed |= self.decrease(v, u, weight)
+		return changed
+
+	def delete_edge(self, u, v):
+		"""Delete edge (u, v) from the graph, both directions if it is undirected,
+		and repair the shortest paths. Returns the set of vertices whose
+		distance changed."""
+		if not self.G.has_edge(u, v):
+			raise RuntimeError("No edge (" + str(u) + ", " + str(v) + ") to delete.")
+		self.G.delete_edge(u, v)
+		if self.in_edges is not None:
+			del self.in_edges[v][u]
+		changed = self.increase(u, v)
+		if not self.G.is_directed():
+			changed |= self.increase(v, u)
+		return changed
+
+	def update_weight(self, u, v, weight):
+		"""Change the weight of edge (u, v), both directions if the graph is
+		undirected, and repair the shortest paths. Returns the set of vertices
+		whose distance changed."""
+		edge = self.G.find_edge(u, v)
+		if edge is None:
+			raise RuntimeError("No edge (" + str(u) + ", " + str(v) + ") to update.")
+		old_weight = edge.get_weight()
+		edge.set_weight(weight)
+		if self.in_edges is not None:
+			self.in_edges[v][u] = weight
+		else:
+			self.G.find_edge(v, u).set_weight(weight)
+
+		if weight < old_weight:
+			changed = self.decrease(u, v, weight)
+			if not self.G.is_directed():
+				changed |= self.decrease(v, u, weight)
+		else:
+			changed = self.increase(u, v)
+			if not self.G.is_directed():
+				changed |= self.increase(v, u)
+		return changed
+
+	def decrease(self, u, v, weight):
+		"""Repair the shortest paths after edge (u, v) was inserted or made
+		lighter. Only vertices whose distance drops are visited."""
+		changed = set()
+		if self.d[u] + weight >= self.d[v]:
+			return changed
+		self.d[v] = self.d[u] + weight
+		self.set_predecessor(v, u)
+
+		# Dijkstra's algorithm from v, where a vertex enters the queue only if its distance drops.
+		queue = MinHeapPriorityQueue(lambda x: self.d[x])
+		queue.insert(v)
+		queued = {v}
+		while queue.get_size() > 0:
+			x = queue.extract_min()
+			queued.discard(x)
+			changed.add(x)
+			for edge in self.G.get_adj_list(x):
+				y = edge.get_v()
+				if self.d[x] + edge.get_weight() < self.d[y]:
+					self.d[y] = self.d[x] + edge.get_weight()
+					self.set_predecessor(y, x)
+					if y in queued:
+						queue.decrease_key(y, self.d[y])
+					else:
+						queue.insert(y)
+						queued.add(y)
+		return changed
+
+	def increase(self, u, v):
+		"""Repair the shortest paths after edge (u, v) was deleted or made
+		heavier. Nothing changes unless (u, v) is in the shortest-path tree.
+		Returns the set of vertices whose distance changed."""
+		if self.pi[v] != u:
+			return set()
+
+		# Find the affected vertices: those in the subtree of v with no other
+		# shortest path. Candidates are examined in order of distance, and one
+		# with an equally short path through a settled vertex is rehung there,
+		# keeping its whole subtree.
+		affected = set()
+		candidates = MinHeapPriorityQueue(lambda x: self.d[x])
+		candidates.insert(v)
+		pending = {v}
+		while candidates.get_size() > 0:
+			x = candidates.extract_min()
+			pending.discard(x)
+			alternative = None
+			for y, weight in self.entering(x):
+				# A positive weight means d[y] < d[x], so y is already settled.
+				if weight > 0 and y not in affected and y not in pending \
+						and self.d[y] + weight == self.d[x]:
+					alternative = y
+					break
+			if alternative is not None:
+				self.set_predecessor(x, alternative)
+			else:
+				affected.add(x)
+				for child in self.children[x]:
+					candidates.insert(child)
+					pending.add(child)
+
+		# Forget the distances of the affected vertices, then give each its best
+		# distance through an unaffected vertex.
+		old_d = {x: self.d[x] for x in affected}
+		for x in affected:
+			self.d[x] = float('inf')
+			self.set_predecessor(x, None)
+		queue = MinHeapPriorityQueue(lambda x: self.d[x])
+		for x in affected:
+			for y, weight in self.entering(x):
+				if y not in affected and self.d[y] + weight < self.d[x]:
+					self.d[x] = self.d[y] + weight
+					self.set_predecessor(x, y)
+			if self.d[x] < float('inf'):
+				queue.insert(x)
+
+		# Dijkstra's algorithm among the affected vertices finishes the repair.
+		queued = set(x for x in affected if self.d[x] < float('inf'))
+		while queue.get_size() > 0:
+			x = queue.extract_min()
+			queued.discard(x)
+			for edge in self.G.get_adj_list(x):
+				y = edge.get_v()
+				if self.d[x] + edge.get_weight() < self.d[y]:
+					self.d[y] = self.d[x] + edge.get_weight()
+					self.set_predecessor(y, x)
+					if y in queued:
+						queue.decrease_key(y, self.d[y])
+					else:
+						queue.insert(y)
+						queued.add(y)
+
+		# An affected vertex may be repaired to its old distance, for instance
+		# through a zero-weight edge, so report only those that really changed.
+		return set(x for x in affected if self.d[x] != old_d[x])
+
+
+# Testing
+if __name__ == "__main__":
+
+	import random
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+
+	# After every kind of update, the distances should match a fresh run of Dijkstra's algorithm.
+	random.seed(0)
+	for directed in [True, False]:
+		card_V = 60
+		graph1 = generate_random_graph(card_V, 0.08, True, directed, True, 0, 10)
+		paths = DynamicShortestPaths(graph1, 0)
+		all_equal = True
+		for update in range(300):
+			u, v = random.sample(range(card_V), 2)
+			if graph1.has_edge(u, v):
+				if random.random() < 0.5:
+					paths.delete_edge(u, v)
+				else:
+					paths.update_weight(u, v, random.randint(0, 10))
+			else:
+				paths.insert_edge(u, v, random.randint(0, 10))
+			d, pi = lazy_dijkstra(graph1, 0, priority_queue="heap")
+			if d != paths.get_distances():
+				print("Distances mismatch after update", update)
+				all_equal = False
+			# Each vertex's predecessor should lie on a shortest path to it.
+			for x in range(card_V):
+				u = paths.get_predecessors()[x]
+				if u is not None and paths.get_distances()[u] + graph1.find_edge(u, x).get_weight() != d[x]:
+					print("Predecessor of", x, "is not on a shortest path after update", update)
+					all_equal = False
+		print(("Directed" if directed else "Undirected") + " distances are "
+			  + ("not " if not all_equal else "") + "all equal")
+
+	# Closing a section reports the stations whose journey time changed.
+	graph2 = generate_random_graph(10, 0.3, True, False, True, 1, 10)
+	paths = DynamicShortestPaths(graph2, 0)
+	u = 0
+	v = next(graph2.get_adj_list(u)).get_v()
+	print(paths.shortest_path(v))
+	print(sorted(paths.delete_edge(u, v)))
+	print(paths.shortest_path(v))
+	try:
+		paths.delete_edge(u, v)
+	except RuntimeError as e:
+		print(e)
+
+	# An increase with an alternative path of equal length changes no distances.
+	graph3 = AdjacencyListGraph(4, True, True)
+	graph3.insert_edge(0, 1, 1)
+	graph3.insert_edge(0, 2, 1)
+	graph3.insert_edge(2, 1, 0)
+	graph3.insert_edge(1, 3, 2)
+	paths = DynamicShortestPaths(graph3, 0)
+	print(paths.get_predecessors())
+	print(sorted(paths.update_weight(0, 1, 5)))
+	print(paths.get_distances(), paths.get_predecessors())
+	print(sorted(paths.delete_edge(2, 1)))
+	print(paths.get_distances())
@@ -0,0 +1,51 @@
+import time
+import random
+from dijkstra import lazy_dijkstra
+from dynamic_shortest_paths import DynamicShortestPaths
+from benchmark_networks import generate_network, load_underground_network
+
+
+# Function to pick random sections (u, v) of a network to close, each one on the
+# shortest-path tree of the source so that closing it forces a repair
+def random_closures(paths, network_size, trials):
+    predecessors = paths.get_predecessors()
+    tree_sections = [(predecessors[v], v) for v in range(network_size) if predecessors[v] is not None]
+    return random.sample(tree_sections, min(trials, len(tree_sections)))
+
+
+# Function to close and reopen each section, timing the repairs of the dynamic
+# shortest paths against rerunning Dijkstra's algorithm after every change
+def measure_closures(network, source, trials):
+    paths = DynamicShortestPaths(network, source)
+    closures = random_closures(paths, network.get_card_V(), trials)
+    dynamic_time = 0
+    full_time = 0
+    repaired = 0
+    for u, v in closures:
+        weight = network.find_edge(u, v).get_weight()
+        for update in [lambda: paths.delete_edge(u, v), lambda: paths.insert_edge(u, v, weight)]:
+            start_time = time.time()
+            repaired += len(update())
+            dynamic_time += time.time() - start_time
+
+            start_time = time.time()
+            d, pi = lazy_dijkstra(network, source, priority_queue="heap")
+            full_time += time.time() - start_time
+            if d != paths.get_distances():
+                raise RuntimeError(f"Repaired distances differ after changing section ({u}, {v})")
+    updates = 2 * len(closures)
+    # Convert to milliseconds per update
+    return repaired / updates, dynamic_time * 1000 / updates, full_time * 1000 / updates
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    trials = 50
+    print(f"{'Network':>12} {'Stations':>9} {'Repaired':>9} {'Dynamic (ms)':>13} {'Full (ms)':>10} {'Speedup':>8}")
+    networks = [(str(network_size), generate_network(network_size, 3 / network_size))
+                for network_size in [1000, 2000, 5000]]
+    networks.append(("Underground", load_underground_network()[0]))
+    for name, network in networks:
+        repaired, dynamic_time, full_time = measure_closures(network, 0, trials)
+        print(f"{name:>12} {network.get_card_V():>9} {repaired:>9.1f} {dynamic_time:>13.3f} {full_time:>10.2f}"
+              f" {full_time / dynamic_time:>7.1f}x")
@@ -52,9 +52,8 @@ def generate_random_graph(card_V, edge_probability, by_adjacency_lists=True,
     Returns:
         A graph
         """
-    constructor = AdjacencyListGraph if by_adjacency_lists else AdjacencyMatrixGraph
-    G = constructor(card_V, directed, weighted)
-
+    # Draw the edges first, then build the graph from them.
+    sources, targets, weights = [], [], []
     for u in range(card_V):
         if directed:
             min_v = 0
@@ -63,12 +62,18 @@ def generate_random_graph(card_V, edge_probability, by_adjacency_lists=True,
 
         for v in range(min_v, card_V):
             if random() <= edge_probability:  # add edge (u, v)
+                sources.append(u)
+                targets.append(v)
                 if weighted:
-                    weight = randint(min_weight, max_weight)  # random weight within range
-                else:
-                    weight = None
-                G.insert_edge(u, v, weight)  # guaranteed that edge (u, v) is not already present
+                    weights.append(randint(min_weight, max_weight))  # random weight within range
+
+    if by_adjacency_lists:
+        # Edges are guaranteed to be distinct, so they can be loaded in one pass.
+        return AdjacencyListGraph.from_edges(card_V, sources, targets, weights if weighted else None, directed)
 
+    G = AdjacencyMatrixGraph(card_V, directed, weighted)
+    for i in range(len(sources)):
+        G.insert_edge(sources[i], targets[i], weights[i] if weighted else None)
     return G
 
 
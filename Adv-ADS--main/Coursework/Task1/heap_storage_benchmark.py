@@ -0,0 +1,60 @@
+import time
+import random
+from min_heap_priority_queue import MinHeapPriorityQueue
+
+
+# The queue as it used to be: extract_top only lowered the heap size, leaving the extracted
+# objects in the array, and insert shifted them all along with array.insert
+class GrowingMinHeapPriorityQueue(MinHeapPriorityQueue):
+
+    def extract_top(self):
+        top = self.top_of_heap()
+        last_obj = self.heap.get_array()[self.heap.get_heap_size() - 1]
+        self.heap.get_array()[0] = last_obj
+        self.dict[last_obj] = 0
+        del self.dict[top]
+        self.heap.set_heap_size(self.heap.get_heap_size() - 1)
+        self.heap.heapify(0)
+        return top
+
+    def insert(self, x):
+        self.heap.set_heap_size(self.heap.get_heap_size() + 1)
+        k = self.get_key(x)
+        self.heap.get_array().insert(self.heap.get_heap_size() - 1, x)
+        self.dict[x] = self.heap.get_heap_size() - 1
+        self.update_key(x, k)
+
+
+# Function to run a long-lived queue through rounds of inserts followed by as many
+# extractions, so that its size stays around queue_size while objects keep passing through
+def interleaved_workload(queue, keys, rounds, queue_size, batch):
+    next_object = 0
+    for i in range(queue_size):
+        keys.append(random.random())
+        queue.insert(next_object)
+        next_object += 1
+    start_time = time.time()
+    for round in range(rounds):
+        for i in range(batch):
+            keys.append(random.random())
+            queue.insert(next_object)
+            next_object += 1
+        for i in range(batch):
+            queue.extract_min()
+    elapsed = (time.time() - start_time) * 1e6 / (2 * rounds * batch)  # Convert to microseconds per operation
+    return elapsed, len(queue.get_heap().get_array())
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    queue_size = 1000
+    batch = 100
+    print(f"{'Operations':>11} {'Old (us/op)':>12} {'Old array':>10} {'New (us/op)':>12} {'New array':>10}")
+    for rounds in [10, 100, 1000, 4000]:
+        results = []
+        for queue_class in [GrowingMinHeapPriorityQueue, MinHeapPriorityQueue]:
+            keys = []
+            queue = queue_class(lambda x: keys[x])
+            results.append(interleaved_workload(queue, keys, rounds, queue_size, batch))
+        (old_time, old_length), (new_time, new_length) = results
+        print(f"{2 * rounds * batch:>11} {old_time:>12.2f} {old_length:>10} {new_time:>12.2f} {new_length:>10}")
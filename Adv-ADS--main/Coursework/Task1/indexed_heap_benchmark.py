@@ -0,0 +1,87 @@
+import time
+import random
+from dijkstra import dijkstra
+from min_heap_priority_queue import MinHeapPriorityQueue
+from indexed_priority_queue import IndexedMinPriorityQueue
+from benchmark_networks import generate_network, load_underground_network, random_journeys
+
+
+# Function to time the operations Dijkstra's algorithm makes on a queue: insert every
+# vertex, then repeatedly extract the minimum and decrease the keys of a few others
+def time_operations(make_queue, size, decreases):
+    keys = [float('inf')] * size
+    keys[0] = 0
+    queue = make_queue(size, keys)
+    extract_time = 0
+    decrease_time = 0
+    for u in range(size):
+        queue.insert(u)
+    while queue.get_size() > 0:
+        start_time = time.time()
+        u = queue.extract_min()
+        extract_time += time.time() - start_time
+        for v, k in decreases[u]:
+            if keys[u] + k < keys[v]:
+                keys[v] = keys[u] + k
+                start_time = time.time()
+                queue.decrease_key(v, keys[v])
+                decrease_time += time.time() - start_time
+    return extract_time * 1e6 / size, decrease_time * 1e6 / size  # Convert to microseconds per vertex
+
+
+def make_heap(size, keys):
+    return MinHeapPriorityQueue(lambda u: keys[u])
+
+
+def make_indexed(size, keys):
+    return IndexedMinPriorityQueue(size, lambda u: keys[u])
+
+
+# Function to measure the average time of full single-source runs with each queue
+def compare_queues(network, journeys):
+    heap_time = 0
+    indexed_time = 0
+
+    for start, destination in journeys:
+        start_time = time.time()
+        distances, predecessors = dijkstra(network, start, priority_queue="heap")
+        heap_time += (time.time() - start_time) * 1000  # Convert to milliseconds
+
+        start_time = time.time()
+        indexed_distances, indexed_predecessors = dijkstra(network, start, priority_queue="indexed")
+        indexed_time += (time.time() - start_time) * 1000
+
+        # Both runs must agree on every journey duration
+        if distances != indexed_distances:
+            raise RuntimeError(f"Mismatch in journey durations from Station {start}")
+
+    return heap_time / len(journeys), indexed_time / len(journeys)
+
+
+def print_comparison(name, network, heap_avg, indexed_avg):
+    print(f"{name:>22} {network.get_card_V():>9} {network.get_card_E():>8} {heap_avg:>10.2f}"
+          f" {indexed_avg:>13.2f} {heap_avg / indexed_avg:>7.2f}x")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+
+    # Micro benchmark: the queue operations alone, with three random edges out of each vertex
+    print(f"{'Queue':>10} {'Size':>7} {'extract_min (us)':>17} {'decrease_key (us)':>18}")
+    for size in [1000, 10000, 100000]:
+        decreases = [[(random.randrange(size), random.randint(1, 10)) for i in range(3)] for u in range(size)]
+        for name, make_queue in [("Heap", make_heap), ("Indexed", make_indexed)]:
+            extract_avg, decrease_avg = time_operations(make_queue, size, decreases)
+            print(f"{name:>10} {size:>7} {extract_avg:>17.2f} {decrease_avg:>18.2f}")
+    print()
+
+    # Macro benchmark: whole runs of Dijkstra's algorithm
+    trials = 20
+    print(f"{'Network':>22} {'Stations':>9} {'Edges':>8} {'Heap (ms)':>10} {'Indexed (ms)':>13} {'Speedup':>8}")
+    network, stations = load_underground_network()
+    journeys = random_journeys(network.get_card_V(), trials)
+    print_comparison("London Underground", network, *compare_queues(network, journeys))
+    for network_size in [1000, 5000, 20000]:
+        network = generate_network(network_size, edge_probability=3 / network_size)
+        journeys = random_journeys(network_size, trials)
+        print_comparison(f"Random ({network_size})", network, *compare_queues(network, journeys))
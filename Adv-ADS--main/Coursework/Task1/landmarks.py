@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# landmarks.py
+
+import hashlib
+import numpy as np
+from dijkstra import lazy_dijkstra
+from a_star import a_star
+
+# Number of targets whose lower bounds are kept, so that repeated queries to
+# the same destination do not recompute them.
+BOUNDS_CACHE_SIZE = 16
+
+
+class Landmarks:
+
+	def __init__(self, vertices, table, reverse_table, card_E, checksum=None):
+		"""Initialize landmark distance tables for ALT (A*, landmarks and the
+		triangle inequality). Use build or load rather than calling this directly.
+
+		Arguments:
+		vertices -- indices of the landmark vertices
+		table -- array with table[i, v] the distance from landmark i to vertex v
+		reverse_table -- array with reverse_table[i, v] the distance from vertex v
+		to landmark i; the same array as table for an undirected graph
+		card_E -- number of edges in the graph the tables were computed for
+		checksum -- edge_checksum of that graph, None if unknown
+		"""
+		self.vertices = vertices
+		self.table = table
+		self.reverse_table = reverse_table
+		self.card_E = card_E
+		self.checksum = checksum
+		self.bounds = {}  # lower bounds of recent targets, oldest first
+
+	@staticmethod
+	def select_vertices(G, k, first=0):
+		"""Choose k landmarks spread around the graph. Each new landmark is the
+		vertex farthest from the landmarks chosen so far, which tends to place
+		landmarks at the edges of the graph where they give the tightest bounds.
+
+		Arguments:
+		G -- a weighted graph
+		k -- number of landmarks
+		first -- vertex the selection starts from, not itself a landmark
+		"""
+		card_V = G.get_card_V()
+		d, pi = lazy_dijkstra(G, first)
+		vertices = []
+		while len(vertices) < min(k, card_V):
+			# closest[v] is the distance from v to the nearest landmark so far.
+			d = np.array(d)
+			closest = np.minimum(closest, d) if len(vertices) > 1 else d
+			# Prefer reachable vertices; when all are covered, start on another component.
+			reachable = np.where(np.isinf(closest), -1, closest)
+			reachable[vertices] = -2
+			v = int(np.argmax(reachable))
+			if reachable[v] <= 0:
+				unreached = np.flatnonzero(np.isinf(closest))
+				if len(unreached) == 0:
+					break
+				v = int(unreached[0])
+			vertices.append(v)
+			d, pi = lazy_dijkstra(G, v)
+		return vertices
+
+	@staticmethod
+	def build(G, k=8, reverse_G=None):
+		"""Preprocess a graph by choosing k landmarks and computing shortest-path
+		distances from every landmark, and to every landmark if G is directed.
+		Tables are stored as float32 when that is exact, float64 otherwise.
+
+		Arguments:
+		G -- a weighted graph
+		k -- number of landmarks
+		reverse_G -- for a directed graph, its transpose; computed if omitted
+		"""
+		vertices = Landmarks.select_vertices(G, k)
+		table = Landmarks.distance_table(G, vertices)
+		if G.is_directed():
+			if reverse_G is None:
+				reverse_G = G.transpose()
+			reverse_table = Landmarks.distance_table(reverse_G, vertices)
+		else:
+			reverse_table = table
+		return Landmarks(np.array(vertices, dtype=np.int32), table, reverse_table, G.get_card_E(),
+						 Landmarks.edge_checksum(G))
+
+	@staticmethod
+	def edge_checksum(G):
+		"""Return a SHA-256 hash of the edges of G and their weights, which does not
+		depend on the order of the adjacency lists."""
+		edges = np.array([(u, edge.get_v(), edge.get_weight()) for u in range(G.get_card_V())
+						  for edge in G.get_adj_list(u)], dtype=np.float64).reshape(-1, 3)
+		edges = edges[np.lexsort(edges.T[::-1])]
+		return hashlib.sha256(edges.tobytes()).hexdigest()
+
+	@staticmethod
+	def distance_table(G, vertices):
+		"""Return an array of the shortest-path distances from each of the given vertices."""
+		table = np.array([lazy_dijkstra(G, v)[0] for v in vertices], dtype=np.float64)
+		finite = table[np.isfinite(table)]
+		# float32 represents integers below 2^24 exactly, which covers minute weights.
+		if np.all(finite == np.floor(finite)) and np.all(finite < 2 ** 24):
+			table = table.astype(np.float32)
+		return table
+
+	def get_vertices(self):
+		"""Return the indices of the landmark vertices."""
+		return self.vertices
+
+	def lower_bounds(self, t):
+		"""Return a list with a lower bound on the distance from each vertex to t.
+		By the triangle inequality, for each landmark L,
+		d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L).
+		The bounds of the last BOUNDS_CACHE_SIZE targets are kept, and the same
+		list is returned again for the same t, so it must not be modified.
+		"""
+		if t in self.bounds:
+			return self.bounds[t]
+		with np.errstate(invalid='ignore'):
+			bounds = np.maximum(self.table[:, t:t + 1] - self.table,
+								self.reverse_table - self.reverse_table[:, t:t + 1])
+		# Both distances infinite tells nothing about this landmark.
+		bounds[np.isnan(bounds)] = 0
+		if len(self.bounds) >= BOUNDS_CACHE_SIZE:
+			del self.bounds[next(iter(self.bounds))]
+		self.bounds[t] = np.maximum(bounds.max(axis=0), 0).tolist()
+		return self.bounds[t]
+
+	def shortest_path(self, G, s, t, mapping_func=None):
+		"""Find a shortest path from s to t in G with A* search guided by the landmarks.
+
+		Arguments:
+		G -- the graph these landmarks were built for
+		s -- index of source vertex
+		t -- index of destination vertex
+		mapping_func -- optional function to map vertex numbers on the path
+
+		Returns:
+		distance -- weight of a shortest path from s to t, infinity if there is none
+		path -- list of the vertices on the path from s to t, None if there is none
+		"""
+		h = self.lower_bounds(t)
+		return a_star(G, s, t, h.__getitem__, mapping_func)
+
+	def matches(self, G):
+		"""Return True if these tables were computed for a graph with the same
+		edges and weights as G. Tables with no checksum match no graph."""
+		return self.table.shape[1] == G.get_card_V() and self.card_E == G.get_card_E() \
+			and self.checksum is not None and self.checksum == Landmarks.edge_checksum(G)
+
+	def save(self, file):
+		"""Write the landmark tables, and the checksum of the graph's edges, to an .npz file."""
+		np.savez(file, vertices=self.vertices, table=self.table,
+				 reverse_table=self.reverse_table, card_E=self.card_E,
+				 directed=self.reverse_table is not self.table,
+				 checksum="" if self.checksum is None else self.checksum)
+
+	@staticmethod
+	def load(file, G=None):
+		"""Read landmark tables written by save. If a graph G is given, raise an
+		error if the tables were computed for a different graph."""
+		with np.load(file) as data:
+			table = data["table"]
+			reverse_table = data["reverse_table"] if data["directed"] else table
+			checksum = str(data["checksum"]) if "checksum" in data else ""
+			landmarks = Landmarks(data["vertices"], table, reverse_table, int(data["card_E"]),
+								  checksum if checksum != "" else None)
+		if G is not None and not landmarks.matches(G):
+			raise RuntimeError("Landmark tables in " + str(file) + " do not match the graph.")
+		return landmarks
+
+
+# Testing
+if __name__ == "__main__":
+
+	import os
+	import tempfile
+	from generate_random_graph import generate_random_graph
+	from dijkstra import dijkstra
+
+	card_V = 150
+	for directed in [False, True]:
+		graph1 = generate_random_graph(card_V, 0.03, True, directed, True, 0, 15)
+		landmarks = Landmarks.build(graph1, 6)
+		print("Landmarks:", landmarks.get_vertices(), landmarks.table.dtype)
+
+		# Saved tables should load back unchanged.
+		file = os.path.join(tempfile.mkdtemp(), "landmarks.npz")
+		landmarks.save(file)
+		landmarks = Landmarks.load(file, graph1)
+
+		all_equal = True
+		for s in range(card_V):
+			d, pi = dijkstra(graph1, s)
+			for t in range(card_V):
+				if landmarks.lower_bounds(t)[s] > d[t]:
+					print("Lower bound from", s, "to", t, "is too large")
+					all_equal = False
+				distance, path = landmarks.shortest_path(graph1, s, t)
+				if distance != d[t]:
+					print("Shortest-path distance mismatch from", s, "to", t)
+					all_equal = False
+		print("All " + ("directed" if directed else "undirected") + " shortest-path distances are "
+			  + ("not " if not all_equal else "") + "equal")
+
+		# Changing a weight, but not the number of edges, makes the tables stale.
+		u = next(u for u in range(card_V) if len(list(graph1.get_adj_list(u))) > 0)
+		edge = next(iter(graph1.get_adj_list(u)))
+		edge.set_weight(edge.get_weight() + 1)
+		try:
+			Landmarks.load(file, graph1)
+		except RuntimeError as e:
+			print(e)
@@ -0,0 +1,48 @@
+import random
+import tracemalloc
+import numpy as np
+from adjacency_matrix_graph import AdjacencyMatrixGraph
+
+
+# Function to build a weighted matrix graph of a connected network, like Task 1B with
+# whole-minute weights, and report the memory it holds in megabytes
+def measure_matrix(network_size, edges, dtype, sparse):
+    tracemalloc.start()
+    graph = AdjacencyMatrixGraph(network_size, directed=False, weighted=True, dtype=dtype, sparse=sparse)
+    for u, v, weight in edges:
+        graph.insert_edge(u, v, weight)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return graph, memory / 2 ** 20
+
+
+# Function to draw a spanning path through all stations plus about one random edge per station
+def random_edges(network_size):
+    edges = {(i, i + 1) for i in range(network_size - 1)}
+    while len(edges) < 2 * network_size - 1:
+        u, v = random.sample(range(network_size), 2)
+        edges.add((min(u, v), max(u, v)))
+    return [(u, v, random.randint(1, 10)) for u, v in edges]
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    layouts = [("float64", np.float64, False), ("float32", np.float32, False),
+               ("uint16", np.uint16, False), ("sparse", np.uint16, True)]
+    # Dense matrices beyond this many stations are skipped so the run fits in memory
+    dense_limit = 5000
+    print(f"{'Stations':>10} {'Edges':>8}" + "".join(f" {name + ' (MB)':>14}" for name, _, _ in layouts))
+    for network_size in [1000, 2000, 5000, 20000]:
+        edges = random_edges(network_size)
+        row = f"{network_size:>10} {len(edges):>8}"
+        edge_lists = []
+        for name, dtype, sparse in layouts:
+            if not sparse and network_size > dense_limit:
+                row += f" {'-':>14}"
+                continue
+            graph, memory = measure_matrix(network_size, edges, dtype, sparse)
+            edge_lists.append(graph.get_edge_list())
+            row += f" {memory:>14.2f}"
+        if any(edge_list != edge_lists[0] for edge_list in edge_lists):
+            raise RuntimeError(f"Matrix layouts hold different edges for {network_size} stations")
+        print(row)
@@ -0,0 +1,22 @@
+import random
+import tracemalloc
+from benchmark_networks import generate_network
+
+
+# Function to build a Task 1B-style network and report the memory it holds
+# in bytes per edge, counting the Edge and LinkedListNode objects of both directions
+def measure_bytes_per_edge(network_size, edge_probability):
+    tracemalloc.start()
+    network = generate_network(network_size, edge_probability)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return network, memory / network.get_card_E()
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{'Stations':>10} {'Edges':>8} {'Bytes per edge':>15}")
+    # The network sizes of Task 1B, then larger ones
+    for network_size in list(range(100, 1100, 100)) + [2000, 5000]:
+        network, bytes_per_edge = measure_bytes_per_edge(network_size, edge_probability=3 / network_size)
+        print(f"{network_size:>10} {network.get_card_E():>8} {bytes_per_edge:>15.1f}")
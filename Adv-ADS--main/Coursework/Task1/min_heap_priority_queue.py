@@ -109,6 +109,15 @@ if __name__ == "__main__":
     print(extracted_keys)
     print(extracted_keys == sorted(extracted_keys))
 
+    # The array holds only the objects still in the heap.
+    print(len(pq1.get_heap().get_array()) == pq1.get_size())
+
+    # A cleared queue can be reused.
+    pq1.insert(KeyObject("WA", 3))
+    pq1.clear()
+    pq1.insert(KeyObject("OR", 5))
+    print(pq1, pq1.get_size())
+
     # Check minimum in empty priority queue.
     pq2 = MinHeapPriorityQueue(KeyObject.get_key, KeyObject.set_key)
     try:
@@ -0,0 +1,38 @@
+import time
+from dijkstra import dijkstra, shortest_path
+from benchmark_networks import generate_network, random_journeys
+
+
+# Function to measure the average time of full single-source runs against
+# point-to-point queries that stop once the destination is extracted
+def compare_point_to_point(network, journeys):
+    full_time = 0
+    target_time = 0
+
+    for start, destination in journeys:
+        start_time = time.time()
+        distances, predecessors = dijkstra(network, start)
+        full_time += (time.time() - start_time) * 1000  # Convert to milliseconds
+
+        start_time = time.time()
+        duration, path = shortest_path(network, start, destination)
+        target_time += (time.time() - start_time) * 1000
+
+        # Both runs must agree on the journey duration
+        if duration != distances[destination]:
+            raise RuntimeError(f"Mismatch between Station {start} and Station {destination}: "
+                               f"{duration} != {distances[destination]}")
+
+    return full_time / len(journeys), target_time / len(journeys)
+
+
+if __name__ == "__main__":
+    trials = 20
+    print(f"{'Stations':>10} {'Edges':>8} {'Full (ms)':>10} {'Target (ms)':>12} {'Speedup':>8}")
+    for network_size in range(250, 2250, 250):
+        # Roughly 1.5 extra connections per station on top of the spanning path
+        network = generate_network(network_size, edge_probability=3 / network_size)
+        journeys = random_journeys(network_size, trials)
+        full_avg, target_avg = compare_point_to_point(network, journeys)
+        print(f"{network_size:>10} {network.get_card_E():>8} {full_avg:>10.2f} {target_avg:>12.2f}"
+              f" {full_avg / target_avg:>7.2f}x")
@@ -0,0 +1,116 @@
+import time
+import random
+from dijkstra import dijkstra, lazy_dijkstra
+from priority_queues import QUEUE_FACTORIES
+from benchmark_networks import generate_network, load_underground_network, random_journeys
+
+
+# A queue that passes every call on to another queue and records it, so that the operations
+# Dijkstra's algorithm makes on a network can be replayed on each backend by themselves
+class RecordingQueue:
+
+    def __init__(self, queue, operations):
+        self.queue = queue
+        self.operations = operations
+
+    def get_size(self):
+        return self.queue.get_size()
+
+    def insert(self, x):
+        self.operations.append(("insert", x, self.queue.get_key(x)))
+        self.queue.insert(x)
+
+    def extract_min(self):
+        self.operations.append(("extract_min", None, None))
+        return self.queue.extract_min()
+
+    def decrease_key(self, x, k):
+        self.operations.append(("decrease_key", x, k))
+        self.queue.decrease_key(x, k)
+
+
+# Function to record the queue operations of full single-source runs from each start
+def record_operations(network, journeys):
+    traces = []
+    for start, destination in journeys:
+        operations = []
+        dijkstra(network, start, queue_factory=lambda capacity, get_key_func: RecordingQueue(
+            QUEUE_FACTORIES["indexed"](capacity, get_key_func), operations))
+        traces.append(operations)
+    return traces
+
+
+# Function to replay recorded operations on a backend, returning microseconds per operation
+def replay(factory, capacity, traces):
+    elapsed = 0
+    count = 0
+    for operations in traces:
+        keys = [float('inf')] * capacity
+        queue = factory(capacity, lambda x: keys[x])
+        start_time = time.time()
+        for operation, x, k in operations:
+            if operation == "extract_min":
+                queue.extract_min()
+            elif operation == "insert":
+                keys[x] = k
+                queue.insert(x)
+            else:
+                keys[x] = k
+                queue.decrease_key(x, k)
+        elapsed += time.time() - start_time
+        count += len(operations)
+    return elapsed * 1e6 / count
+
+
+# Function to measure the average time in milliseconds of a search with each backend
+def time_searches(search, network, journeys):
+    times = {}
+    for name, factory in QUEUE_FACTORIES.items():
+        start_time = time.time()
+        for start, destination in journeys:
+            search(network, start, destination, factory)
+        times[name] = (time.time() - start_time) * 1000 / len(journeys)
+    return times
+
+
+def full_search(network, start, destination, factory):
+    return dijkstra(network, start, queue_factory=factory)
+
+
+def point_to_point(network, start, destination, factory):
+    return lazy_dijkstra(network, start, target=destination, queue_factory=factory)
+
+
+def print_row(name, network, times):
+    fastest = min(times, key=times.get)
+    print(f"{name:>22} {network.get_card_V():>7}" + "".join(f" {times[queue]:>9.2f}" for queue in QUEUE_FACTORIES)
+          + f" {fastest:>9}")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    trials = 20
+    networks = [("London Underground", load_underground_network()[0])]
+    for network_size, edge_probability in [(1000, 3 / 1000), (5000, 3 / 5000), (1000, 30 / 1000)]:
+        networks.append((f"Random ({network_size}, {round(edge_probability * network_size)}/V)",
+                         generate_network(network_size, edge_probability)))
+    header = f"{'Network':>22} {'Vertices':>7}" + "".join(f" {queue:>9}" for queue in QUEUE_FACTORIES) + f" {'Fastest':>9}"
+
+    # Micro benchmark: the queue operations of Dijkstra's algorithm alone, in microseconds per operation
+    print("Queue operations (us per operation)")
+    print(header)
+    for name, network in networks:
+        traces = record_operations(network, random_journeys(network.get_card_V(), trials))
+        times = {queue: replay(factory, network.get_card_V(), traces) for queue, factory in QUEUE_FACTORIES.items()}
+        print_row(name, network, times)
+    print()
+
+    # Macro benchmark: whole searches, in milliseconds per search
+    for title, search in [("Full single-source runs (ms)", full_search),
+                          ("Point-to-point queries with lazy insertion (ms)", point_to_point)]:
+        print(title)
+        print(header)
+        for name, network in networks:
+            journeys = random_journeys(network.get_card_V(), trials)
+            print_row(name, network, time_searches(search, network, journeys))
+        print()
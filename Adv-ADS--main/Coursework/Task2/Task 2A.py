@@ -1,6 +1,5 @@
 from adjacency_list_graph import AdjacencyListGraph
-from dijkstra import dijkstra
-from print_path import print_path
+from dijkstra import shortest_path
 
 # Define the station names and map them to indices
 station_names = ["A", "B", "C", "D", "E", "F"]  # A=0, B=1, C=2, D=3, E=4, F=5
@@ -14,14 +13,11 @@ edges = [
     ("D", "F", 1), ("E", "F", 1)
 ]
 
-# Initialize the graph with 6 nodes
-stations_graph = AdjacencyListGraph(len(station_names), directed=False, weighted=True)
-
-# Insert edges from the array, using "1" as the weight for each edge (representing one stop)
-for start, end, stops in edges:
-    start_index = station_to_index[start]
-    end_index = station_to_index[end]
-    stations_graph.insert_edge(start_index, end_index, stops)
+# Build the graph with 6 nodes from the edges in the array, loaded in one pass,
+# using "1" as the weight for each edge (representing one stop)
+starts, ends, stops = zip(*edges)
+stations_graph = AdjacencyListGraph.from_edges(len(station_names), [station_to_index[start] for start in starts],
+                                               [station_to_index[end] for end in ends], stops, directed=False)
 
 # Get user input for starting and destination station
 starting_station = input("Enter the starting station (A, B, C, D, E, F): ").strip().upper()
@@ -35,14 +31,15 @@ else:
     starting_in = station_to_index[starting_station]
     destination_in = station_to_index[destination_station]
 
-    # Use Dijkstra's Algorithm to find the shortest route (in terms of stops)
-    stops, predecessors = dijkstra(stations_graph, starting_in)
+    # Use Dijkstra's Algorithm to find the shortest route (in terms of stops), stopping once the destination is reached,
+    # letting it switch to breadth-first search since every edge is one stop
+    # (converts station indices to names along the path)
+    stops, path = shortest_path(stations_graph, starting_in, destination_in, lambda x: station_names[x],
+                                priority_queue="auto")
 
-    # Prints the shortest path and the number of stops using the print_path function
-    if stops[destination_in] == float('inf'):
+    # Prints the shortest path and the number of stops
+    if path is None:
         print(f"No path from {starting_station} to {destination_station}.")
     else:
-        # Call print_path function to display the route (converts station indices to names)
-        path = print_path(predecessors, starting_in, destination_in, lambda x: station_names[x])
         print(f"Shortest path from {starting_station} to {destination_station}: {' -> '.join(path)}")
-        print(f"Number of Stops: {stops[destination_in]}")
+        print(f"Number of Stops: {stops}")
@@ -30,22 +30,26 @@
 #                                                                       #
 #########################################################################
 
+import gc
+import numpy as np
 from dll_sentinel import DLLSentinel
 from adjacency_matrix_graph import AdjacencyMatrixGraph
 
 
 class Edge:
 
+	# Slots rather than a per-object dictionary, since a graph holds an Edge per edge endpoint.
+	__slots__ = ("v", "weight")
+
 	def __init__(self, v, weight=None):
 		"""Initialize an edge to add to the adjacency list of another vertex.
 
 		Arguments:
 		v -- the other vertex that the edge is incident on
-		weight -- optional parameter for weighted graphs
+		weight -- optional parameter for weighted graphs, None if unweighted
 		"""
 		self.v = v
-		if weight is not None:
-			self.weight = weight
+		self.weight = weight
 
 	def get_v(self):
 		"""Return the vertex index."""
@@ -67,7 +71,7 @@ class Edge:
 		"""String version of the vertex with optional weight in parentheses.
 		Vertex numbers are mapped according to a mapping function."""
 		string = str(mapping_func(self.v))
-		if hasattr(self, "weight"):
+		if self.weight is not None:
 			string += " (" + str(self.weight) + ")"
 		return string
 
@@ -89,9 +93,95 @@ class AdjacencyListGraph:
 		for i in range(card_V):
 			# Each adjacency list is implemented as a linked list.
 			self.adj_lists[i] = DLLSentinel(get_key_func=Edge.get_v)  # will be a list of Edge objects
+		# edge_nodes[u][v] is the linked-list node holding edge (u, v), so that
+		# finding and deleting an edge take O(1) expected time rather than a search.
+		self.edge_nodes = [{} for i in range(card_V)]
 		self.card_V = card_V
 		self.card_E = 0
 
+	@staticmethod
+	def unique_edges(u, v, directed=True, weights=None):
+		"""Return the indices of the first occurrence of each edge (u[i], v[i]) in
+		arrays of edge endpoints, in their original order. In an undirected graph,
+		(u, v) and (v, u) are the same edge.
+
+		Arguments:
+		u, v -- arrays of edge endpoints
+		directed -- boolean indicating whether the graph is directed
+		weights -- optional array of edge weights. If given, the occurrence
+		with the smallest weight is kept instead of the first, the first
+		of those if there is a tie.
+		"""
+		u = np.asarray(u, dtype=np.int64)
+		v = np.asarray(v, dtype=np.int64)
+		if not directed:
+			u, v = np.minimum(u, v), np.maximum(u, v)
+		keys = u * (int(max(u.max(initial=0), v.max(initial=0))) + 1) + v
+		if weights is None:
+			first = np.unique(keys, return_index=True)[1]
+			return np.sort(first)
+
+		# Sort by edge, then weight, then position, and keep the head of each run.
+		order = np.lexsort((np.arange(len(keys)), np.asarray(weights), keys))
+		heads = np.ones(len(order), dtype=bool)
+		heads[1:] = keys[order[1:]] != keys[order[:-1]]
+		return np.sort(order[heads])
+
+	@staticmethod
+	def from_edges(card_V, u, v, weights=None, directed=True, lightest=False):
+		"""Return a graph with the edges (u[i], v[i]) given as arrays, built in one
+		sweep rather than by calling insert_edge for each edge. Repeated edges are
+		dropped, keeping the first occurrence, and the adjacency lists are in the
+		same order as if the remaining edges had been inserted one at a time.
+
+		Arguments:
+		card_V -- number of vertices in the graph
+		u, v -- arrays of edge endpoints
+		weights -- array of edge weights, or None for an unweighted graph
+		directed -- boolean indicating whether the graph is directed
+		lightest -- if True, keep the lightest occurrence of a repeated edge
+		rather than the first, as for parallel sections of different lines
+		"""
+		u = np.asarray(u)
+		v = np.asarray(v)
+		endpoints = np.concatenate((u, v))
+		outside = endpoints[(endpoints < 0) | (endpoints >= card_V)]
+		if len(outside) > 0:
+			raise RuntimeError("Vertex " + str(outside[0]) + " is not in a graph of " + str(card_V) + " vertices.")
+		if not directed and np.any(u == v):
+			raise RuntimeError("Cannot insert self-loop into undirected graph")
+
+		graph = AdjacencyListGraph(card_V, directed, weights is not None)
+		keep = AdjacencyListGraph.unique_edges(u, v, directed, weights if lightest else None)
+		graph.card_E = len(keep)
+		u, v = u[keep], v[keep]
+		weights = np.full(len(keep), None) if weights is None else np.asarray(weights)[keep]
+		if not directed:
+			# Interleave (u, v) and (v, u), the order insert_edge would add them in.
+			u, v = np.column_stack((u, v)).ravel(), np.column_stack((v, u)).ravel()
+			weights = np.repeat(weights, 2)
+
+		# Group the edges by the vertex they leave, keeping their order.
+		order = np.argsort(u, kind="stable")
+		targets = v[order].tolist()
+		weights = weights[order].tolist()
+		bounds = np.searchsorted(u[order], np.arange(card_V + 1)).tolist()
+
+		# Pause the cycle collector, which would otherwise scan the new objects
+		# over and over while they are being created.
+		collecting = gc.isenabled()
+		gc.disable()
+		try:
+			for x in range(card_V):
+				start, end = bounds[x], bounds[x + 1]
+				if start < end:
+					nodes = graph.adj_lists[x].extend(map(Edge, targets[start:end], weights[start:end]))
+					graph.edge_nodes[x] = dict(zip(targets[start:end], nodes))
+		finally:
+			if collecting:
+				gc.enable()
+		return graph
+
 	def get_card_V(self):
 		"""Return the number of vertices in this graph."""
 		return self.card_V
@@ -101,7 +191,9 @@ class AdjacencyListGraph:
 		return self.card_E
 
 	def get_adj_lists(self):
-		"""Return the adjacency lists of all the vertices in this graph."""
+		"""Return the adjacency lists of all the vertices in this graph.
+		Change edges through insert_edge and delete_edge, not through these lists,
+		so that the edge index stays up to date."""
 		return self.adj_lists
 
 	def get_adj_list(self, u):
@@ -123,6 +215,11 @@ class AdjacencyListGraph:
 		u -- index of vertex u
 		v -- index of vertex v
 		"""
+		# Both endpoints must be vertices of this graph.
+		for x in (u, v):
+			if not 0 <= x < self.card_V:
+				raise RuntimeError("Vertex " + str(x) + " is not in a graph of " + str(self.card_V) + " vertices.")
+
 		# Check whether a weight is missing, or whether a weight is given in an unweighted graph.
 		if self.weighted:
 			if weight is None:
@@ -138,7 +235,7 @@ class AdjacencyListGraph:
 		# Cannot insert multiple edges between two vertices.
 		if self.has_edge(u, v):
 			raise RuntimeError("An edge (" + str(u) + ", " + str(v) + ") already exists.")
-		self.adj_lists[u].append(Edge(v, weight))
+		self.edge_nodes[u][v] = self.adj_lists[u].append(Edge(v, weight))
 		self.card_E += 1
 
 		# If this graph is undirected, insert an edge from v to u.
@@ -146,11 +243,11 @@ class AdjacencyListGraph:
 			# Cannot insert multiple edges between two vertices.
 			if self.has_edge(v, u):
 				raise RuntimeError("An edge (" + str(v) + ", " + str(u) + ") already exists.")
-			self.adj_lists[v].append(Edge(u, weight))
+			self.edge_nodes[v][u] = self.adj_lists[v].append(Edge(u, weight))
 
 	def find_edge(self, u, v):
 		"""Return the edge object for edge (u, v) if (u, v) is in this graph, None otherwise."""
-		edge = self.adj_lists[u].search(v)
+		edge = self.edge_nodes[u].get(v)
 		if edge is None:
 			return None
 		else:
@@ -163,13 +260,13 @@ class AdjacencyListGraph:
 	def delete_edge(self, u, v, delete_undirected=True):
 		"""Delete edge (u, v) if it exists.  No error if it does not exist.
 			Delete both directions if the graph is undirected and delete_undirected is True."""
-		edge = self.adj_lists[u].search(v)
+		edge = self.edge_nodes[u].pop(v, None)
 		if edge is not None:
 			self.adj_lists[u].delete(edge)
 			self.card_E -= 1
 
 		if not self.directed and delete_undirected:
-			edge = self.adj_lists[v].search(u)
+			edge = self.edge_nodes[v].pop(u, None)
 			if edge is not None:
 				self.adj_lists[v].delete(edge)
 
@@ -178,7 +275,8 @@ class AdjacencyListGraph:
 		copy = AdjacencyListGraph(self.card_V, self.directed, self.weighted)
 		copy.card_E = self.card_E
 		for u in range(self.card_V):
-			copy.adj_lists[u] = self.adj_lists[u].copy()
+			for edge in self.get_adj_list(u):
+				copy.edge_nodes[u][edge.get_v()] = copy.adj_lists[u].append(edge)
 		return copy
 
 	def get_edge_list(self):
@@ -308,6 +406,24 @@ if __name__ == "__main__":
 	# Test get_edge_list.
 	print(graph3.get_edge_list())
 
+	# Bulk loading gives the same graph as inserting edges one at a time.
+	graph4 = AdjacencyListGraph.from_edges(10, array1[0::2], array1[1::2], array1[0::2], directed=True)
+	print(str(graph4) == str(graph3))
+
+	# Keeping the lightest of repeated edges, in either direction.
+	graph5 = AdjacencyListGraph.from_edges(3, [0, 1, 1, 2], [1, 0, 2, 1], [4, 2, 3, 3], directed=False, lightest=True)
+	print(graph5)
+
+	# An endpoint outside the graph is an error either way.
+	try:
+		graph5.insert_edge(0, 3, 1)
+	except RuntimeError as e:
+		print(e)
+	try:
+		AdjacencyListGraph.from_edges(3, [0, 1], [1, 3], [4, 2])
+	except RuntimeError as e:
+		print(e)
+
 	# Test transpose.
 	xpose1 = graph1.transpose()
 	print(xpose1)
@@ -0,0 +1,51 @@
+import time
+import random
+from adjacency_list_graph import AdjacencyListGraph
+from dijkstra import dijkstra
+
+
+# Function to generate a stop-count network the same way as Task 2B:
+# a spanning path through all stations plus extra random edges, all of weight 1
+def generate_network(network_size, edge_probability):
+    network = AdjacencyListGraph(network_size, directed=False, weighted=True)
+    for i in range(network_size - 1):
+        network.insert_edge(i, i + 1, weight=1)
+    for u in range(network_size):
+        for v in range(u + 2, network_size):
+            if random.random() <= edge_probability:
+                network.insert_edge(u, v, weight=1)
+    return network
+
+
+# Function to measure the average time of heap-based Dijkstra runs against
+# the breadth-first search that dijkstra dispatches to for unit weights when asked to choose
+def compare_bfs(network, trials):
+    heap_time = 0
+    bfs_time = 0
+
+    for run in range(trials):
+        start = random.randint(0, network.get_card_V() - 1)
+
+        start_time = time.time()
+        distances, predecessors = dijkstra(network, start, priority_queue="heap")
+        heap_time += (time.time() - start_time) * 1000  # Convert to milliseconds
+
+        start_time = time.time()
+        bfs_distances, bfs_predecessors = dijkstra(network, start, priority_queue="auto")
+        bfs_time += (time.time() - start_time) * 1000
+
+        # Both runs must agree on the number of stops to every station
+        if distances != bfs_distances:
+            raise RuntimeError(f"Mismatch in journey stops from Station {start}")
+
+    return heap_time / trials, bfs_time / trials
+
+
+if __name__ == "__main__":
+    trials = 10
+    print(f"{'Stations':>10} {'Edges':>8} {'Heap (ms)':>10} {'BFS (ms)':>10} {'Speedup':>8}")
+    for network_size in range(1100, 2100, 100):
+        network = generate_network(network_size, edge_probability=3 / network_size)
+        heap_avg, bfs_avg = compare_bfs(network, trials)
+        print(f"{network_size:>10} {network.get_card_E():>8} {heap_avg:>10.2f} {bfs_avg:>10.2f}"
+              f" {heap_avg / bfs_avg:>7.2f}x")
@@ -32,6 +32,9 @@
 
 class LinkedListNode:
 
+	# Slots rather than a per-object dictionary, since adjacency lists hold a node per edge endpoint.
+	__slots__ = ("prev", "next", "data")
+
 	def __init__(self, data):
 		"""Initialize a node of a circular doubly linked list with a sentinel with the given data."""
 		self.prev = None
@@ -102,6 +105,20 @@ class DLLSentinel:
 		Return the new node."""
 		return self.insert(data, self.sentinel.prev)
 
+	def extend(self, items):
+		"""Append a node for each of the given data items to the tail of a circular
+		doubly linked list with a sentinel, linking them in one sweep.
+		Return a list of the new nodes."""
+		nodes = [LinkedListNode(data) for data in items]
+		prev = self.sentinel.prev
+		for x in nodes:
+			x.prev = prev
+			prev.next = x
+			prev = x
+		prev.next = self.sentinel
+		self.sentinel.prev = prev
+		return nodes
+
 	def delete(self, x):
 		"""Remove a node x from the a circular doubly linked list with a sentinel.
 
@@ -159,6 +176,10 @@ if __name__ == "__main__":
 	# Search. 
 	print(linked_list1.search(5))
 
+	# Extend.
+	linked_list1.extend([10, 11, 12])
+	print(linked_list1)
+
 	# Copy.
 	linked_list2 = linked_list1.copy()
 	linked_list2.append(99)
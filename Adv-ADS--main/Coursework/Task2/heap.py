@@ -80,6 +80,11 @@ class Heap:
         """Set heap size to given size."""
         self.heap_size = size
 
+    def compact(self):
+        """Remove the array entries past the heap size, which are no longer in the
+        heap, so that the array holds only the heap and drops its references to them."""
+        del self.array[self.heap_size:]
+
     def parent(self, i):
         """Return the index of the parent node of i."""
         return (i-1) // 2
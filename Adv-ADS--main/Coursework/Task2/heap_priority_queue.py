@@ -84,17 +84,20 @@ class HeapPriorityQueue:
         """Return and delete the top element in a heap."""
         top = self.top_of_heap()
 
-        # Move the last object in heap to the root position.
-        last_obj = self.heap.get_array()[self.heap.get_heap_size()-1]
-        self.heap.get_array()[0] = last_obj
-        self.dict[last_obj] = 0
+        # Take the last object off the end of the array, so the array never
+        # holds objects that have left the heap.
+        self.compact()
+        last_obj = self.heap.get_array().pop()
+        self.heap.set_heap_size(self.heap.get_heap_size() - 1)
 
         # Remove the old top object.
         del self.dict[top]
-        self.heap.set_heap_size(self.heap.get_heap_size() - 1)
 
-        # Restore the heap property.
-        self.heap.heapify(0)
+        # Move the last object to the root position and restore the heap property.
+        if self.heap.get_heap_size() > 0:
+            self.heap.get_array()[0] = last_obj
+            self.dict[last_obj] = 0
+            self.heap.heapify(0)
 
         # Return the top item, which was extracted.
         return top
@@ -128,21 +131,34 @@ class HeapPriorityQueue:
         x -- object to insert
         """
 
-        # Increment the heap size.
-        self.heap.set_heap_size(self.heap.get_heap_size() + 1)
-
         k = self.get_key(x)
 
         if self.set_key is not None:
             self.set_key(x, self.temp_insert_value)
 
-        # Insert x into the array and the dictionary.
-        self.heap.get_array().insert(self.heap.get_heap_size() - 1, x)
-        self.dict[x] = self.heap.get_heap_size() - 1
+        # Append x to the array, which holds just the heap, and add it to the dictionary.
+        self.compact()
+        self.heap.get_array().append(x)
+        self.dict[x] = self.heap.get_heap_size()
+        self.heap.set_heap_size(self.heap.get_heap_size() + 1)
 
         # Maintain the heap property.
         self.update_key(x, k)
 
+    def compact(self):
+        """Drop any array entries past the end of the heap, such as those left by
+        setting a smaller heap size, so that only objects in the heap stay
+        referenced. Inserting and extracting keep the array exactly as long as
+        the heap, so usually this only checks the length."""
+        if len(self.heap.get_array()) > self.heap.get_heap_size():
+            self.heap.compact()
+
+    def clear(self):
+        """Remove every object, so that the priority queue can be reused."""
+        self.heap.get_array().clear()
+        self.heap.set_heap_size(0)
+        self.dict.clear()
+
     def is_heap(self):
         """Verify that the array or list represents a heap."""
         return self.heap.is_heap()
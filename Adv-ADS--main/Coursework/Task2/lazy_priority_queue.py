@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# lazy_priority_queue.py
+
+import heapq
+
+
+class LazyMinPriorityQueue:
+
+	def __init__(self, capacity, get_key_func=None):
+		"""Initialize a minimum priority queue of the integers 0 to capacity - 1
+		implemented with Python's heapq module and lazy deletion.
+
+		There is no decrease_key in heapq, so none is done: decreasing a key
+		pushes another (key, object) entry and leaves the old one in the heap.
+		extract_min skips entries whose key is no longer the object's key or
+		whose object has already been extracted. The heap can hold more entries
+		than objects, but every push and pop runs in heapq's C code.
+
+		Arguments:
+		capacity -- number of possible objects, which are 0 to capacity - 1
+		get_key_func -- optional function that returns the key of an object
+		when it is inserted, as in IndexedMinPriorityQueue
+		"""
+		self.get_key = get_key_func
+		self.entries = []
+		self.keys = [float('inf')] * capacity
+		self.in_queue = [False] * capacity
+		self.size = 0
+
+	def get_size(self):
+		"""Return the number of objects in the priority queue."""
+		return self.size
+
+	def contains(self, x):
+		"""Return True if object x is in the priority queue."""
+		return self.in_queue[x]
+
+	def get_key_of(self, x):
+		"""Return the key of object x."""
+		return self.keys[x]
+
+	def insert(self, x, k=None):
+		"""Insert object x with key k, or with get_key_func(x) if k is not given."""
+		if self.in_queue[x]:
+			raise RuntimeError("Object " + str(x) + " is already in the priority queue.")
+		k = self.get_key(x) if k is None else k
+		self.keys[x] = k
+		self.in_queue[x] = True
+		self.size += 1
+		heapq.heappush(self.entries, (k, x))
+
+	def discard_stale(self):
+		"""Pop the entries at the top of the heap that no longer match their object."""
+		entries = self.entries
+		while not self.in_queue[entries[0][1]] or entries[0][0] != self.keys[entries[0][1]]:
+			heapq.heappop(entries)
+
+	def minimum(self):
+		"""Return the object with the minimum key."""
+		if self.size <= 0:  # error if the queue is empty
+			raise RuntimeError("Heap underflow.")
+		self.discard_stale()
+		return self.entries[0][1]
+
+	def extract_min(self):
+		"""Return and delete the object with the minimum key."""
+		top = self.minimum()
+		heapq.heappop(self.entries)
+		self.in_queue[top] = False
+		self.size -= 1
+		if self.size == 0:
+			self.entries.clear()  # only stale entries remain
+		return top
+
+	def decrease_key(self, x, k):
+		"""Give object x the smaller key k by pushing a new entry for it. Error if
+		k is greater than x's current key."""
+		if k > self.keys[x]:
+			raise RuntimeError("Error in decrease_key: new key " + str(k)
+							   + " is greater than current key " + str(self.keys[x]))
+		self.keys[x] = k
+		heapq.heappush(self.entries, (k, x))
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import randint, seed
+
+	# Decreased keys leave stale entries behind, which extraction skips.
+	seed(0)
+	pq1 = LazyMinPriorityQueue(50)
+	for x in range(50):
+		pq1.insert(x, randint(0, 100))
+	for x in range(0, 50, 4):
+		pq1.decrease_key(x, pq1.get_key_of(x) - randint(0, 50))
+	print(len(pq1.entries), pq1.get_size())
+	extracted = []
+	while pq1.get_size() > 0:
+		extracted.append(pq1.extract_min())
+	extracted_keys = [pq1.get_key_of(x) for x in extracted]
+	print(sorted(extracted) == list(range(50)), extracted_keys == sorted(extracted_keys))
+
+	# Keys can come from a function, as for MinHeapPriorityQueue.
+	d = [5, 3, 8, 1]
+	pq2 = LazyMinPriorityQueue(4, lambda u: d[u])
+	for u in range(4):
+		pq2.insert(u)
+	d[2] = 0
+	pq2.decrease_key(2, d[2])
+	print([pq2.extract_min() for i in range(4)])
+	try:
+		pq2.extract_min()
+	except RuntimeError as e:
+		print(e)
@@ -1,63 +1,20 @@
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-from adjacency_list_graph import AdjacencyListGraph
-from dijkstra import dijkstra
-from print_path import print_path
+from all_pairs_shortest_paths import apsp_path
+from parallel_apsp import parallel_dijkstra_apsp
+from london_underground import load_graph
 
-def load_data(file):  # Loads the data from the Excel file, labeling the columns and clearing empty rows
-    underground_data = pd.read_excel(file, sheet_name='Sheet1')
-    underground_data.columns = ["Line", "Start", "Destination", "Duration"]
-    underground_data = underground_data.dropna(subset=["Duration", "Start", "Destination"])
-    return underground_data.drop_duplicates(subset=["Start", "Destination"])
+def calculate_all_durations(distances):  # Collects all the possible journey durations uniquely
+    # Only count journeys where start < end to avoid duplication
+    durations = distances[np.triu_indices(len(distances), 1)]
+    return durations[durations != float('inf')].tolist()
 
 
-def build_graph(underground_data):  # Parse the data from the Excel to build an Adjacency List graph
-    stations = pd.concat([underground_data["Start"], underground_data["Destination"]]).unique()
-    station_index = {}
-    num_stations = len(stations)
-    for index, station in enumerate(stations):  # Map stations to indices
-        station_index[station] = index
-
-    graph = AdjacencyListGraph(num_stations, directed=False, weighted=True)
-    added_edges = set()  # To keep track of unique edges
-
-    # Traverse each row and add each unique edge only once
-    for row_index, row in underground_data.iterrows():
-        start = station_index[row["Start"]]
-        end = station_index[row["Destination"]]
-        journey_duration = row["Duration"]
-
-        # Use sorted tuple to ensure each pair is added in one direction only
-        edge = (min(start, end), max(start, end))
-
-        # Insert edge if it hasn't been added before
-        if edge not in added_edges:
-            graph.insert_edge(start, end, weight=journey_duration)
-            added_edges.add(edge)
-
-    return graph, station_index, stations
-
-
-def calculate_all_durations(graph, num_stations):  # Calculates all the possible journey durations uniquely
-    all_durations = []
-    for start in range(num_stations):
-        distances, predecessors = dijkstra(graph, start)
-        for end in range(start + 1, num_stations):  # Only count journeys where start < end to avoid duplication
-            if distances[end] != float('inf'):
-                all_durations.append(distances[end])
-    return all_durations
-
-
-def find_longest_journey(graph, num_stations, stations):  # Finds the longest journey
-    max_duration = -1
-    longest_path = None
-    for start in range(num_stations):
-        distances, predecessors = dijkstra(graph, start)
-        for end in range(num_stations):
-            if distances[end] > max_duration and distances[end] != float('inf'):
-                max_duration = distances[end]
-                longest_path = print_path(predecessors, start, end, lambda x: stations[x])
-    return max_duration, longest_path
+def find_longest_journey(distances, predecessors, stations):  # Finds the longest journey
+    reachable = np.where(distances != float('inf'), distances, -1)
+    start, end = np.unravel_index(np.argmax(reachable), reachable.shape)
+    longest_path = apsp_path(predecessors, start, end, lambda x: stations[x])
+    return distances[start, end].item(), longest_path
 
 
 def plot_histogram(all_durations):  # Plots the histogram of the duration of possible journeys
@@ -71,22 +28,21 @@ def plot_histogram(all_durations):  # Plots the histogram of the duration of pos
 
 
 def main(file):
-    # Load and clean data
-    underground_data = load_data(file)
+    # Load the graph with unique edges, parsing the Excel file only if it has changed
+    graph, station_index, stations = load_graph(file)
 
-    # Build the graph with unique edges
-    graph, station_index, stations = build_graph(underground_data)
-    num_stations = len(stations)
+    # Run Dijkstra's algorithm once from every station, on all cores for a large network, shared by both analyses
+    distances, predecessors = parallel_dijkstra_apsp(graph, weight="duration")
 
     # Calculate all journey durations
-    all_durations = calculate_all_durations(graph, num_stations)
+    all_durations = calculate_all_durations(distances)
     print(f"Total journey durations calculated: {len(all_durations)}")
 
     # Plot histogram of the journey durations
     plot_histogram(all_durations)
 
     # Find the longest journey and print it
-    max_duration, longest_path = find_longest_journey(graph, num_stations, stations)
+    max_duration, longest_path = find_longest_journey(distances, predecessors, stations)
     print(f"Longest Journey Duration: {max_duration} minutes")
     print(f"Path: {' → '.join(longest_path)}")
 
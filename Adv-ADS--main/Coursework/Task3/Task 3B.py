@@ -1,48 +1,14 @@
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-from adjacency_list_graph import AdjacencyListGraph
-from dijkstra import dijkstra
-from print_path import print_path
+from all_pairs_shortest_paths import apsp_path
+from parallel_apsp import parallel_dijkstra_apsp
+from london_underground import load_graph
 
 
-def load_data(file):  # Loads the data from the Excel file, labeling the columns and clearing empty rows
-    underground_data = pd.read_excel(file, sheet_name='Sheet1')
-    underground_data.columns = ["Line", "Start", "Destination", "Duration"]
-    underground_data = underground_data.dropna(subset=["Duration", "Start", "Destination"])
-    return underground_data.drop_duplicates(subset=["Start", "Destination"])
-
-
-def build_graph(underground_data):  # Build the graph using unique stations and set edge weights to 1 for counting stops
-    stations = pd.concat([underground_data["Start"], underground_data["Destination"]]).unique()
-    station_index = {}
-    num_stations = len(stations)
-    for index, station in enumerate(stations):
-        station_index[station] = index
-
-    graph = AdjacencyListGraph(num_stations, directed=False, weighted=True)
-    added_edges = set()  # To track unique edges
-
-    for row_index, row in underground_data.iterrows():
-        start_key = station_index[row["Start"]]
-        end_key = station_index[row["Destination"]]
-
-        # Ensure each unique edge is only inserted once, regardless of direction
-        edge = (min(start_key, end_key), max(start_key, end_key))
-        if edge not in added_edges:
-            graph.insert_edge(start_key, end_key, weight=1)  # Set weight to 1 for counting stops
-            added_edges.add(edge)
-
-    return graph, station_index, stations
-
-
-def calculate_all_journey_stops(graph, num_stations):
-    all_journey_stops = []
-    for start in range(num_stations):
-        distances, predecessors = dijkstra(graph, start)
-        for end in range(start + 1, num_stations):  # Only count each journey once by ensuring start < end
-            if distances[end] != float('inf'):
-                all_journey_stops.append(distances[end])
-    return all_journey_stops
+def calculate_all_journey_stops(distances):
+    # Only count each journey once by ensuring start < end
+    journey_stops = distances[np.triu_indices(len(distances), 1)]
+    return journey_stops[journey_stops != float('inf')].tolist()
 
 
 def plot_histogram(all_journey_stops):
@@ -55,35 +21,29 @@ def plot_histogram(all_journey_stops):
     plt.show()
 
 
-def find_longest_journey(graph, num_stations, stations):  # Finds the longest journey by stops
-    max_stops = -1
-    longest_path = None
-    for start in range(num_stations):
-        distances, predecessors = dijkstra(graph, start)
-        for end in range(num_stations):
-            if distances[end] > max_stops and distances[end] != float('inf'):
-                max_stops = distances[end]
-                longest_path = print_path(predecessors, start, end, lambda x: stations[x])
-    return max_stops, longest_path
+def find_longest_journey(distances, predecessors, stations):  # Finds the longest journey by stops
+    reachable = np.where(distances != float('inf'), distances, -1)
+    start, end = np.unravel_index(np.argmax(reachable), reachable.shape)
+    longest_path = apsp_path(predecessors, start, end, lambda x: stations[x])
+    return int(distances[start, end]), longest_path
 
 
 def main(file):
-    # Load and clean data
-    underground_data = load_data(file)
+    # Load the graph with unique edges, parsing the Excel file only if it has changed
+    graph, station_index, stations = load_graph(file)
 
-    # Build the graph with unique edges
-    graph, station_index, stations = build_graph(underground_data)
-    num_stations = len(stations)
+    # Count stops from every station once, on all cores for a large network, shared by both analyses
+    distances, predecessors = parallel_dijkstra_apsp(graph, weight="stops")
 
     # Calculate journey stops
-    all_journey_stops = calculate_all_journey_stops(graph, num_stations)
+    all_journey_stops = calculate_all_journey_stops(distances)
     print(f"Total possible journeys calculated (in terms of stops): {len(all_journey_stops)}")
 
     # Plot histogram of journey stops
     plot_histogram(all_journey_stops)
 
     # Find the longest journey in terms of stops
-    max_stops, longest_path = find_longest_journey(graph, num_stations, stations)
+    max_stops, longest_path = find_longest_journey(distances, predecessors, stations)
 
     print(f"Longest Journey: {max_stops} stops")
     print(f"Path: {' → '.join(longest_path)}")
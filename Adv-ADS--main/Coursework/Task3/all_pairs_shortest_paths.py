@@ -31,6 +31,8 @@
 #########################################################################
 
 import numpy as np
+from dijkstra import dijkstra, select_weight
+from bfs import bfs, uniform_weight
 
 
 def extend_shortest_paths(L_r_minus_1, W, L_r, n):
@@ -102,13 +104,97 @@ def initialize_L_0(n):
 
 
 def create_W(G, n):
-	"""Create and return the W matrix, given an n-vertex graph G represented by an adjacency matrix."""
-	W = G.get_adj_matrix().copy()
+	"""Create and return the W matrix, given an n-vertex graph G represented by an adjacency matrix.
+	W is a float64 array with infinity for no edge, whatever type G's matrix stores."""
+	W = G.get_float_adj_matrix()
 	for i in range(n):
 		W[i,i] = 0
 	return W
 
 
+def dijkstra_apsp(G, weight=None):
+	"""Compute all-pairs shortest paths for a graph with no negative-weight edges
+	by running Dijkstra's algorithm once from each vertex.
+
+	Arguments:
+	G -- a weighted graph, such as an AdjacencyListGraph or a CSRGraph
+	weight -- optional name of the weight to use, for a graph with several
+	named weights on each edge, see dijkstra.select_weight
+	Returns:
+	D -- card_V x card_V array of shortest-path weights, where D[s, v] is the
+	weight of a shortest path from vertex s to vertex v, infinity if there is none
+	Pi -- card_V x card_V array of predecessors, where Pi[s, v] is the predecessor
+	of v on a shortest path from s, -1 if there is none
+	"""
+	G = select_weight(G, weight)
+	card_V = G.get_card_V()
+	D = np.empty((card_V, card_V))
+	Pi = np.empty((card_V, card_V), dtype=np.int32)
+	# Choose between breadth-first search and the heap once, not for every source.
+	uniform = uniform_weight(G)
+	for s in range(card_V):
+		if uniform is not None:
+			d, pi = bfs(G, s, weight=uniform)
+		else:
+			d, pi = dijkstra(G, s, priority_queue="indexed")
+		D[s] = d
+		Pi[s] = [-1 if u is None else u for u in pi]
+	return D, Pi
+
+
+def apsp_path(Pi, s, v, mapping_func):
+	"""Return a list of the vertices on a shortest path from s to v, read from
+	the predecessor matrix of dijkstra_apsp. Returns None if no path from s to v exists.
+
+	Arguments:
+	Pi -- predecessor matrix
+	s -- source vertex for the path
+	v -- end vertex for the path
+	mapping_func -- function to map vertex numbers to what they print as
+	"""
+	path = [mapping_func(v)]
+	while v != s:
+		v = int(Pi[s, v])
+		if v == -1:
+			return None
+		path.append(mapping_func(v))
+	path.reverse()
+	return path
+
+
+def apsp_paths(Pi, sources, ends, mapping_func):
+	"""Return a list of the shortest paths from sources[i] to ends[i] for every i,
+	read from the predecessor matrix of dijkstra_apsp. All the paths are walked
+	back one step at a time together, so there is one NumPy lookup per step
+	rather than one per vertex. An entry is None if no path exists.
+
+	Arguments:
+	Pi -- predecessor matrix
+	sources -- source vertex of each path
+	ends -- end vertex of each path
+	mapping_func -- function to map vertex numbers to what they print as
+	"""
+	sources = np.asarray(sources)
+	current = np.array(ends)
+	steps = [current]
+	active = current != sources
+	while active.any():
+		current = np.where(active, Pi[sources, current], current)
+		steps.append(current)
+		active &= (current != sources) & (current != -1)
+
+	# Row i holds path i from its end back to its source, then padding.
+	walks = np.stack(steps, axis=1)
+	paths = []
+	for i in range(len(sources)):
+		length = np.argmax(walks[i] == sources[i])
+		if walks[i, length] != sources[i]:
+			paths.append(None)
+		else:
+			paths.append([mapping_func(v) for v in walks[i, length::-1].tolist()])
+	return paths
+
+
 # Testing
 if __name__ == "__main__":
 
@@ -133,6 +219,30 @@ if __name__ == "__main__":
 	print(np.array_equal(slow_L, faster_L))
 	print()
 
+	# Dijkstra's algorithm from every vertex, with nonnegative weights.
+	graph3 = generate_random_graph(n, 0.12, True, True, True, 0, 12)
+	D, Pi = dijkstra_apsp(graph3)
+	print(np.array_equal(D, faster_apsp(create_W(graph3.adjacency_matrix(), n), n)))
+	print(apsp_path(Pi, 0, n - 1, lambda v: v))
+	paths = apsp_paths(Pi, [0] * n, range(n), lambda v: v)
+	print(all(paths[v] == apsp_path(Pi, 0, v, lambda v: v) for v in range(n)))
+	print()
+
+	# A uint16 matrix, dense or sparse, gives the same distances as float64,
+	# with infinity for unreachable pairs rather than wrapped-around sums.
+	expected = None
+	for dtype, sparse in [(np.float64, False), (np.uint16, False), (np.uint16, True)]:
+		graph4 = AdjacencyMatrixGraph(4, True, True, dtype, sparse)
+		for edge in [(0, 1, 3), (1, 2, 4), (2, 3, 5)]:
+			graph4.insert_edge(*edge)
+		L = faster_apsp(create_W(graph4, 4), 4)
+		if expected is None:
+			expected = L
+			print(L[0], L[3])
+		else:
+			print(L.dtype, np.array_equal(L, expected))
+	print()
+
 	# Larger example.
 	n = 50
 	graph2 = generate_random_graph(n, 0.12, False, True, True, 0, 12)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# bfs.py
+
+from collections import deque
+from single_source_shortest_paths import initialize_single_source
+
+
+def uniform_weight(G):
+	"""Return the weight shared by every edge of G if all edges have the same
+	nonnegative weight, None otherwise or if G has no edges. An edge of an
+	unweighted graph has weight 1.
+
+	This looks at every edge, so a caller running many searches on the same
+	graph should call it once and pass the result on, as dijkstra_apsp does."""
+	weights = G.get_weights() if hasattr(G, "get_weights") else None
+	if weights is not None:
+		# A CSRGraph keeps all its weights in one array, so check them at once.
+		if len(weights) == 0 or weights[0] < 0 or not (weights == weights[0]).all():
+			return None
+		return weights[0].item()
+
+	weight = None
+	for u in range(G.get_card_V()):
+		for edge in G.get_adj_list(u):
+			edge_weight = edge.get_weight()
+			if edge_weight is None:
+				edge_weight = 1
+			if weight is None:
+				weight = edge_weight
+				if weight < 0:
+					return None
+			elif edge_weight != weight:
+				return None
+	return weight
+
+
+def bfs(G, s, target=None, weight=1):
+	"""Solve single-source shortest-paths problem when every edge has the same
+	weight, by breadth-first search. Vertices are discovered in order of the
+	number of edges from s, so each is final as soon as it is discovered.
+
+	Arguments:
+	G -- a graph
+	s -- index of source vertex
+	target -- optional index of a destination vertex. If given, the search stops
+	as soon as target is discovered, as in dijkstra.
+	weight -- weight of every edge, so that distances match those of dijkstra
+
+	Returns:
+	d -- distances from source vertex s
+	pi -- predecessors
+	"""
+	d, pi = initialize_single_source(G, s)
+	if s == target:
+		return d, pi
+
+	# A CSRGraph gives each vertex's targets as a list, with no Edge objects.
+	get_neighbors = getattr(G, "get_neighbors", None)
+
+	queue = deque([s])
+	while len(queue) > 0:
+		u = queue.popleft()
+		if get_neighbors is not None:
+			targets = get_neighbors(u)[0]
+		else:
+			targets = [edge.get_v() for edge in G.get_adj_list(u)]
+		for v in targets:
+			if d[v] == float('inf'):  # v has not been discovered yet
+				d[v] = d[u] + weight
+				pi[v] = u
+				if v == target:
+					return d, pi
+				queue.append(v)
+
+	return d, pi
+
+
+# Testing
+if __name__ == "__main__":
+
+	from Coursework.Task1.generate_random_graph import generate_random_graph
+	from dijkstra import dijkstra
+
+	# Stop-count graph, where every edge has weight 1.
+	card_V = 100
+	graph1 = generate_random_graph(card_V, 0.05, True, False, True, 1, 1)
+	print(uniform_weight(graph1))
+
+	# Breadth-first search should give the same distances as Dijkstra's algorithm.
+	all_equal = True
+	for s in range(card_V):
+		bfs_d, bfs_pi = bfs(graph1, s)
+		dijkstra_d, dijkstra_pi = dijkstra(graph1, s, priority_queue="heap")
+		if bfs_d != dijkstra_d:
+			print("Shortest-path distances mismatch for source vertex", s)
+			all_equal = False
+	print("All shortest-path distances are " + ("not " if not all_equal else "") + "equal")
+
+	# Graphs with different weights are not uniform.
+	graph2 = generate_random_graph(card_V, 0.05, True, False, True, 1, 10)
+	print(uniform_weight(graph2))
+
+	# Every edge of an unweighted graph has weight 1.
+	graph3 = generate_random_graph(card_V, 0.05, True, False, False)
+	print(uniform_weight(graph3))
+
+	# A CSRGraph's weights are checked as one array, with the same answers.
+	from csr_graph import CSRGraph
+	print([uniform_weight(CSRGraph.from_graph(graph)) for graph in (graph1, graph2, graph3)])
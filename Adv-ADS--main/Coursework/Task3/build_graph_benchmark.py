@@ -0,0 +1,63 @@
+import time
+import numpy as np
+import pandas as pd
+from adjacency_list_graph import AdjacencyListGraph
+from london_underground import build_graph
+
+
+# Function to build the graph the way Task 3A used to: one iterrows pass with a set of sorted
+# station pairs, keeping the shortest duration of each pair for a like-for-like comparison
+def build_graph_by_rows(underground_data):
+    stations = pd.concat([underground_data["Start"], underground_data["Destination"]]).unique()
+    station_index = {station: index for index, station in enumerate(stations)}
+    shortest = {}
+    for row_index, row in underground_data.iterrows():
+        start = station_index[row["Start"]]
+        end = station_index[row["Destination"]]
+        edge = (min(start, end), max(start, end))
+        if edge not in shortest or row["Duration"] < shortest[edge][2]:
+            shortest[edge] = (start, end, row["Duration"])
+    graph = AdjacencyListGraph(len(stations), directed=False, weighted=True)
+    for start, end, duration in shortest.values():
+        graph.insert_edge(start, end, weight=duration)
+    return graph, station_index, stations
+
+
+# Function to generate a timetable of random line sections between named stations, with repeats
+def generate_timetable(rows):
+    stations = np.array(["Station " + str(v) for v in range(rows // 4)])
+    starts = np.random.randint(0, len(stations), rows)
+    ends = (starts + np.random.randint(1, len(stations), rows)) % len(stations)
+    return pd.DataFrame({"Line": np.random.choice(["Central", "District", "Jubilee", "Victoria"], rows),
+                         "Start": stations[starts], "Destination": stations[ends],
+                         "Duration": np.random.randint(1, 11, rows).astype(float)})
+
+
+def measure(build, underground_data):
+    start_time = time.time()
+    graph, station_index, stations = build(underground_data)
+    return graph, (time.time() - start_time) * 1000  # Convert to milliseconds
+
+
+# Function to compare two graphs by their sets of weighted edges, ignoring adjacency-list order
+def same_edges(graph1, graph2):
+    return sorted(graph1.get_edge_list()) == sorted(graph2.get_edge_list()) and all(
+        graph1.find_edge(u, v).get_weight() == graph2.find_edge(u, v).get_weight() for u, v in graph1.get_edge_list())
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    # Row-by-row building beyond this many rows takes minutes, so it is skipped
+    row_limit = 100000
+    print(f"{'Rows':>9} {'Edges':>9} {'iterrows (ms)':>14} {'Vectorized (ms)':>16} {'Speedup':>8}")
+    for rows in [10000, 100000, 1000000]:
+        underground_data = generate_timetable(rows)
+        graph, vectorized_time = measure(build_graph, underground_data)
+        if rows > row_limit:
+            print(f"{rows:>9} {graph.get_card_E():>9} {'-':>14} {vectorized_time:>16.1f} {'-':>8}")
+            continue
+        reference, rows_time = measure(build_graph_by_rows, underground_data)
+        if not same_edges(graph, reference):
+            raise RuntimeError(f"Vectorized graph differs for {rows} rows")
+        print(f"{rows:>9} {graph.get_card_E():>9} {rows_time:>14.1f} {vectorized_time:>16.1f}"
+              f" {rows_time / vectorized_time:>7.1f}x")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# dary_priority_queue.py
+
+from indexed_priority_queue import IndexedMinPriorityQueue
+
+
+class DaryMinPriorityQueue(IndexedMinPriorityQueue):
+
+	def __init__(self, capacity, get_key_func=None, arity=4):
+		"""Initialize a minimum priority queue of the integers 0 to capacity - 1
+		implemented with a d-ary heap, in which each node has arity children.
+
+		A wider heap is shallower, so decrease_key, which sifts up, takes fewer
+		steps, while extract_min, which sifts down, compares more children at
+		each step. Dijkstra's algorithm makes more decrease_key calls than
+		extract_min calls on dense graphs, which favours arity 4 over 2.
+
+		Arguments:
+		capacity -- number of possible objects, which are 0 to capacity - 1
+		get_key_func -- optional function that returns the key of an object
+		when it is inserted, as in IndexedMinPriorityQueue
+		arity -- number of children of each node, at least 2
+		"""
+		if arity < 2:
+			raise RuntimeError("Heap arity must be at least 2, not " + str(arity) + ".")
+		IndexedMinPriorityQueue.__init__(self, capacity, get_key_func)
+		self.arity = arity
+
+	def sift_up(self, i):
+		"""Move the object at index i of the heap toward the root until its parent's key is no greater."""
+		heap = self.heap
+		position = self.position
+		keys = self.keys
+		arity = self.arity
+		x = heap[i]
+		k = keys[x]
+		while i > 0:
+			parent = (i - 1) // arity
+			y = heap[parent]
+			if keys[y] <= k:
+				break
+			heap[i] = y
+			position[y] = i
+			i = parent
+		heap[i] = x
+		position[x] = i
+
+	def sift_down(self, i):
+		"""Move the object at index i of the heap toward the leaves until no child's key is smaller."""
+		heap = self.heap
+		position = self.position
+		keys = self.keys
+		arity = self.arity
+		size = self.size
+		x = heap[i]
+		k = keys[x]
+		while True:
+			first = arity * i + 1
+			if first >= size:
+				break
+			# Pick the child with the smallest key.
+			child = first
+			smallest = keys[heap[first]]
+			for j in range(first + 1, min(first + arity, size)):
+				if keys[heap[j]] < smallest:
+					child = j
+					smallest = keys[heap[j]]
+			if smallest >= k:
+				break
+			y = heap[child]
+			heap[i] = y
+			position[y] = i
+			i = child
+		heap[i] = x
+		position[x] = i
+
+	def is_heap(self):
+		"""Verify that the heap property holds and the positions match the heap."""
+		for i in range(self.size):
+			if self.position[self.heap[i]] != i:
+				return False
+			if i > 0 and self.keys[self.heap[(i - 1) // self.arity]] > self.keys[self.heap[i]]:
+				return False
+		return True
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import randint, seed
+
+	# Extract objects in key order for several arities, after some decreases.
+	seed(0)
+	for arity in [2, 3, 4, 8]:
+		pq1 = DaryMinPriorityQueue(50, arity=arity)
+		for x in range(50):
+			pq1.insert(x, randint(0, 100))
+		for x in range(0, 50, 4):
+			pq1.decrease_key(x, pq1.get_key_of(x) - randint(0, 50))
+		heap_ok = pq1.is_heap()
+		extracted_keys = []
+		while pq1.get_size() > 0:
+			extracted_keys.append(pq1.get_key_of(pq1.extract_min()))
+		print(arity, heap_ok, extracted_keys == sorted(extracted_keys))
+
+	try:
+		DaryMinPriorityQueue(10, arity=1)
+	except RuntimeError as e:
+		print(e)
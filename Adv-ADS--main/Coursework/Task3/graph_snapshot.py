@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# graph_snapshot.py
+
+import os
+import json
+import struct
+import numpy as np
+from csr_graph import CSRGraph
+
+# A snapshot file starts with MAGIC, the format VERSION and the length of a JSON
+# header that gives the dtype, shape and file offset of each array. The arrays
+# follow, each starting on an ALIGNMENT boundary so that it can be memory-mapped.
+MAGIC = b"TUBEGRPH"
+VERSION = 1
+ALIGNMENT = 64
+PREFIX = struct.Struct("<8sII")
+
+
+class GraphSnapshot:
+
+	def __init__(self, arrays, directed, source_stamp=None, key=None):
+		"""Initialize a snapshot of a station graph. Use save and load, or
+		load_or_build, rather than calling this directly.
+
+		Arguments:
+		arrays -- dictionary of the arrays "stations", "sources", "targets" and
+		"weights", holding the station names and each edge once, and "offsets",
+		"adj_targets" and "adj_weights", holding the graph in CSRGraph form. A
+		graph with named weights has "weights:name" and "adj_weights:name" for
+		each name instead of "weights" and "adj_weights".
+		directed -- boolean indicating whether the graph is directed
+		source_stamp -- (size, modification time) of the file the snapshot was built from
+		key -- value identifying how the graph was built, see load_or_build
+		"""
+		self.arrays = arrays
+		self.directed = directed
+		self.source_stamp = source_stamp
+		self.key = key
+		self.weight_names = [name.split(":", 1)[1] for name in arrays if name.startswith("weights:")]
+		if self.weight_names:
+			adj_weights = {name: arrays["adj_weights:" + name] for name in self.weight_names}
+		else:
+			adj_weights = arrays["adj_weights"]
+		self.graph = CSRGraph(arrays["offsets"], arrays["adj_targets"], adj_weights, directed)
+		self.station_index = None
+
+	@staticmethod
+	def stamp(source_file):
+		"""Return the (size, modification time) of a file, used to tell whether it has changed."""
+		status = os.stat(source_file)
+		return [status.st_size, status.st_mtime_ns]
+
+	@staticmethod
+	def save(file, stations, sources, targets, weights, directed=False, source_file=None, key=None):
+		"""Write a snapshot of a graph to file. The file is written under a
+		temporary name and then renamed, so a process loading it never sees it
+		half written.
+
+		Arguments:
+		file -- name of the snapshot file
+		stations -- list of station names, indexed by vertex
+		sources, targets, weights -- arrays of the edges, each given once; weights
+		may be a dictionary of named arrays, as for CSRGraph
+		directed -- boolean indicating whether the graph is directed
+		source_file -- optional name of the file the graph was built from
+		key -- optional JSON value identifying how the graph was built
+		"""
+		graph = CSRGraph.from_edges(len(stations), sources, targets, weights, directed)
+		arrays = {"stations": np.asarray(stations, dtype=str),
+				  "sources": np.asarray(sources, dtype=np.int32),
+				  "targets": np.asarray(targets, dtype=np.int32),
+				  "offsets": graph.get_offsets(),
+				  "adj_targets": graph.get_targets()}
+		if isinstance(weights, dict):
+			for name, column in weights.items():
+				arrays["weights:" + name] = np.asarray(column)
+				arrays["adj_weights:" + name] = graph.select_weight(name).get_weights()
+		else:
+			arrays["weights"] = np.asarray(weights)
+			arrays["adj_weights"] = graph.get_weights()
+
+		# Lay out the arrays after the header, which is padded to its own boundary.
+		header = {"directed": directed, "arrays": {}, "key": key,
+				  "source": None if source_file is None else GraphSnapshot.stamp(source_file)}
+		layout = []
+		offset = 0
+		for name, array in arrays.items():
+			layout.append((offset, array))
+			header["arrays"][name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+			offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+		encoded = json.dumps(header).encode()
+		start = -(-(PREFIX.size + len(encoded)) // ALIGNMENT) * ALIGNMENT
+		encoded += b" " * (start - PREFIX.size - len(encoded))
+
+		temporary_file = file + ".tmp" + str(os.getpid())
+		with open(temporary_file, "wb") as output:
+			output.write(PREFIX.pack(MAGIC, VERSION, len(encoded)))
+			output.write(encoded)
+			for offset, array in layout:
+				output.seek(start + offset)
+				output.write(np.ascontiguousarray(array).tobytes())
+			output.truncate(start + offset + array.nbytes)
+		os.replace(temporary_file, file)
+
+	@staticmethod
+	def load(file):
+		"""Map a snapshot written by save into memory. The arrays are read-only
+		views of the file's pages rather than copies, so loading takes time
+		independent of the size of the graph and processes loading the same
+		snapshot share its memory."""
+		with open(file, "rb") as input:
+			prefix = input.read(PREFIX.size)
+			if len(prefix) < PREFIX.size or prefix[:len(MAGIC)] != MAGIC:
+				raise RuntimeError(str(file) + " is not a graph snapshot.")
+			magic, version, length = PREFIX.unpack(prefix)
+			if version != VERSION:
+				raise RuntimeError("Graph snapshot " + str(file) + " has version " + str(version)
+								   + ", expected " + str(VERSION) + ".")
+			header = json.loads(input.read(length))
+		start = PREFIX.size + length
+
+		arrays = {}
+		for name, spec in header["arrays"].items():
+			shape = tuple(spec["shape"])
+			if np.prod(shape) == 0:  # an empty file region cannot be mapped
+				arrays[name] = np.empty(shape, dtype=spec["dtype"])
+			else:
+				arrays[name] = np.memmap(file, dtype=spec["dtype"], mode="r", offset=start + spec["offset"],
+										 shape=shape)
+		return GraphSnapshot(arrays, header["directed"], header["source"], header["key"])
+
+	@staticmethod
+	def load_or_build(file, source_file, build_edges, directed=False, key=None):
+		"""Load the snapshot in file if it was built from the current version of
+		source_file with the same key. Otherwise build the graph again and save it first.
+
+		Arguments:
+		file -- name of the snapshot file
+		source_file -- name of the file the graph is built from
+		build_edges -- function returning (stations, sources, targets, weights)
+		read from source_file, as taken by save
+		directed -- boolean indicating whether the graph is directed
+		key -- optional JSON value identifying how the graph is built, such as
+		a hash of the building code, so that changing it rebuilds the snapshot
+		"""
+		if os.path.exists(file):
+			try:
+				snapshot = GraphSnapshot.load(file)
+				if snapshot.is_current(source_file) and snapshot.key == key:
+					return snapshot
+			except (RuntimeError, ValueError):
+				pass  # unreadable or from another version, so rebuild it
+		GraphSnapshot.save(file, *build_edges(), directed=directed, source_file=source_file, key=key)
+		return GraphSnapshot.load(file)
+
+	def is_current(self, source_file):
+		"""Return True if this snapshot was built from source_file as it is now."""
+		return self.source_stamp == GraphSnapshot.stamp(source_file)
+
+	def get_graph(self):
+		"""Return the graph as a CSRGraph over the mapped arrays."""
+		return self.graph
+
+	def get_stations(self):
+		"""Return the array of station names, indexed by vertex."""
+		return self.arrays["stations"]
+
+	def get_station_index(self):
+		"""Return a dictionary mapping each station name to its vertex."""
+		if self.station_index is None:
+			self.station_index = {station: index for index, station in enumerate(self.get_stations().tolist())}
+		return self.station_index
+
+	def get_edges(self):
+		"""Return the arrays of sources, targets and weights of the edges, each edge
+		given once, with the weights as a dictionary of arrays if they are named."""
+		if self.weight_names:
+			weights = {name: self.arrays["weights:" + name] for name in self.weight_names}
+		else:
+			weights = self.arrays["weights"]
+		return self.arrays["sources"], self.arrays["targets"], weights
+
+
+# Testing
+if __name__ == "__main__":
+
+	import tempfile
+	from Coursework.Task1.generate_random_graph import generate_random_graph
+	from all_pairs_shortest_paths import dijkstra_apsp
+
+	# A snapshot should load back as the same graph.
+	card_V = 100
+	graph1 = generate_random_graph(card_V, 0.05, True, False, True, 1, 10)
+	sources, targets, weights = zip(*[(u, edge.get_v(), edge.get_weight()) for u in range(card_V)
+									  for edge in graph1.get_adj_list(u) if u < edge.get_v()])
+	stations = ["Station " + str(v) for v in range(card_V)]
+	directory = tempfile.mkdtemp()
+	file = os.path.join(directory, "graph1.graph")
+	GraphSnapshot.save(file, stations, sources, targets, weights)
+	snapshot = GraphSnapshot.load(file)
+	print(isinstance(snapshot.get_graph().get_targets(), np.memmap))
+	print(snapshot.get_stations()[5], snapshot.get_station_index()["Station 5"])
+	print(np.array_equal(dijkstra_apsp(snapshot.get_graph())[0], dijkstra_apsp(graph1)[0]))
+
+	# Named weights are kept side by side.
+	GraphSnapshot.save(file, stations, sources, targets, {"duration": weights, "stops": np.ones(len(weights))})
+	snapshot = GraphSnapshot.load(file)
+	print(snapshot.get_graph().get_weight_names(), sorted(snapshot.get_edges()[2]))
+	print(np.array_equal(dijkstra_apsp(snapshot.get_graph(), weight="duration")[0], dijkstra_apsp(graph1)[0]))
+
+	# The snapshot is rebuilt only when the source file changes.
+	source_file = os.path.join(directory, "edges.txt")
+	with open(source_file, "w") as output:
+		output.write("A B 1\n")
+	builds = []
+	def build_edges():
+		builds.append(source_file)
+		with open(source_file) as input:
+			rows = [line.split() for line in input]
+		names = sorted(set(row[0] for row in rows) | set(row[1] for row in rows))
+		return (names, [names.index(row[0]) for row in rows], [names.index(row[1]) for row in rows],
+				[float(row[2]) for row in rows])
+	file = os.path.join(directory, "edges.graph")
+	for edges, key in [("A B 1\n", 1), ("A B 1\n", 1), ("A B 1\nB C 2\n", 1), ("A B 1\nB C 2\n", 2)]:
+		if edges != open(source_file).read():
+			with open(source_file, "w") as output:
+				output.write(edges)
+		snapshot = GraphSnapshot.load_or_build(file, source_file, build_edges, key=key)
+		print(len(builds), snapshot.get_graph().get_card_E(), snapshot.get_stations().tolist())
+
+	# A file in another format is rejected.
+	try:
+		GraphSnapshot.load(source_file)
+	except RuntimeError as e:
+		print(e)
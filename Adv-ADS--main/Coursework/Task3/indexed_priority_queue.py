@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# indexed_priority_queue.py
+
+
+class IndexedMinPriorityQueue:
+
+	def __init__(self, capacity, get_key_func=None):
+		"""Initialize a minimum priority queue of the integers 0 to capacity - 1,
+		such as the vertices of a graph, implemented with a binary heap.
+
+		Unlike MinHeapPriorityQueue, the queue keeps the key of each object
+		itself and finds objects in the heap by indexing, not hashing. The heap,
+		the position of each object in it and the key of each object are lists
+		allocated once, and sifting is iterative and compares keys directly,
+		with no function calls per comparison.
+
+		Arguments:
+		capacity -- number of possible objects, which are 0 to capacity - 1
+		get_key_func -- optional function that returns the key of an object
+		when it is inserted, so that the queue can stand in for a
+		MinHeapPriorityQueue. Otherwise pass the key to insert.
+		"""
+		self.get_key = get_key_func
+		self.heap = [0] * capacity
+		self.position = [-1] * capacity  # -1 for an object not in the queue
+		self.keys = [float('inf')] * capacity
+		self.size = 0
+
+	def get_size(self):
+		"""Return the number of objects in the priority queue."""
+		return self.size
+
+	def contains(self, x):
+		"""Return True if object x is in the priority queue."""
+		return self.position[x] >= 0
+
+	def get_key_of(self, x):
+		"""Return the key of object x."""
+		return self.keys[x]
+
+	def sift_up(self, i):
+		"""Move the object at index i of the heap toward the root until its parent's key is no greater."""
+		heap = self.heap
+		position = self.position
+		keys = self.keys
+		x = heap[i]
+		k = keys[x]
+		while i > 0:
+			parent = (i - 1) >> 1
+			y = heap[parent]
+			if keys[y] <= k:
+				break
+			heap[i] = y
+			position[y] = i
+			i = parent
+		heap[i] = x
+		position[x] = i
+
+	def sift_down(self, i):
+		"""Move the object at index i of the heap toward the leaves until no child's key is smaller."""
+		heap = self.heap
+		position = self.position
+		keys = self.keys
+		size = self.size
+		x = heap[i]
+		k = keys[x]
+		while True:
+			child = 2 * i + 1
+			if child >= size:
+				break
+			# Pick the child with the smaller key.
+			if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+				child += 1
+			y = heap[child]
+			if keys[y] >= k:
+				break
+			heap[i] = y
+			position[y] = i
+			i = child
+		heap[i] = x
+		position[x] = i
+
+	def insert(self, x, k=None):
+		"""Insert object x with key k, or with get_key_func(x) if k is not given."""
+		if self.position[x] >= 0:
+			raise RuntimeError("Object " + str(x) + " is already in the priority queue.")
+		self.keys[x] = self.get_key(x) if k is None else k
+		self.heap[self.size] = x
+		self.size += 1
+		self.sift_up(self.size - 1)
+
+	def minimum(self):
+		"""Return the object with the minimum key."""
+		if self.size <= 0:  # error if the queue is empty
+			raise RuntimeError("Heap underflow.")
+		return self.heap[0]
+
+	def extract_min(self):
+		"""Return and delete the object with the minimum key."""
+		top = self.minimum()
+		self.position[top] = -1
+		self.size -= 1
+		if self.size > 0:
+			# Move the last object to the root and restore the heap property.
+			self.heap[0] = self.heap[self.size]
+			self.sift_down(0)
+		return top
+
+	def decrease_key(self, x, k):
+		"""Decrease the key of object x to value k. Error if k is greater than x's current key."""
+		if k > self.keys[x]:
+			raise RuntimeError("Error in decrease_key: new key " + str(k)
+							   + " is greater than current key " + str(self.keys[x]))
+		self.keys[x] = k
+		self.sift_up(self.position[x])
+
+	def is_heap(self):
+		"""Verify that the heap property holds and the positions match the heap."""
+		for i in range(self.size):
+			if self.position[self.heap[i]] != i:
+				return False
+			if i > 0 and self.keys[self.heap[(i - 1) >> 1]] > self.keys[self.heap[i]]:
+				return False
+		return True
+
+	def __str__(self):
+		"""Return the objects in heap order."""
+		return str(self.heap[:self.size])
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import randint, seed
+
+	# Insert objects with random keys, decrease some, and extract them all in order.
+	seed(0)
+	pq1 = IndexedMinPriorityQueue(20)
+	for x in range(20):
+		pq1.insert(x, randint(0, 100))
+	print(pq1.is_heap())
+	for x in range(0, 20, 3):
+		pq1.decrease_key(x, pq1.get_key_of(x) - randint(0, 50))
+	print(pq1.is_heap())
+	extracted_keys = []
+	while pq1.get_size() > 0:
+		extracted_keys.append(pq1.get_key_of(pq1.extract_min()))
+	print(extracted_keys)
+	print(extracted_keys == sorted(extracted_keys))
+
+	# Keys can come from a function, as for MinHeapPriorityQueue.
+	d = [5, 3, 8, 1]
+	pq2 = IndexedMinPriorityQueue(4, lambda u: d[u])
+	for u in range(4):
+		pq2.insert(u)
+	d[2] = 0
+	pq2.decrease_key(2, d[2])
+	print([pq2.extract_min() for i in range(4)])
+
+	# Check errors.
+	try:
+		pq2.extract_min()
+	except RuntimeError as e:
+		print(e)
+	pq2.insert(1, 4)
+	try:
+		pq2.decrease_key(1, 9)
+	except RuntimeError as e:
+		print(e)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# ingest_cache.py
+
+import os
+import json
+import hashlib
+import inspect
+import numpy as np
+import pandas as pd
+
+# Caches written with another version are ignored and rebuilt.
+CACHE_VERSION = 1
+
+
+def file_stamp(file):
+	"""Return the [size, modification time] of a file, which tell cheaply whether it may have changed."""
+	status = os.stat(file)
+	return [status.st_size, status.st_mtime_ns]
+
+
+def file_hash(file):
+	"""Return the SHA-256 hash of the contents of a file."""
+	digest = hashlib.sha256()
+	with open(file, "rb") as input:
+		for block in iter(lambda: input.read(1 << 20), b""):
+			digest.update(block)
+	return digest.hexdigest()
+
+
+def function_hash(function):
+	"""Return a hash of the code of a function, which changes when the function is edited.
+	The source of the module defining the function is hashed too, so that editing
+	a helper it calls in the same module also changes the hash. Helpers imported
+	from other modules are not covered."""
+	code = function.__code__
+	digest = hashlib.sha256(code.co_code + repr((code.co_consts, code.co_names)).encode())
+	try:
+		digest.update(inspect.getsource(inspect.getmodule(function)).encode())
+	except (TypeError, OSError):
+		pass  # no source to hash, as for a function defined interactively
+	return digest.hexdigest()
+
+
+def save_table(cache_file, table, fingerprint):
+	"""Write a DataFrame to an .npz file, one array per column. Text columns are
+	stored as fixed-width strings, with a mask marking their missing values.
+	Columns mixing text with other values, such as numbers, are stored as JSON
+	so that each value reads back with its own type. Raise an error if a
+	column holds values that JSON cannot represent, such as dates.
+
+	Arguments:
+	cache_file -- name of the .npz file
+	table -- the DataFrame
+	fingerprint -- dictionary identifying the file the table was read from
+	"""
+	arrays = {"index": table.index.to_numpy()}
+	columns = []
+	for i, column in enumerate(table.columns):
+		values = table[column]
+		if pd.api.types.is_numeric_dtype(values):
+			arrays["column" + str(i)] = values.to_numpy()
+		elif all(isinstance(value, str) for value in values.dropna()):
+			missing = values.isna().to_numpy()
+			arrays["column" + str(i)] = np.asarray(values.where(~missing, "").tolist(), dtype=str)
+			arrays["missing" + str(i)] = missing
+		else:
+			try:
+				arrays["json" + str(i)] = json.dumps(values.tolist())
+			except TypeError:
+				raise RuntimeError("Column " + str(column) + " has values that cannot be cached.")
+		columns.append(column)
+	header = {"version": CACHE_VERSION, "columns": columns, "fingerprint": fingerprint}
+	temporary_file = cache_file + ".tmp" + str(os.getpid()) + ".npz"
+	np.savez(temporary_file, header=json.dumps(header), **arrays)
+	os.replace(temporary_file, cache_file)
+
+
+def load_table(cache_file):
+	"""Read a DataFrame written by save_table. Returns the DataFrame and its
+	fingerprint, or None and None if the file is unreadable or from another version."""
+	try:
+		with np.load(cache_file) as data:
+			header = json.loads(str(data["header"]))
+			if header["version"] != CACHE_VERSION:
+				return None, None
+			columns = {}
+			for i, column in enumerate(header["columns"]):
+				if "json" + str(i) in data:
+					values = np.empty(len(data["index"]), dtype=object)
+					values[:] = json.loads(str(data["json" + str(i)]))
+					columns[column] = values
+					continue
+				values = data["column" + str(i)]
+				if "missing" + str(i) in data:
+					values = values.astype(object)
+					values[data["missing" + str(i)]] = np.nan
+				columns[column] = values
+			return pd.DataFrame(columns, index=data["index"]), header["fingerprint"]
+	except (OSError, ValueError, KeyError):
+		return None, None
+
+
+def read_excel_cached(file, clean, cache_file=None, **read_options):
+	"""Return clean(pd.read_excel(file)), parsing the spreadsheet only when it has
+	changed since the last call. The cleaned table is cached in an .npz file
+	keyed by the size, modification time and content hash of the spreadsheet:
+	an unchanged size and time reuse the cache at once, and otherwise the
+	cache is still reused if the contents hash the same. Editing clean or its
+	module, or passing different read_options, also invalidates the cache.
+
+	Arguments:
+	file -- name of the Excel file
+	clean -- function that cleans the DataFrame read from file. The cache is
+	named after it, so different cleanings of the same file are kept apart.
+	cache_file -- name of the cache, default is file with the cleaning function's
+	name and .cache.npz in place of its extension
+	read_options -- further arguments to pd.read_excel, such as sheet_name
+	"""
+	if cache_file is None:
+		cache_file = os.path.splitext(file)[0] + "." + clean.__name__ + ".cache.npz"
+	stamp = file_stamp(file)
+	clean_hash = function_hash(clean)
+	options = json.dumps(read_options, sort_keys=True, default=repr)
+
+	table, fingerprint = load_table(cache_file) if os.path.exists(cache_file) else (None, None)
+	if table is not None and (fingerprint.get("clean") != clean_hash or fingerprint.get("options") != options):
+		table = None
+	if table is not None and fingerprint["stamp"] == stamp:
+		return table
+	content_hash = file_hash(file)
+	if table is not None and fingerprint["hash"] == content_hash:
+		# Touched but not changed, so only the stamp needs updating.
+		save_table(cache_file, table, {"stamp": stamp, "hash": content_hash, "clean": clean_hash, "options": options})
+		return table
+
+	table = clean(pd.read_excel(file, **read_options))
+	try:
+		save_table(cache_file, table, {"stamp": stamp, "hash": content_hash, "clean": clean_hash, "options": options})
+	except RuntimeError:
+		pass  # a table that cannot be cached is parsed again next time
+	return table
+
+
+# Testing
+if __name__ == "__main__":
+
+	import time
+	import shutil
+	import tempfile
+
+	def clean_rows(data):
+		data.columns = ["Line", "Start", "Destination", "Duration"]
+		return data.dropna(subset=["Duration", "Start", "Destination"]).drop_duplicates(subset=["Start", "Destination"])
+
+	# Work on a copy, so that touching it leaves the original alone.
+	directory = tempfile.mkdtemp()
+	file = os.path.join(directory, "underground.xlsx")
+	shutil.copy("London Underground data.xlsx", file)
+	expected = clean_rows(pd.read_excel(file))
+
+	# A cold load parses the spreadsheet, and a warm one reads the cache.
+	for load in ["Cold", "Warm"]:
+		start_time = time.time()
+		table = read_excel_cached(file, clean_rows)
+		print(load + " load: " + str(round((time.time() - start_time) * 1000, 1)) + " ms, same table: "
+			  + str(table.equals(expected)))
+
+	# Touching the file without changing it keeps the cache, found by its hash.
+	os.utime(file)
+	table = read_excel_cached(file, clean_rows)
+	print(load_table(os.path.splitext(file)[0] + ".clean_rows.cache.npz")[1]["stamp"] == file_stamp(file))
+	print(table.equals(expected))
+
+	# Reading other rows of the spreadsheet does not reuse the cached table.
+	table = read_excel_cached(file, clean_rows, nrows=200)
+	print(len(table) < len(expected), read_excel_cached(file, clean_rows).equals(expected))
+
+	# A column mixing numbers with text reads back with the same values and types.
+	def keep_rows(data):
+		return data
+
+	mixed_file = os.path.join(directory, "mixed.xlsx")
+	pd.DataFrame({"Line": ["A", "B", "C", "D"], "Code": [1, "x", 2.5, None]}).to_excel(mixed_file, index=False)
+	expected = pd.read_excel(mixed_file)
+	for load in ["Cold", "Warm"]:
+		table = read_excel_cached(mixed_file, keep_rows)
+		print(load + " load: same table: " + str(table.equals(expected)) + ", same types: "
+			  + str([type(value) for value in table["Code"]] == [type(value) for value in expected["Code"]]))
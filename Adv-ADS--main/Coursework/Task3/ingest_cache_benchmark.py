@@ -0,0 +1,51 @@
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from ingest_cache import read_excel_cached
+from london_underground import clean_data
+
+
+# Function to write a spreadsheet of random line sections in the Underground layout
+def write_timetable(file, rows):
+    stations = np.array(["Station " + str(v) for v in range(rows // 4)])
+    pd.DataFrame({"Line": np.random.choice(["Central", "District", "Jubilee", "Victoria"], rows),
+                  "Start": np.random.choice(stations, rows),
+                  "Destination": np.random.choice(stations, rows),
+                  "Duration": np.random.randint(1, 11, rows).astype(float)}).to_excel(file, index=False)
+
+
+def time_load(file):
+    start_time = time.time()
+    table = read_excel_cached(file, clean_data, sheet_name='Sheet1')
+    return table, (time.time() - start_time) * 1000  # Convert to milliseconds
+
+
+# Function to time a cold load, a warm load, and a load after the file is touched but not changed
+def compare_loads(file):
+    cold_table, cold_time = time_load(file)
+    warm_table, warm_time = time_load(file)
+    os.utime(file)
+    touched_table, touched_time = time_load(file)
+    if not (warm_table.equals(cold_table) and touched_table.equals(cold_table)):
+        raise RuntimeError(f"Cached table differs from the spreadsheet {file}")
+    return len(cold_table), cold_time, warm_time, touched_time
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    directory = tempfile.mkdtemp()
+    files = [("Underground", 'London Underground data.xlsx')]
+    for rows in [10000, 50000]:
+        files.append((str(rows), os.path.join(directory, f"timetable {rows}.xlsx")))
+        write_timetable(files[-1][1], rows)
+
+    print(f"{'Spreadsheet':>12} {'Rows':>7} {'Cold (ms)':>10} {'Warm (ms)':>10} {'Touched (ms)':>13}")
+    for name, file in files:
+        # Work on a copy, so that the cache starts cold and touching it leaves the original alone
+        copy = os.path.join(directory, "copy " + os.path.basename(file))
+        shutil.copy(file, copy)
+        rows, cold_time, warm_time, touched_time = compare_loads(copy)
+        print(f"{name:>12} {rows:>7} {cold_time:>10.1f} {warm_time:>10.1f} {touched_time:>13.1f}")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# line_graph.py
+
+import numpy as np
+from adjacency_list_graph import AdjacencyListGraph
+from csr_graph import CSRGraph
+from dijkstra import lazy_dijkstra
+from print_path import print_path
+
+
+class LineGraph:
+
+	def __init__(self, stations, lines, starts, ends, section_lines, durations, transfer_penalty=0):
+		"""Initialize a state-expanded graph of a network of lines, in which each
+		station is split into one node per line serving it, so that a route pays
+		for each change of line.
+
+		Nodes are numbered compactly. The card_N (station, line) nodes come
+		first, sorted by station and then by line, so that the nodes of station s
+		are station_offsets[s] <= x < station_offsets[s + 1]. Then come a
+		departure node for each station, card_N + s, and an arrival node for
+		each station, card_N + card_S + s. The edges are:
+		- a ride edge in each direction between (u, line) and (v, line) for each
+		section, with its duration, the shortest if the line runs it twice;
+		- a transfer edge from each node of a station to each other node of the
+		same station, with the station's transfer penalty;
+		- a boarding edge of weight 0 from each station's departure node to its
+		nodes, and an alighting edge of weight 0 from them to its arrival node.
+		A route from the departure node of s to the arrival node of t therefore
+		pays for every change of line but not for choosing the first line.
+
+		Arguments:
+		stations -- array of station names, indexed by station
+		lines -- array of line names, indexed by line
+		starts, ends -- arrays of the stations at the ends of each section
+		section_lines -- array of the line of each section
+		durations -- array of the duration of each section
+		transfer_penalty -- time to change lines, either one value for every
+		station or an array of a value for each station
+		"""
+		self.stations = np.asarray(stations)
+		self.lines = np.asarray(lines)
+		card_S = len(stations)
+		card_L = len(lines)
+		starts = np.asarray(starts, dtype=np.int64)
+		ends = np.asarray(ends, dtype=np.int64)
+		section_lines = np.asarray(section_lines, dtype=np.int64)
+		durations = np.asarray(durations, dtype=np.float64)
+
+		# Number the (station, line) pairs by sorting their codes station * card_L + line.
+		codes, nodes = np.unique(np.concatenate((starts * card_L + section_lines, ends * card_L + section_lines)),
+								 return_inverse=True)
+		self.node_stations = codes // card_L
+		self.node_lines = codes % card_L
+		self.card_N = card_N = len(codes)
+		self.station_offsets = np.searchsorted(self.node_stations, np.arange(card_S + 1))
+
+		# Ride edges, in both directions.
+		u, v = nodes[:len(starts)], nodes[len(starts):]
+		unique = AdjacencyListGraph.unique_edges(u, v, directed=False, weights=durations)
+		unique = unique[u[unique] != v[unique]]
+		sources = [u[unique], v[unique]]
+		targets = [v[unique], u[unique]]
+		weights = [durations[unique], durations[unique]]
+
+		# Transfer edges, from each node to every node of the same station but itself.
+		penalties = np.broadcast_to(np.asarray(transfer_penalty, dtype=np.float64), (card_S,))
+		counts = np.diff(self.station_offsets)[self.node_stations]
+		x = np.repeat(np.arange(card_N), counts)
+		first = np.repeat(np.cumsum(counts) - counts, counts)  # position in x of the first pair for each node
+		y = self.station_offsets[self.node_stations[x]] + np.arange(len(x)) - first
+		different = x != y
+		sources.append(x[different])
+		targets.append(y[different])
+		weights.append(penalties[self.node_stations[x[different]]])
+
+		# Boarding and alighting edges.
+		sources += [card_N + self.node_stations, np.arange(card_N)]
+		targets += [np.arange(card_N), card_N + card_S + self.node_stations]
+		weights += [np.zeros(card_N), np.zeros(card_N)]
+
+		self.graph = CSRGraph.from_edges(card_N + 2 * card_S, np.concatenate(sources), np.concatenate(targets),
+										 np.concatenate(weights), directed=True)
+
+	def get_graph(self):
+		"""Return the expanded graph as a directed CSRGraph."""
+		return self.graph
+
+	def get_card_N(self):
+		"""Return the number of (station, line) nodes."""
+		return self.card_N
+
+	def departure(self, s):
+		"""Return the node at which routes from station s start."""
+		return self.card_N + s
+
+	def arrival(self, t):
+		"""Return the node at which routes to station t end."""
+		return self.card_N + len(self.stations) + t
+
+	def node(self, s, line):
+		"""Return the node of station s on line, None if the line does not serve s."""
+		start, end = self.station_offsets[s], self.station_offsets[s + 1]
+		x = start + int(np.searchsorted(self.node_lines[start:end], line))
+		if x < end and self.node_lines[x] == line:
+			return x
+		return None
+
+	def get_station(self, x):
+		"""Return the station of any node."""
+		if x < self.card_N:
+			return int(self.node_stations[x])
+		return (x - self.card_N) % len(self.stations)
+
+	def get_line(self, x):
+		"""Return the line of a (station, line) node, None for a departure or arrival node."""
+		if x < self.card_N:
+			return int(self.node_lines[x])
+		return None
+
+	def collapse(self, path):
+		"""Collapse a path of nodes to the stations it passes through and the legs
+		ridden on each line.
+
+		Arguments:
+		path -- list of nodes, as returned by print_path
+
+		Returns:
+		stations -- list of the station names on the path, each change of line
+		at a station giving that station once
+		legs -- list of (line name, first station name, last station name) for
+		each stretch of the path on one line
+		"""
+		nodes = np.array([x for x in path if x < self.card_N], dtype=np.int64)
+		names = self.stations[self.node_stations[nodes]].tolist()
+		lines = self.node_lines[nodes].tolist()
+		line_names = self.lines[lines].tolist()
+		stations = []
+		legs = []
+		for i, station in enumerate(names):
+			if len(stations) == 0 or stations[-1] != station:
+				stations.append(station)
+			if i == 0 or lines[i] != lines[i - 1]:
+				legs.append([line_names[i], station, station])
+			else:
+				legs[-1][2] = station
+		# A leg that only changes lines at a station rides nowhere.
+		return stations, [tuple(leg) for leg in legs if leg[1] != leg[2]]
+
+	def shortest_path(self, s, t):
+		"""Return a fastest route from station s to station t, counting the
+		transfer penalty for each change of line.
+
+		Returns:
+		distance -- total time of the route, infinity if there is none
+		stations -- list of station names on the route, None if there is none
+		legs -- list of (line name, first station name, last station name) for
+		each stretch of the route on one line, None if there is none
+		"""
+		if s == t:
+			return 0.0, self.stations[s:s + 1].tolist(), []
+		target = self.arrival(t)
+		d, pi = lazy_dijkstra(self.graph, self.departure(s), target=target, priority_queue="bucket")
+		if d[target] == float('inf'):
+			return d[target], None, None
+		path = print_path(pi, self.departure(s), target, lambda x: x)
+		return d[target], *self.collapse(path)
+
+	def distances_from(self, s):
+		"""Return an array of the times of the fastest routes from station s to
+		every station, counting the transfer penalty for each change of line."""
+		d, pi = lazy_dijkstra(self.graph, self.departure(s), priority_queue="bucket")
+		d = np.asarray(d)
+		distances = d[self.card_N + len(self.stations):]
+		distances[s] = 0
+		return distances
+
+
+# Testing
+if __name__ == "__main__":
+
+	from dijkstra import shortest_path
+
+	# A and C are both on line X, but the fast way from A to C changes to line Y at B.
+	stations = np.array(["A", "B", "C"])
+	lines = np.array(["X", "Y"])
+	graph1 = LineGraph(stations, lines, [0, 1, 1], [1, 2, 2], [0, 0, 1], [2, 10, 3], transfer_penalty=4)
+	print(graph1.get_card_N(), graph1.get_graph().get_card_V())
+	print(graph1.node(1, 0), graph1.node(1, 1), graph1.node(0, 1))
+	print(graph1.shortest_path(0, 2))
+	print(graph1.distances_from(0))
+
+	# A penalty above the saving makes staying on line X faster.
+	graph2 = LineGraph(stations, lines, [0, 1, 1], [1, 2, 2], [0, 0, 1], [2, 10, 3], transfer_penalty=[0, 8, 0])
+	print(graph2.shortest_path(0, 2))
+	print(graph2.shortest_path(2, 0))
+
+	# With no transfer penalty, the times are those of the graph without lines.
+	rng = np.random.default_rng(0)
+	card_S, card_L = 60, 5
+	starts = rng.integers(0, card_S, 300)
+	ends = rng.integers(0, card_S, 300)
+	section_lines = rng.integers(0, card_L, 300)
+	durations = rng.integers(1, 10, 300)
+	graph3 = LineGraph(np.array(["S" + str(v) for v in range(card_S)]), np.array(["L" + str(l) for l in range(card_L)]),
+					   starts, ends, section_lines, durations)
+	keep = starts != ends
+	graph4 = AdjacencyListGraph.from_edges(card_S, starts[keep], ends[keep], durations[keep], directed=False,
+										   lightest=True)
+	print(all(graph3.shortest_path(0, t)[0] == shortest_path(graph4, 0, t)[0] for t in range(card_S)))
+
+	# A station with no route to it.
+	graph5 = LineGraph(np.array(["A", "B", "C", "D"]), lines, [0, 2], [1, 3], [0, 1], [1, 1])
+	print(graph5.shortest_path(0, 3))
@@ -0,0 +1,49 @@
+import time
+import numpy as np
+from dijkstra import shortest_path
+from london_underground import load_data, build_graph, build_line_graph
+
+
+# Function to time building a graph from the cleaned data
+def measure_build(build, *args):
+    start_time = time.time()
+    result = build(*args)
+    return result, (time.time() - start_time) * 1000  # Convert to milliseconds
+
+
+# Function to time point-to-point queries, returning the mean and worst time per query in milliseconds
+def measure_queries(query, pairs):
+    times = []
+    for s, t in pairs:
+        start_time = time.time()
+        query(s, t)
+        times.append((time.time() - start_time) * 1000)
+    return np.mean(times), np.max(times)
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    file = 'London Underground data.xlsx'
+    underground_data = load_data(file)
+    (graph, station_index, stations), build_time = measure_build(build_graph, underground_data)
+    pairs = np.random.randint(0, len(stations), (500, 2)).tolist()
+
+    print(f"{'Graph':>22} {'Nodes':>7} {'Edges':>7} {'Build (ms)':>11} {'Mean query (ms)':>16} {'Worst (ms)':>11}")
+    mean_time, worst_time = measure_queries(lambda s, t: shortest_path(graph, s, t), pairs)
+    print(f"{'Stations':>22} {graph.get_card_V():>7} {graph.get_card_E():>7} {build_time:>11.1f}"
+          f" {mean_time:>16.2f} {worst_time:>11.2f}")
+    for transfer_penalty in [0, 5]:
+        (line_graph, station_index, stations), build_time = measure_build(build_line_graph, underground_data,
+                                                                         transfer_penalty)
+        mean_time, worst_time = measure_queries(line_graph.shortest_path, pairs)
+        expanded = line_graph.get_graph()
+        print(f"{'Lines, ' + str(transfer_penalty) + ' min to change':>22} {expanded.get_card_V():>7}"
+              f" {expanded.get_card_E():>7} {build_time:>11.1f} {mean_time:>16.2f} {worst_time:>11.2f}")
+
+    # Changing lines now costs time, so some fastest routes get longer or stay on one line
+    s, t = station_index["Upminster"], station_index["Chesham"]
+    for transfer_penalty in [0, 5]:
+        line_graph = build_line_graph(underground_data, transfer_penalty)[0]
+        duration, path, legs = line_graph.shortest_path(s, t)
+        print(f"Upminster to Chesham with {transfer_penalty} min to change: {duration} minutes, {len(legs)} legs: "
+              + ", ".join(f"{line} from {start} to {end}" for line, start, end in legs))
@@ -0,0 +1,81 @@
+import os
+import numpy as np
+import pandas as pd
+from adjacency_list_graph import AdjacencyListGraph
+from line_graph import LineGraph
+from graph_snapshot import GraphSnapshot
+from ingest_cache import read_excel_cached, function_hash
+
+# The Underground graph carries these weights side by side, so each analysis
+# picks the one it needs from a single graph instead of building its own:
+# "duration" is the journey time of a section in minutes, "stops" is 1 per section,
+# and "line" is the id of the line running the section, an index into line_names.
+# Where several lines run the same section, "line" is that of the shortest.
+WEIGHTS = ["duration", "stops", "line"]
+
+
+def clean_data(underground_data):  # Labels the columns and clears empty rows; repeated sections are merged by build_edges
+    underground_data.columns = ["Line", "Start", "Destination", "Duration"]
+    return underground_data.dropna(subset=["Duration", "Start", "Destination"])
+
+
+def load_data(file):  # Loads the cleaned data, parsing the Excel file only when it has changed
+    return read_excel_cached(file, clean_data, sheet_name='Sheet1')
+
+
+def line_names(underground_data):  # Names of the lines, indexed by the "line" weight of build_edges
+    return pd.factorize(underground_data["Line"])[1].to_numpy()
+
+
+def build_edges(underground_data):  # Map stations to indices and keep each unique edge once, regardless of direction
+    # Factorize the station names into indices, in order of first appearance
+    codes, stations = pd.factorize(pd.concat([underground_data["Start"], underground_data["Destination"]]))
+    starts, ends = codes[:len(underground_data)], codes[len(underground_data):]
+    section_lines = pd.factorize(underground_data["Line"])[0]
+
+    # Where several lines run between the same stations, keep the shortest duration
+    durations = underground_data["Duration"].to_numpy()
+    unique = AdjacencyListGraph.unique_edges(starts, ends, directed=False, weights=durations)
+    weights = {"duration": durations[unique], "stops": np.ones(len(unique), dtype=int),
+               "line": section_lines[unique]}
+    return stations.to_numpy(), starts[unique], ends[unique], weights
+
+
+def build_graph(underground_data, weight="duration"):  # Build an Adjacency List graph weighted by one of WEIGHTS
+    if weight not in WEIGHTS:
+        raise RuntimeError(f"Unknown weight {weight}, expected one of {WEIGHTS}.")
+    stations, starts, ends, weights = build_edges(underground_data)
+    station_index = {station: index for index, station in enumerate(stations)}
+
+    # Load every edge in one pass
+    graph = AdjacencyListGraph.from_edges(len(stations), starts, ends, weights[weight], directed=False)
+
+    return graph, station_index, stations
+
+
+def load_graph(file):  # Maps the graph with all its weights from one snapshot, rebuilt from the Excel file only when the file changes
+    snapshot_file = os.path.splitext(file)[0] + '.graph'
+    snapshot = GraphSnapshot.load_or_build(snapshot_file, file, lambda: build_edges(load_data(file)),
+                                           key=function_hash(build_edges))
+    return snapshot.get_graph(), snapshot.get_station_index(), snapshot.get_stations()
+
+
+def build_line_graph(underground_data, transfer_penalty=0, station_penalties=None):  # Build a graph with a node per station and line, so changing lines costs a transfer penalty
+    codes, stations = pd.factorize(pd.concat([underground_data["Start"], underground_data["Destination"]]))
+    starts, ends = codes[:len(underground_data)], codes[len(underground_data):]
+    section_lines, lines = pd.factorize(underground_data["Line"])
+
+    # Stations named in station_penalties, such as long walking interchanges, override transfer_penalty
+    penalties = np.full(len(stations), float(transfer_penalty))
+    for station, penalty in (station_penalties or {}).items():
+        penalties[stations.get_loc(station)] = penalty
+
+    graph = LineGraph(stations.to_numpy(), lines.to_numpy(), starts, ends, section_lines,
+                      underground_data["Duration"].to_numpy(), penalties)
+    station_index = {station: index for index, station in enumerate(stations)}
+
+    return graph, station_index, stations.to_numpy()
+
+
+def load_line_graph(file, transfer_penalty=0, station_penalties=None):  # Loads the cleaned data and builds the line-aware graph from it
+    return build_line_graph(load_data(file), transfer_penalty, station_penalties)
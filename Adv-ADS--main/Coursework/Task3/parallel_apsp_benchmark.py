@@ -0,0 +1,51 @@
+import sys
+import time
+import random
+import numpy as np
+from multiprocessing import cpu_count
+from adjacency_list_graph import AdjacencyListGraph
+from all_pairs_shortest_paths import dijkstra_apsp
+from parallel_apsp import parallel_dijkstra_apsp
+
+
+# Function to generate a connected random network the same way as Task 1B:
+# a spanning path through all stations plus extra random edges
+def generate_network(network_size, edge_probability):
+    network = AdjacencyListGraph(network_size, directed=False, weighted=True)
+    for i in range(network_size - 1):
+        network.insert_edge(i, i + 1, weight=random.randint(1, 10))
+    for u in range(network_size):
+        for v in range(u + 2, network_size):
+            if random.random() <= edge_probability:
+                network.insert_edge(u, v, weight=random.randint(1, 10))
+    return network
+
+
+# Function to time the sequential all-pairs pass against the process pool
+def compare_parallel(network, processes):
+    start_time = time.time()
+    distances, predecessors = dijkstra_apsp(network)
+    sequential_time = time.time() - start_time
+
+    start_time = time.time()
+    parallel_distances, parallel_predecessors = parallel_dijkstra_apsp(network, processes)
+    parallel_time = time.time() - start_time
+
+    # Both runs must agree on every journey duration
+    if not np.array_equal(distances, parallel_distances):
+        raise RuntimeError("Mismatch between sequential and parallel journey durations")
+
+    return sequential_time, parallel_time
+
+
+if __name__ == "__main__":
+    # Network sizes may be given on the command line, e.g. 10000 20000
+    network_sizes = [int(size) for size in sys.argv[1:]] or [500, 1000, 2000]
+    processes = cpu_count()
+    print(f"Worker processes: {processes}")
+    print(f"{'Stations':>10} {'Edges':>8} {'Sequential (s)':>15} {'Parallel (s)':>13} {'Speedup':>8}")
+    for network_size in network_sizes:
+        network = generate_network(network_size, edge_probability=3 / network_size)
+        sequential_time, parallel_time = compare_parallel(network, processes)
+        print(f"{network_size:>10} {network.get_card_E():>8} {sequential_time:>15.2f} {parallel_time:>13.2f}"
+              f" {sequential_time / parallel_time:>7.2f}x")
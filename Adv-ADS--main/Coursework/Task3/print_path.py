@@ -42,9 +42,29 @@ def print_path(pi, s, v, mapping_func):
 	v: end vertex for the path
 	mapping_func: function to map vertex numbers to what they print as
 	"""
-	if v == s:
-		return [mapping_func(s)]
-	elif pi[v] is None:
-		return None
-	else:
-		return print_path(pi, s, pi[v], mapping_func) + [mapping_func(v)]
+	# Walk back from v iteratively, so long paths take linear time and cannot
+	# exceed the recursion limit.
+	path = []
+	for u in reverse_path(pi, s, v):
+		if u is None:
+			return None
+		path.append(mapping_func(u))
+	path.reverse()
+	return path
+
+
+def reverse_path(pi, s, v):
+	"""Lazily yield the vertices on a path from s to v in reverse order, from v
+	back to s. Yields None last if no path from s to v exists.
+
+	Inputs:
+	pi: vertex predecessors on the path from s to v
+	s: source vertex for the path
+	v: end vertex for the path
+	"""
+	yield v
+	while v != s:
+		v = pi[v]
+		yield v
+		if v is None:
+			return
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# priority_queues.py
+
+from min_heap_priority_queue import MinHeapPriorityQueue
+from indexed_priority_queue import IndexedMinPriorityQueue
+from dary_priority_queue import DaryMinPriorityQueue
+from pairing_heap_priority_queue import PairingHeapPriorityQueue
+from lazy_priority_queue import LazyMinPriorityQueue
+
+# A queue factory is called as factory(capacity, get_key_func) and returns an
+# empty minimum priority queue of the integers 0 to capacity - 1, such as the
+# vertices of a graph, whose keys are read with get_key_func when they are
+# inserted. The queue must provide get_size(), insert(x), extract_min() and
+# decrease_key(x, k). Dijkstra's algorithm and Prim's algorithm take any such
+# factory as queue_factory, or the name of one of these as priority_queue.
+QUEUE_FACTORIES = {
+	"indexed": IndexedMinPriorityQueue,
+	"4-ary": DaryMinPriorityQueue,
+	"pairing": PairingHeapPriorityQueue,
+	"lazy": LazyMinPriorityQueue,
+	"heap": lambda capacity, get_key_func: MinHeapPriorityQueue(get_key_func),
+}
+
+
+def get_queue_factory(name):
+	"""Return the queue factory called name in QUEUE_FACTORIES."""
+	if name not in QUEUE_FACTORIES:
+		raise RuntimeError("Unknown priority queue " + str(name) + ".")
+	return QUEUE_FACTORIES[name]
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import randint, seed
+
+	# Every backend extracts the same keys in the same order.
+	seed(0)
+	keys = [randint(0, 100) for x in range(100)]
+	decreases = [(x, randint(0, 50)) for x in range(0, 100, 3)]
+	for name, factory in QUEUE_FACTORIES.items():
+		current = list(keys)
+		queue = factory(len(keys), lambda x: current[x])
+		for x in range(len(keys)):
+			queue.insert(x)
+		for x, amount in decreases:
+			current[x] -= amount
+			queue.decrease_key(x, current[x])
+		extracted_keys = []
+		while queue.get_size() > 0:
+			extracted_keys.append(current[queue.extract_min()])
+		print(name, extracted_keys == sorted(current))
+
+	try:
+		get_queue_factory("fibonacci")
+	except RuntimeError as e:
+		print(e)
@@ -0,0 +1,54 @@
+import os
+import time
+import tempfile
+import numpy as np
+from dijkstra import dijkstra
+from graph_snapshot import GraphSnapshot
+from london_underground import load_data, build_edges, build_graph
+
+
+# Function to time loading a graph and answering one query from the first station
+def time_to_first_query(load):
+    start_time = time.time()
+    graph, station_index, stations = load()
+    load_time = time.time() - start_time
+    dijkstra(graph, 0, target=graph.get_card_V() - 1)
+    return load_time * 1000, (time.time() - start_time) * 1000  # Convert to milliseconds
+
+
+# Function to draw a connected random network with about extra_degree / 2 extra edges per station
+def random_edges(network_size, extra_degree):
+    extra = network_size * extra_degree // 2
+    starts = np.concatenate((np.arange(network_size - 1), np.random.randint(0, network_size - 1, extra)))
+    ends = np.concatenate((np.arange(1, network_size), np.random.randint(0, network_size - 1, extra)))
+    keep = starts != ends
+    stations = ["Station " + str(v) for v in range(network_size)]
+    return stations, starts[keep], ends[keep], np.random.randint(1, 11, keep.sum()).astype(float)
+
+
+def load_snapshot(file):
+    snapshot = GraphSnapshot.load(file)
+    return snapshot.get_graph(), snapshot.get_station_index(), snapshot.get_stations()
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    file = 'London Underground data.xlsx'
+    directory = tempfile.mkdtemp()
+    snapshot_file = os.path.join(directory, "underground.graph")
+
+    print(f"{'Graph':>12} {'Edges':>9} {'Load (ms)':>10} {'First query (ms)':>17}")
+    load_time, query_time = time_to_first_query(lambda: build_graph(load_data(file)))
+    print(f"{'Excel':>12} {'':>9} {load_time:>10.1f} {query_time:>17.1f}")
+    GraphSnapshot.save(snapshot_file, *build_edges(load_data(file)), source_file=file)
+    load_time, query_time = time_to_first_query(lambda: load_snapshot(snapshot_file))
+    print(f"{'Snapshot':>12} {'':>9} {load_time:>10.1f} {query_time:>17.1f}")
+
+    # Mapping takes the same time however large the graph; only the pages a query touches are read
+    for network_size in [10000, 100000, 1000000]:
+        stations, starts, ends, weights = random_edges(network_size, extra_degree=2)
+        GraphSnapshot.save(snapshot_file, stations, starts, ends, weights)
+        start_time = time.time()
+        graph = GraphSnapshot.load(snapshot_file).get_graph()
+        load_time = (time.time() - start_time) * 1000
+        print(f"{network_size:>12} {len(starts):>9} {load_time:>10.2f} {'':>17}")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# streaming_ingest.py
+
+import os
+import itertools
+import numpy as np
+import pandas as pd
+import openpyxl
+from adjacency_list_graph import AdjacencyListGraph
+
+# Columns of a timetable of line sections, in the layout of the Underground spreadsheet.
+COLUMNS = ["Line", "Start", "Destination", "Duration"]
+
+
+def read_csv_chunks(file, chunk_size=100000):
+	"""Yield the rows of a CSV timetable as DataFrames of at most chunk_size rows.
+	The first row is taken as a header, as pd.read_excel does."""
+	yield from pd.read_csv(file, header=0, names=COLUMNS, usecols=range(len(COLUMNS)), chunksize=chunk_size)
+
+
+def read_xlsx_chunks(file, chunk_size=100000, sheet_name=None):
+	"""Yield the rows of an Excel timetable as DataFrames of at most chunk_size
+	rows. The workbook is opened read-only, so rows are parsed as they are
+	reached rather than all at once. The first row is taken as a header, as
+	pd.read_excel does.
+
+	Arguments:
+	file -- name of the Excel file
+	chunk_size -- number of rows in each DataFrame
+	sheet_name -- name of the sheet, default is the first one
+	"""
+	workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+	try:
+		sheet = workbook.worksheets[0] if sheet_name is None else workbook[sheet_name]
+		rows = sheet.iter_rows(max_col=len(COLUMNS), values_only=True)
+		next(rows, None)  # skip the header
+		while True:
+			batch = list(itertools.islice(rows, chunk_size))
+			if len(batch) == 0:
+				break
+			yield pd.DataFrame(batch, columns=COLUMNS)
+	finally:
+		workbook.close()
+
+
+class StreamingEdgeBuilder:
+
+	def __init__(self):
+		"""Initialize a builder that takes a timetable a chunk at a time and keeps
+		only the stations and the shortest section between each pair of them, so
+		that its memory grows with the network rather than with the number of rows."""
+		# Each station gets a provisional id when first seen, renumbered by finish.
+		self.ids = {}
+		self.names = []
+		# Provisional ids in order of first appearance as a start and as a destination.
+		self.first_starts = []
+		self.first_destinations = []
+		self.seen_starts = set()
+		self.seen_destinations = set()
+		# The kept sections, with the row each came from.
+		self.sources = np.empty(0, dtype=np.int64)
+		self.targets = np.empty(0, dtype=np.int64)
+		self.weights = np.empty(0, dtype=np.float64)
+		self.positions = np.empty(0, dtype=np.int64)
+		self.card_rows = 0
+
+	def encode(self, stations, first_seen, seen):
+		"""Return an array of the provisional ids of a column of station names,
+		noting the stations that column shows for the first time."""
+		codes, uniques = pd.factorize(stations)
+		ids = np.empty(len(uniques), dtype=np.int64)
+		for code, name in enumerate(uniques.tolist()):
+			if name not in self.ids:
+				self.ids[name] = len(self.names)
+				self.names.append(name)
+			ids[code] = self.ids[name]
+			if ids[code] not in seen:
+				seen.add(ids[code])
+				first_seen.append(ids[code])
+		return ids[codes]
+
+	def add(self, chunk):
+		"""Add the sections in a DataFrame of timetable rows, dropping incomplete
+		rows and keeping the shortest section between each pair of stations."""
+		chunk = chunk.dropna(subset=["Duration", "Start", "Destination"])
+		# Factorizing all the starts before the destinations, as build_graph
+		# does, numbers stations by their first appearance as a start.
+		sources = self.encode(chunk["Start"], self.first_starts, self.seen_starts)
+		targets = self.encode(chunk["Destination"], self.first_destinations, self.seen_destinations)
+		positions = np.arange(self.card_rows, self.card_rows + len(chunk))
+		self.card_rows += len(chunk)
+
+		sources = np.concatenate((self.sources, sources))
+		targets = np.concatenate((self.targets, targets))
+		weights = np.concatenate((self.weights, pd.to_numeric(chunk["Duration"]).to_numpy(dtype=np.float64)))
+		positions = np.concatenate((self.positions, positions))
+		keep = AdjacencyListGraph.unique_edges(sources, targets, directed=False, weights=weights)
+		self.sources, self.targets = sources[keep], targets[keep]
+		self.weights, self.positions = weights[keep], positions[keep]
+
+	def finish(self):
+		"""Return the stations and the kept sections, numbered as build_edges in
+		london_underground would number them for the whole timetable.
+
+		Returns:
+		stations -- array of station names, indexed by vertex
+		sources, targets, weights -- arrays of the sections, in timetable order
+		"""
+		order = self.first_starts + [v for v in self.first_destinations if v not in self.seen_starts]
+		renumber = np.empty(len(order), dtype=np.int64)
+		renumber[order] = np.arange(len(order))
+		stations = np.array(self.names, dtype=object)[order]
+		rows = np.argsort(self.positions, kind="stable")
+		return stations, renumber[self.sources[rows]], renumber[self.targets[rows]], self.weights[rows]
+
+
+def stream_edges(file, chunk_size=100000):
+	"""Read a CSV or Excel timetable a chunk at a time and return its stations
+	and shortest sections, as StreamingEdgeBuilder.finish does."""
+	if os.path.splitext(file)[1].lower() == ".csv":
+		chunks = read_csv_chunks(file, chunk_size)
+	else:
+		chunks = read_xlsx_chunks(file, chunk_size)
+	builder = StreamingEdgeBuilder()
+	for chunk in chunks:
+		builder.add(chunk)
+	return builder.finish()
+
+
+def stream_graph(file, chunk_size=100000):
+	"""Build the same graph from a timetable as build_graph in london_underground, without
+	reading the whole file into memory. Returns the graph, the dictionary from
+	station names to vertices and the array of station names."""
+	stations, sources, targets, weights = stream_edges(file, chunk_size)
+	graph = AdjacencyListGraph.from_edges(len(stations), sources, targets, weights, directed=False)
+	return graph, {station: index for index, station in enumerate(stations)}, stations
+
+
+# Testing
+if __name__ == "__main__":
+
+	import tempfile
+
+	# The same graph as building from the whole table, for any chunk size.
+	file = "London Underground data.xlsx"
+	table = pd.read_excel(file)
+	table.columns = COLUMNS
+	table = table.dropna(subset=["Duration", "Start", "Destination"])
+	codes, stations = pd.factorize(pd.concat([table["Start"], table["Destination"]]))
+	expected = AdjacencyListGraph.from_edges(len(stations), codes[:len(table)], codes[len(table):],
+											 table["Duration"].to_numpy(), directed=False, lightest=True)
+	for chunk_size in [7, 100, 100000]:
+		graph, station_index, streamed_stations = stream_graph(file, chunk_size)
+		print(str(graph) == str(expected) and list(streamed_stations) == list(stations))
+
+	# A CSV copy streams to the same graph.
+	csv_file = os.path.join(tempfile.mkdtemp(), "underground.csv")
+	pd.read_excel(file).to_csv(csv_file, index=False)
+	graph, station_index, streamed_stations = stream_graph(csv_file, 50)
+	print(str(graph) == str(expected) and list(streamed_stations) == list(stations))
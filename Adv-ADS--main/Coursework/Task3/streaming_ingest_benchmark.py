@@ -0,0 +1,68 @@
+import os
+import time
+import tempfile
+import multiprocessing
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from streaming_ingest import COLUMNS, stream_edges
+from london_underground import clean_data, build_edges
+
+
+# Function to write a CSV timetable that repeats the sections of a fixed network many times,
+# so that the graph stays the same size while the file grows
+def write_timetable(file, rows, network_size=5000, sections=30000):
+    stations = np.array(["Station " + str(v) for v in range(network_size)])
+    starts = np.random.randint(0, network_size, sections)
+    ends = (starts + np.random.randint(1, network_size, sections)) % network_size
+    picks = np.random.randint(0, sections, rows)
+    pd.DataFrame({"Line": "Central", "Start": stations[starts[picks]], "Destination": stations[ends[picks]],
+                  "Duration": np.random.randint(1, 11, rows).astype(float)}).to_csv(file, index=False)
+
+
+def read_whole(file):  # Read the whole file into one DataFrame, then build the edges as Task 3A does
+    underground_data = pd.read_csv(file, header=0, names=COLUMNS)
+    stations, sources, targets, weights = build_edges(clean_data(underground_data))
+    return stations, sources, targets, weights["duration"]
+
+
+def read_streaming(file):
+    return stream_edges(file, chunk_size=100000)
+
+
+# Function to read the peak resident set size of this process in megabytes (Linux only)
+def peak_memory():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+
+
+# Function run in a fresh process, so that its peak resident set size belongs to this ingest alone
+def measure(read, file):
+    start_time = time.time()
+    stations, sources, targets, weights = read(file)
+    elapsed = (time.time() - start_time) * 1000  # Convert to milliseconds
+    peak = peak_memory()
+    return len(stations), len(sources), float(weights.sum()), elapsed, peak
+
+
+def measure_in_process(read, file):
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(measure, read, file).result()
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    directory = tempfile.mkdtemp()
+    print(f"{'Rows':>9} {'Edges':>7} {'Whole (ms)':>11} {'Whole (MB)':>11} {'Stream (ms)':>12} {'Stream (MB)':>12}")
+    for rows in [250000, 1000000, 2000000]:
+        file = os.path.join(directory, f"timetable {rows}.csv")
+        np.random.seed(0)
+        write_timetable(file, rows)
+        whole = measure_in_process(read_whole, file)
+        streaming = measure_in_process(read_streaming, file)
+        if whole[:3] != streaming[:3]:
+            raise RuntimeError(f"Streamed edges differ for {rows} rows")
+        print(f"{rows:>9} {whole[1]:>7} {whole[3]:>11.0f} {whole[4]:>11.0f} {streaming[3]:>12.0f} {streaming[4]:>12.0f}")
+        os.remove(file)
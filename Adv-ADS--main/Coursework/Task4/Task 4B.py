@@ -1,48 +1,9 @@
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-from adjacency_list_graph import AdjacencyListGraph
+from london_underground import FormatData
 from mst import kruskal
-from dijkstra import dijkstra
-from print_path import print_path
-
-
-class FormatData:
-    def __init__(self, file):
-        self.file = file
-        self.cleaned_data = None
-        self.stations = None
-        self.station_index = {}
-        self.graph = None
-        self.num_of_stations = 0
-        self.edges = []
-
-    def load_and_clean_data(self):
-        # Load and clean the Excel data
-        underground_data = pd.read_excel(self.file)
-        underground_data.columns = ['Line', 'Starting Station', 'Destination', 'Journey Time']
-        self.cleaned_data = underground_data.dropna(subset=['Line', 'Starting Station', 'Destination', 'Journey Time'])
-
-    def build_graph(self):
-        # Sort and index stations deterministically
-        self.stations = sorted(set(self.cleaned_data['Starting Station']).union(set(self.cleaned_data['Destination'])))
-
-        # Assigning indices to stations
-        for index, station in enumerate(self.stations):
-            self.station_index[station] = index
-
-        self.num_of_stations = len(self.stations)
-
-        # Initialize the adjacency list graph with weighted edges
-        self.graph = AdjacencyListGraph(self.num_of_stations, weighted=True, directed=False)
-
-        # Insert edges into the graph and sort them
-        for row_index, row in self.cleaned_data.iterrows():
-            start_key = self.station_index[row['Starting Station']]
-            end_key = self.station_index[row['Destination']]
-            weight = row['Journey Time']
-            if not self.graph.has_edge(start_key, end_key):
-                self.graph.insert_edge(start_key, end_key, weight)
-                self.edges.append((start_key, end_key, weight))
+from all_pairs_shortest_paths import apsp_path
+from parallel_apsp import parallel_dijkstra_apsp
 
 
 class MinimizingLineSections:
@@ -63,26 +24,26 @@ class PathFinder:
     def __init__(self, graph, stations):
         self.graph = graph
         self.stations = stations
+        self.distances = None
+        self.predecessors = None
+
+    # Run Dijkstra's algorithm from every station once, on all cores for a large network, shared by all the queries below
+    def all_pairs(self):
+        if self.distances is None:
+            self.distances, self.predecessors = parallel_dijkstra_apsp(self.graph)
+        return self.distances, self.predecessors
 
     def find_all_journey_durations(self):
-        all_durations = []
-        for start in range(len(self.stations)):
-            distances, predecessors = dijkstra(self.graph, start)
-            for end in range(start + 1, len(self.stations)):
-                if distances[end] != float('inf'):
-                    all_durations.append(distances[end])
-        return all_durations
+        distances, predecessors = self.all_pairs()
+        durations = distances[np.triu_indices(len(self.stations), 1)]
+        return durations[durations != float('inf')].tolist()
 
     def find_longest_journey(self):
-        max_duration = -1
-        longest_path = None
-        for start in range(len(self.stations)):
-            distances, predecessors = dijkstra(self.graph, start)
-            for end, duration in enumerate(distances):
-                if duration > max_duration and duration != float('inf'):
-                    max_duration = duration
-                    longest_path = print_path(predecessors, start, end, lambda x: self.stations[x])
-        return max_duration, longest_path
+        distances, predecessors = self.all_pairs()
+        reachable = np.where(distances != float('inf'), distances, -1)
+        start, end = np.unravel_index(np.argmax(reachable), reachable.shape)
+        longest_path = apsp_path(predecessors, start, end, lambda x: self.stations[x])
+        return distances[start, end].item(), longest_path
 
 
 def plot_histogram(all_durations):
@@ -97,8 +58,7 @@ def plot_histogram(all_durations):
 
 def main(file):
     formatter = FormatData(file)
-    formatter.load_and_clean_data()
-    formatter.build_graph()
+    formatter.load_graph()
 
     # Generate MST and get closed sections
     minimizer = MinimizingLineSections(formatter)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# bucket_priority_queue.py
+
+
+class BucketPriorityQueue:
+
+	def __init__(self, get_key_func, max_weight):
+		"""Initialize a monotone minimum priority queue implemented with Dial's
+		circular array of buckets, for nonnegative integer keys.
+
+		Bucket i holds the objects whose key is congruent to i modulo
+		max_weight + 1. As in Dijkstra's algorithm, the keys in the queue must
+		always lie between the last key extracted and that key plus max_weight,
+		so each bucket holds objects of a single key and extract_min only has
+		to scan forward from the last bucket it emptied. Objects whose key is
+		infinite wait outside the buckets until their key is decreased.
+
+		Arguments:
+		get_key_func -- required function that returns the key for the
+		objects stored
+		max_weight -- largest amount by which a key may exceed the last key extracted
+		"""
+		self.get_key = get_key_func
+		self.num_buckets = max_weight + 1
+		# Each bucket is a dictionary used as an insertion-ordered set.
+		self.buckets = [{} for i in range(self.num_buckets)]
+		# Dictionary to map objects to their bucket, None for an infinite key.
+		self.bucket_of = {}
+		self.unreached = {}
+		self.current = 0  # index of the bucket holding the smallest finite key
+		self.size = 0
+
+	def get_size(self):
+		"""Return the number of objects in the priority queue."""
+		return self.size
+
+	def place(self, x, k):
+		"""Put object x into the bucket for key k."""
+		if k == float('inf'):
+			self.unreached[x] = None
+			self.bucket_of[x] = None
+		else:
+			i = int(k) % self.num_buckets
+			self.buckets[i][x] = None
+			self.bucket_of[x] = i
+
+	def remove(self, x):
+		"""Take object x out of its bucket."""
+		i = self.bucket_of.pop(x)
+		if i is None:
+			del self.unreached[x]
+		else:
+			del self.buckets[i][x]
+
+	def insert(self, x):
+		"""Insert x into the priority queue."""
+		self.place(x, self.get_key(x))
+		self.size += 1
+
+	def minimum(self):
+		"""Return an object with the minimum key."""
+		if self.size <= 0:  # error if the queue is empty
+			raise RuntimeError("Bucket queue underflow.")
+		if len(self.unreached) == self.size:  # only infinite keys remain
+			return next(iter(self.unreached))
+		# Scan forward to the next nonempty bucket. Keys never fall below the
+		# last one extracted, so buckets passed over stay empty.
+		while len(self.buckets[self.current]) == 0:
+			self.current = (self.current + 1) % self.num_buckets
+		return next(iter(self.buckets[self.current]))
+
+	def extract_min(self):
+		"""Return and delete an object with the minimum key."""
+		x = self.minimum()
+		self.remove(x)
+		self.size -= 1
+		return x
+
+	def decrease_key(self, x, k):
+		"""Move object x to the bucket for its new key k, which get_key_func
+		must already return."""
+		self.remove(x)
+		self.place(x, k)
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import randint
+
+	# Simulate the keys seen by Dijkstra's algorithm: every new key is at most
+	# max_weight more than the last key extracted.
+	max_weight = 7
+	keys = {0: 0}
+	pq1 = BucketPriorityQueue(lambda x: keys[x], max_weight)
+	pq1.insert(0)
+	for x in range(1, 20):
+		keys[x] = float('inf')
+		pq1.insert(x)
+	extracted_keys = []
+	next_object = 1
+	while pq1.get_size() > 0:
+		x = pq1.extract_min()
+		extracted_keys.append(keys[x])
+		if keys[x] == float('inf'):
+			continue
+		for i in range(2):
+			if next_object < 20:
+				keys[next_object] = keys[x] + randint(0, max_weight)
+				pq1.decrease_key(next_object, keys[next_object])
+				next_object += 1
+	print(extracted_keys)
+	print(extracted_keys == sorted(extracted_keys))
+
+	# Check extract_min in an empty priority queue.
+	try:
+		pq1.extract_min()
+	except RuntimeError as e:
+		print(e)
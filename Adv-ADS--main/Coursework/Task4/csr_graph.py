@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# csr_graph.py
+
+import numpy as np
+from adjacency_list_graph import Edge
+
+
+class CSRGraph:
+
+	def __init__(self, offsets, targets, weights=None, directed=True):
+		"""Initialize an immutable graph in compressed sparse row form. Use
+		from_graph or from_edges rather than calling this directly.
+
+		The edges leaving vertex u are (u, targets[i]) with weight weights[i] for
+		offsets[u] <= i < offsets[u + 1], sorted by target. An undirected graph
+		stores each edge in both directions, as AdjacencyListGraph does.
+
+		Arguments:
+		offsets -- array of card_V + 1 start positions into targets and weights
+		targets -- array of the vertex each edge enters
+		weights -- array of edge weights, None for an unweighted graph, or a
+		dictionary of named arrays for a graph with several weights on each
+		edge, such as duration and stops. The first named weight is used until
+		select_weight picks another.
+		directed -- boolean indicating whether the graph is directed
+		"""
+		self.offsets = offsets
+		self.targets = targets
+		if isinstance(weights, dict):
+			self.weight_columns = weights
+			weights = next(iter(weights.values()), None)
+		else:
+			self.weight_columns = {}
+		self.weights = weights
+		self.directed = directed
+		for array in [offsets, targets, weights] + list(self.weight_columns.values()):
+			if array is not None:
+				array.flags.writeable = False
+
+	@staticmethod
+	def from_edges(card_V, sources, targets, weights=None, directed=True):
+		"""Build a graph from arrays of edges (sources[i], targets[i]) with
+		weights[i]. For an undirected graph each edge is given once.
+
+		Arguments:
+		card_V -- number of vertices
+		sources, targets -- arrays of edge endpoints
+		weights -- array of edge weights, None for an unweighted graph, or a
+		dictionary of named arrays of edge weights
+		directed -- boolean indicating whether the graph is directed
+		"""
+		sources = np.asarray(sources, dtype=np.int32)
+		targets = np.asarray(targets, dtype=np.int32)
+		columns = weights if isinstance(weights, dict) else {None: weights}
+		columns = {name: None if column is None else np.asarray(column) for name, column in columns.items()}
+		if not directed:
+			sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+			columns = {name: None if column is None else np.concatenate((column, column))
+					   for name, column in columns.items()}
+
+		# Sort by source, then by target within each source.
+		order = np.lexsort((targets, sources))
+		offsets = np.zeros(card_V + 1, dtype=np.int64)
+		np.cumsum(np.bincount(sources, minlength=card_V), out=offsets[1:])
+		columns = {name: None if column is None else column[order] for name, column in columns.items()}
+		return CSRGraph(offsets, targets[order], columns if isinstance(weights, dict) else columns[None], directed)
+
+	@staticmethod
+	def from_graph(G):
+		"""Build a graph with the same vertices and edges as G."""
+		card_V = G.get_card_V()
+		sources, targets, weights = [], [], []
+		for u in range(card_V):
+			for edge in G.get_adj_list(u):
+				v = edge.get_v()
+				if G.is_directed() or u < v:
+					sources.append(u)
+					targets.append(v)
+					if G.is_weighted():
+						weights.append(edge.get_weight())
+		return CSRGraph.from_edges(card_V, sources, targets, weights if G.is_weighted() else None,
+								   G.is_directed())
+
+	def get_card_V(self):
+		"""Return the number of vertices in this graph."""
+		return len(self.offsets) - 1
+
+	def get_card_E(self):
+		"""Return the number of edges in this graph."""
+		return len(self.targets) if self.directed else len(self.targets) // 2
+
+	def get_offsets(self):
+		"""Return the array of start positions of each vertex's edges."""
+		return self.offsets
+
+	def get_targets(self):
+		"""Return the array of the vertex each edge enters."""
+		return self.targets
+
+	def get_weights(self):
+		"""Return the array of edge weights, None for an unweighted graph."""
+		return self.weights
+
+	def get_weight_names(self):
+		"""Return the list of names of the weights on each edge, empty unless the weights are named."""
+		return list(self.weight_columns)
+
+	def select_weight(self, name):
+		"""Return a graph sharing this graph's arrays that uses the weights named name."""
+		if name not in self.weight_columns:
+			raise RuntimeError("Graph has no weight named " + str(name) + ".")
+		graph = CSRGraph(self.offsets, self.targets, self.weight_columns, self.directed)
+		graph.weights = self.weight_columns[name]
+		return graph
+
+	def is_directed(self):
+		"""Return a boolean indicating whether this graph is directed."""
+		return self.directed
+
+	def is_weighted(self):
+		"""Return a boolean indicating whether this graph is weighted."""
+		return self.weights is not None
+
+	def get_adj_list(self, u):
+		"""Return an iterator over Edge objects for the edges leaving vertex u."""
+		start, end = self.offsets[u], self.offsets[u + 1]
+		targets = self.targets[start:end].tolist()
+		if self.weights is None:
+			return map(Edge, targets)
+		return map(Edge, targets, self.weights[start:end].tolist())
+
+	def get_neighbors(self, u):
+		"""Return lists of the targets and the weights of the edges leaving vertex
+		u, read straight from the arrays with no Edge objects, for the search loops
+		in dijkstra and bfs. An unweighted graph's edges have weight 1."""
+		start, end = self.offsets[u], self.offsets[u + 1]
+		targets = self.targets[start:end].tolist()
+		if self.weights is None:
+			return targets, [1] * len(targets)
+		return targets, self.weights[start:end].tolist()
+
+	def find_edge(self, u, v):
+		"""Return an Edge object for edge (u, v) if (u, v) is in this graph, None otherwise.
+		Takes O(log deg(u)) time by binary search."""
+		start, end = self.offsets[u], self.offsets[u + 1]
+		i = start + np.searchsorted(self.targets[start:end], v)
+		if i == end or self.targets[i] != v:
+			return None
+		return Edge(v, None if self.weights is None else self.weights[i].item())
+
+	def has_edge(self, u, v):
+		"""Return True if edge (u, v) is in this graph, False otherwise."""
+		return self.find_edge(u, v) is not None
+
+	def get_edge_list(self):
+		"""Return a Python list containing the edges of this graph."""
+		edge_list = []
+		for u in range(self.get_card_V()):
+			for v in self.targets[self.offsets[u]:self.offsets[u + 1]].tolist():
+				if self.directed or u < v:
+					edge_list.append((u, v))
+		return edge_list
+
+	def __str__(self):
+		"""Return the adjacency lists formatted as a string."""
+		result = ""
+		for u in range(self.get_card_V()):
+			result += str(u) + ": "
+			for edge in self.get_adj_list(u):
+				result += str(edge) + " "
+			result += "\n"
+		return result
+
+
+# Testing
+if __name__ == "__main__":
+
+	from generate_random_graph import generate_random_graph
+	from dijkstra import dijkstra, lazy_dijkstra
+
+	# Converting a graph keeps its edges.
+	graph1 = generate_random_graph(10, 0.3, True, False, True, 1, 9)
+	csr1 = CSRGraph.from_graph(graph1)
+	print(csr1)
+	print(csr1.get_card_E() == graph1.get_card_E())
+	print(sorted(csr1.get_edge_list()) == sorted(graph1.get_edge_list()))
+	print(all(csr1.has_edge(u, v) == graph1.has_edge(u, v) for u in range(10) for v in range(10)))
+
+	# Dijkstra's algorithm gives the same distances on both representations.
+	card_V = 100
+	graph2 = generate_random_graph(card_V, 0.05, True, True, True, 0, 15)
+	csr2 = CSRGraph.from_graph(graph2)
+	print(all(dijkstra(graph2, s)[0] == dijkstra(csr2, s)[0] for s in range(card_V)))
+	print(all(dijkstra(graph2, s, priority_queue=queue)[0] == dijkstra(csr2, s, priority_queue=queue)[0]
+			  and lazy_dijkstra(graph2, s, priority_queue=queue)[0] == lazy_dijkstra(csr2, s, priority_queue=queue)[0]
+			  for s in range(card_V) for queue in ["heap", "bucket"]))
+
+	# Building from edge arrays.
+	csr3 = CSRGraph.from_edges(4, [0, 1, 2], [1, 2, 3], [5, 6, 7], directed=False)
+	print(csr3)
+	print(csr3.find_edge(2, 1).get_weight())
+
+	# Named weights share one structure, selected at query time.
+	csr4 = CSRGraph.from_edges(4, [0, 1, 2, 0], [1, 2, 3, 3], {"duration": [5, 6, 7, 20], "stops": [1, 1, 1, 1]},
+							   directed=False)
+	print(csr4.get_weight_names())
+	print(dijkstra(csr4, 0)[0], dijkstra(csr4, 0, weight="stops")[0])
+	print(csr4.select_weight("stops").get_targets() is csr4.get_targets())
@@ -30,16 +30,93 @@
 #                                                                       #
 #########################################################################
 
+import numpy as np
 from single_source_shortest_paths import initialize_single_source, relax
-from min_heap_priority_queue import MinHeapPriorityQueue
+from bucket_priority_queue import BucketPriorityQueue
+from priority_queues import get_queue_factory
+from bfs import bfs, uniform_weight
+from print_path import print_path
 
+# Largest edge weight for which a bucket queue is used. Above it, scanning
+# empty buckets would cost more than the heap operations it saves.
+MAX_BUCKET_WEIGHT = 1000
 
-def dijkstra(G, s):
+
+def bucket_max_weight(G):
+	"""Return the largest edge weight in G if every weight is a nonnegative
+	integer no greater than MAX_BUCKET_WEIGHT, None otherwise."""
+	weights = G.get_weights() if hasattr(G, "get_weights") else None
+	if weights is not None:
+		# A CSRGraph keeps all its weights in one array, so check them at once.
+		if len(weights) == 0:
+			return 0
+		if weights.min() < 0 or weights.max() > MAX_BUCKET_WEIGHT or not np.all(weights == np.floor(weights)):
+			return None
+		return int(weights.max())
+
+	max_weight = 0
+	for u in range(G.get_card_V()):
+		for edge in G.get_adj_list(u):
+			weight = edge.get_weight()
+			if weight < 0 or weight > MAX_BUCKET_WEIGHT or weight != int(weight):
+				return None
+			max_weight = max(max_weight, int(weight))
+	return max_weight
+
+
+def select_weight(G, weight):
+	"""Return G with its edges weighted by the weight named weight, for a graph
+	with several named weights on each edge such as a CSRGraph built from a
+	dictionary of weights, or G itself if weight is None."""
+	if weight is None:
+		return G
+	if not hasattr(G, "select_weight"):
+		raise RuntimeError("Graph has no named weights to select " + str(weight) + " from.")
+	return G.select_weight(weight)
+
+
+def make_priority_queue(G, d, priority_queue, queue_factory=None):
+	"""Return an empty priority queue keyed by d for Dijkstra's algorithm on G.
+
+	Arguments:
+	G -- a directed, weighted graph
+	d -- distances, used as keys
+	priority_queue -- the name of a queue in priority_queues.QUEUE_FACTORIES:
+	"indexed" for an IndexedMinPriorityQueue over the vertices, "4-ary",
+	"pairing", "lazy" or "heap" for a MinHeapPriorityQueue. Or "bucket" for a
+	BucketPriorityQueue, which falls back to an IndexedMinPriorityQueue unless
+	all weights of G are small nonnegative integers.
+	queue_factory -- optional queue factory, as described in priority_queues,
+	used instead of priority_queue
+	"""
+	if queue_factory is not None:
+		return queue_factory(G.get_card_V(), lambda u: d[u])
+	if priority_queue == "bucket":
+		max_weight = bucket_max_weight(G)
+		if max_weight is not None:
+			return BucketPriorityQueue(lambda u: d[u], max_weight)
+		priority_queue = "indexed"
+	return get_queue_factory(priority_queue)(G.get_card_V(), lambda u: d[u])
+
+
+def dijkstra(G, s, target=None, priority_queue="indexed", weight=None, queue_factory=None):
 	"""Solve single-source shortest-paths problem with no negative-weight edges.
 
 	Arguments:
 	G -- a directed, weighted graph
 	s -- index of source vertex
+	target -- optional index of a destination vertex. If given, the search stops
+	as soon as target is extracted from the priority queue, so that only d[target]
+	and the predecessors on a shortest path to target are guaranteed to be final.
+	priority_queue -- name of the priority queue, see make_priority_queue,
+	default "indexed". Or "auto", which runs breadth-first search when every
+	edge has the same weight, as in stop-count graphs, and uses the indexed
+	heap otherwise. Checking the weights looks at every edge of G before the
+	search starts, so "auto" must be asked for.
+	weight -- optional name of the weight to use, for a graph with several
+	named weights on each edge, see select_weight
+	queue_factory -- optional queue factory, as described in priority_queues,
+	used instead of priority_queue
 	Assumption:
 	All weights are nonnegative
 
@@ -48,18 +125,43 @@ def dijkstra(G, s):
 	pi -- predecessors
 	"""
 
+	G = select_weight(G, weight)
+	if priority_queue == "auto" and queue_factory is None:
+		uniform = uniform_weight(G)
+		if uniform is not None:
+			return bfs(G, s, target, uniform)
+		priority_queue = "indexed"
+
 	card_V = G.get_card_V()
 
 	d, pi = initialize_single_source(G, s)
 
 	# Key function for the priority queue is distance.
-	queue = MinHeapPriorityQueue(lambda u: d[u])
+	queue = make_priority_queue(G, d, priority_queue, queue_factory)
 	for u in range(card_V):
 		queue.insert(u)
 
+	# A CSRGraph gives each vertex's targets and weights as lists, which are
+	# relaxed directly rather than through an Edge object and a function per edge.
+	get_neighbors = getattr(G, "get_neighbors", None)
+
 	while queue.get_size() > 0:  # while the priority queue is not empty
 		u = queue.extract_min()  # extract a vertex with the minimum distance
 
+		# Once the target is extracted its distance is final, and once an
+		# unreachable vertex is extracted every remaining vertex is unreachable too.
+		if u == target or d[u] == float('inf'):
+			break
+
+		if get_neighbors is not None:
+			d_u = d[u]
+			for v, w in zip(*get_neighbors(u)):
+				if d[v] > d_u + w:
+					d[v] = d_u + w
+					pi[v] = u
+					queue.decrease_key(v, d[v])
+			continue
+
 		# Relax each edge and update d and pi.
 		for edge in G.get_adj_list(u):
 			v = edge.get_v()
@@ -70,9 +172,143 @@ def dijkstra(G, s):
 	return d, pi
 
 
+def lazy_dijkstra(G, s, target=None, priority_queue="indexed", weight=None, queue_factory=None):
+	"""Solve single-source shortest-paths problem with no negative-weight edges,
+	inserting a vertex into the priority queue only when it is first reached.
+	The priority queue therefore holds only the frontier of the search rather
+	than all card_V vertices, and unreachable vertices are never touched.
+
+	Arguments:
+	G -- a directed, weighted graph
+	s -- index of source vertex
+	target -- optional index of a destination vertex, as in dijkstra
+	priority_queue -- name of the priority queue, default "indexed", or "auto", as in dijkstra
+	weight -- optional name of the weight to use, as in dijkstra
+	queue_factory -- optional queue factory, as in dijkstra
+	Assumption:
+	All weights are nonnegative
+
+	Returns:
+	d -- distances from source vertex s
+	pi -- predecessors
+	"""
+	G = select_weight(G, weight)
+	if priority_queue == "auto" and queue_factory is None:
+		uniform = uniform_weight(G)
+		if uniform is not None:
+			return bfs(G, s, target, uniform)
+		priority_queue = "indexed"
+
+	d, pi = initialize_single_source(G, s)
+
+	# Key function for the priority queue is distance.
+	queue = make_priority_queue(G, d, priority_queue, queue_factory)
+	queue.insert(s)
+
+	# Relax a CSRGraph's edges directly, as in dijkstra.
+	get_neighbors = getattr(G, "get_neighbors", None)
+
+	while queue.get_size() > 0:  # while the priority queue is not empty
+		u = queue.extract_min()  # extract a vertex with the minimum distance
+		if u == target:
+			break
+
+		if get_neighbors is not None:
+			d_u = d[u]
+			for v, w in zip(*get_neighbors(u)):
+				if d[v] == float('inf'):
+					# First time v is reached, so insert it with its new distance.
+					d[v] = d_u + w
+					pi[v] = u
+					queue.insert(v)
+				elif d[v] > d_u + w:
+					d[v] = d_u + w
+					pi[v] = u
+					queue.decrease_key(v, d[v])
+			continue
+
+		# Relax each edge and update d and pi.
+		for edge in G.get_adj_list(u):
+			v = edge.get_v()
+			if d[v] == float('inf'):
+				# First time v is reached, so insert it with its new distance.
+				relax(u, v, edge.get_weight(), d, pi, queue.insert)
+			else:
+				# Upon each relaxation, decrease the key in the priority queue.
+				relax(u, v, edge.get_weight(), d, pi,
+						lambda v: queue.decrease_key(v, d[u] + edge.get_weight()))
+
+	return d, pi
+
+
+def shortest_path(G, s, t, mapping_func=None, weight=None, priority_queue="indexed"):
+	"""Return the weight of a shortest path from s to t and the path itself.
+	Runs Dijkstra's algorithm with lazy insertion only until t is extracted
+	from the priority queue.
+
+	Arguments:
+	G -- a directed, weighted graph
+	s -- index of source vertex
+	t -- index of destination vertex
+	mapping_func -- optional function to map vertex numbers on the path,
+	default is to leave them as vertex numbers
+	weight -- optional name of the weight to use, as in dijkstra
+	priority_queue -- name of the priority queue, default "indexed", or "auto",
+	as in dijkstra. "auto" looks at every edge before the search starts, which
+	costs more than the search itself when t is near s.
+
+	Returns:
+	distance -- weight of a shortest path from s to t, infinity if there is none
+	path -- list of the vertices on the path from s to t, None if there is none
+	"""
+	if mapping_func is None:
+		mapping_func = lambda v: v
+
+	d, pi = lazy_dijkstra(G, s, target=t, priority_queue=priority_queue, weight=weight)
+	if d[t] == float('inf'):
+		return d[t], None
+	return d[t], print_path(pi, s, t, mapping_func)
+
+
 # Testing
 if __name__ == "__main__":
 
+	from adjacency_list_graph import AdjacencyListGraph
+	from generate_random_graph import generate_random_graph
+
+	# Textbook example, with the local graph class.
+	vertices = ['s', 't', 'x', 'y', 'z']
+	edges = [('s', 't', 10), ('s', 'y', 5), ('t', 'x', 1), ('t', 'y', 2), ('x', 'z', 4),
+			('y', 't', 3), ('y', 'x', 9), ('y', 'z', 2), ('z', 's', 7), ('z', 'x', 6)]
+	graph0 = AdjacencyListGraph(len(vertices), True, True)
+	for edge in edges:
+		graph0.insert_edge(vertices.index(edge[0]), vertices.index(edge[1]), edge[2])
+	d, pi = dijkstra(graph0, vertices.index('s'))
+
+	# Point-to-point query, which stops early but must agree with the full run.
+	distance, path = shortest_path(graph0, vertices.index('s'), vertices.index('x'), lambda v: vertices[v])
+	print("s to x: " + str(distance) + " via " + " -> ".join(path))
+	print(distance == d[vertices.index('x')])
+
+	# Lazy insertion and the bucket queue give the same distances as the full run.
+	print(lazy_dijkstra(graph0, vertices.index('s'))[0] == d)
+	print(dijkstra(graph0, vertices.index('s'), priority_queue="bucket")[0] == d)
+	print()
+
+	# The same on a larger random graph, from every source.
+	card_V = 100
+	graph0 = generate_random_graph(card_V, 0.08, True, True, True, 0, 15)
+	all_equal = True
+	for s in range(card_V):
+		d, pi = dijkstra(graph0, s, priority_queue="heap")
+		if lazy_dijkstra(graph0, s)[0] != d or dijkstra(graph0, s, priority_queue="bucket")[0] != d \
+				or dijkstra(graph0, s, priority_queue="auto")[0] != d \
+				or any(shortest_path(graph0, s, t)[0] != d[t] for t in range(0, card_V, 7)):
+			print("Shortest-path distances mismatch for source vertex", s)
+			all_equal = False
+	print("All shortest-path distances are " + ("not " if not all_equal else "") + "equal")
+	print()
+
 	from Libraries.adjacency_list_graph import AdjacencyListGraph
 	import bellman_ford
 	from generate_random_graph import generate_random_graph
@@ -0,0 +1,69 @@
+import os
+import pandas as pd
+from adjacency_list_graph import AdjacencyListGraph
+from graph_snapshot import GraphSnapshot
+from ingest_cache import read_excel_cached, function_hash
+
+
+# Shared by Task 4A and Task 4B, so that both key the Excel cache and the graph
+# snapshot with the same hashes and reuse each other's files
+class FormatData:
+    def __init__(self, file):
+        self.file = file
+        self.cleaned_data = None
+        self.stations = None
+        self.station_index = {}
+        self.graph = None
+        self.num_of_stations = 0
+        self.edges = []
+
+    @staticmethod
+    def clean_data(underground_data):
+        # Label the columns and clear incomplete rows
+        underground_data.columns = ['Line', 'Starting Station', 'Destination', 'Journey Time']
+        return underground_data.dropna(subset=['Line', 'Starting Station', 'Destination', 'Journey Time'])
+
+    def load_and_clean_data(self):
+        # Load the cleaned Excel data, parsing the file only when it has changed
+        self.cleaned_data = read_excel_cached(self.file, FormatData.clean_data)
+
+    def build_graph(self):
+        # Factorize the station names into indices, sorted so that they are deterministic
+        codes, stations = pd.factorize(pd.concat([self.cleaned_data['Starting Station'],
+                                                  self.cleaned_data['Destination']]), sort=True)
+        self.stations = stations.tolist()
+        for index, station in enumerate(self.stations):
+            self.station_index[station] = index
+
+        self.num_of_stations = len(self.stations)
+        start_keys, end_keys = codes[:len(self.cleaned_data)], codes[len(self.cleaned_data):]
+
+        # Keep the shortest row for each pair of stations, in either direction
+        weights = self.cleaned_data['Journey Time'].to_numpy()
+        unique = AdjacencyListGraph.unique_edges(start_keys, end_keys, directed=False, weights=weights)
+        self.edges = list(zip(start_keys[unique].tolist(), end_keys[unique].tolist(), weights[unique].tolist()))
+
+        # Build the adjacency list graph with weighted edges in one pass
+        self.graph = AdjacencyListGraph.from_edges(self.num_of_stations, start_keys[unique], end_keys[unique],
+                                                   weights[unique], directed=False)
+
+    def build_edges(self):
+        # Parse the Excel file and return the stations and unique edges for a snapshot
+        self.load_and_clean_data()
+        self.build_graph()
+        starts, ends, weights = zip(*self.edges)
+        return self.stations, starts, ends, weights
+
+    def load_graph(self):
+        # Map the stations and graph from a snapshot, rebuilt from the Excel file only when the file changes
+        snapshot_file = os.path.splitext(self.file)[0] + ' (journey times).graph'
+        snapshot = GraphSnapshot.load_or_build(snapshot_file, self.file, self.build_edges,
+                                               key=function_hash(FormatData.build_graph))
+        self.stations = snapshot.get_stations()
+        self.station_index = snapshot.get_station_index()
+        self.num_of_stations = len(self.stations)
+        starts, ends, weights = snapshot.get_edges()
+        self.edges = list(zip(starts.tolist(), ends.tolist(), weights.tolist()))
+        # Kruskal's algorithm breaks ties in adjacency-list order, so lay the lists out in row order
+        # rather than using the snapshot's sorted ones
+        self.graph = AdjacencyListGraph.from_edges(self.num_of_stations, starts, ends, weights, directed=False)
@@ -33,17 +33,19 @@
 from Coursework.Task4.merge_sort import merge_sort
 from adjacency_list_graph import AdjacencyListGraph
 from Libraries.disjoint_set_forest import make_set, find_set, union
-from min_heap_priority_queue import MinHeapPriorityQueue
+from priority_queues import get_queue_factory
 
 
 class KruskalEdge:
 
+    # Slots rather than a per-object dictionary, since kruskal makes one KruskalEdge per edge.
+    __slots__ = ("u", "v", "weight")
+
     def __init__(self, u, v, weight=None):
         """Initialize edge class that contains both endpoints and weight."""
         self.u = u
         self.v = v
-        if weight is not None:
-            self.weight = weight
+        self.weight = weight
 
     def get_u(self):
         """Return endpoint of vertex that edge starts."""
@@ -67,7 +69,8 @@ class KruskalEdge:
 
 
 def kruskal(G):
-    """ Return the minimum spanning tree of a weighted, undirected graph G using Kruskal's algorithm."""
+    """ Return the minimum spanning tree of a weighted, undirected graph G using Kruskal's algorithm.
+    G may be an AdjacencyListGraph or a CSRGraph."""
     if G.is_directed():
         raise RuntimeError("Graph should be undirected.")
 
@@ -84,7 +87,7 @@ def kruskal(G):
 
     for u in range(card_V):
         for edge in G.get_adj_list(u):
-            if u < edge.v:  # append edge only once
+            if u < edge.get_v():  # append edge only once
                 edges.append(KruskalEdge(u, edge.get_v(), edge.get_weight()))
     merge_sort(edges)  # sort in nondecreasing order by weight
 
@@ -100,12 +103,16 @@ def kruskal(G):
     return mst
 
 
-def prim(G, r):
+def prim(G, r, priority_queue="indexed", queue_factory=None):
     """ Return the minimum spanning tree of a weighted, undirected graph G using Prim's algorithm.
 
     Arguments:
-    G -- an undirected graph, represented by adjacency lists
+    G -- an undirected graph, represented by adjacency lists or a CSRGraph
     r -- root vertex to start from
+    priority_queue -- name of a queue in priority_queues.QUEUE_FACTORIES,
+    default is "indexed" for an IndexedMinPriorityQueue over the vertices
+    queue_factory -- optional queue factory, as described in priority_queues,
+    used instead of priority_queue
     """
     # Initialize keys and predecessors.
     card_V = G.get_card_V()
@@ -115,7 +122,9 @@ def prim(G, r):
     key[r] = 0  # root r has key 0
 
     # Initialize the min-priority queue of vertices.
-    queue = MinHeapPriorityQueue(lambda u: key[u])
+    if queue_factory is None:
+        queue_factory = get_queue_factory(priority_queue)
+    queue = queue_factory(card_V, lambda u: key[u])
     for u in range(card_V):
         queue.insert(u)
 
@@ -203,3 +212,5 @@ if __name__ == "__main__":
     prim_weight2 = get_total_weight(prim2)
     print("Prim weight =", prim_weight2)
     print(prim_weight2 == kruskal_weight2)
+    print(all(get_total_weight(prim(graph2, 0, priority_queue=name)) == prim_weight2
+              for name in ["heap", "4-ary", "pairing", "lazy"]))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# pairing_heap_priority_queue.py
+
+
+class PairingHeapPriorityQueue:
+
+	def __init__(self, capacity, get_key_func=None):
+		"""Initialize a minimum priority queue of the integers 0 to capacity - 1
+		implemented with a pairing heap.
+
+		A pairing heap is a tree in which each node's key is no greater than its
+		children's. insert and decrease_key take constant time, by linking a
+		node or a cut-off subtree with the root, and extract_min restores a
+		single tree by pairing up the root's children and then linking the pairs
+		from right to left. Each node's first child, next sibling and previous
+		node (its parent if it is a first child, otherwise its previous sibling)
+		are kept in lists indexed by object, with -1 for none.
+
+		Arguments:
+		capacity -- number of possible objects, which are 0 to capacity - 1
+		get_key_func -- optional function that returns the key of an object
+		when it is inserted, as in IndexedMinPriorityQueue
+		"""
+		self.get_key = get_key_func
+		self.keys = [float('inf')] * capacity
+		self.child = [-1] * capacity
+		self.sibling = [-1] * capacity
+		self.previous = [-1] * capacity
+		self.in_queue = [False] * capacity
+		self.root = -1
+		self.size = 0
+
+	def get_size(self):
+		"""Return the number of objects in the priority queue."""
+		return self.size
+
+	def contains(self, x):
+		"""Return True if object x is in the priority queue."""
+		return self.in_queue[x]
+
+	def get_key_of(self, x):
+		"""Return the key of object x."""
+		return self.keys[x]
+
+	def link(self, x, y):
+		"""Make the root with the larger key of two trees the first child of the
+		other, and return the root of the combined tree."""
+		if self.keys[y] < self.keys[x]:
+			x, y = y, x
+		first = self.child[x]
+		self.sibling[y] = first
+		if first != -1:
+			self.previous[first] = y
+		self.previous[y] = x
+		self.child[x] = y
+		return x
+
+	def insert(self, x, k=None):
+		"""Insert object x with key k, or with get_key_func(x) if k is not given."""
+		if self.in_queue[x]:
+			raise RuntimeError("Object " + str(x) + " is already in the priority queue.")
+		self.keys[x] = self.get_key(x) if k is None else k
+		self.child[x] = self.sibling[x] = self.previous[x] = -1
+		self.in_queue[x] = True
+		self.root = x if self.root == -1 else self.link(self.root, x)
+		self.size += 1
+
+	def minimum(self):
+		"""Return the object with the minimum key."""
+		if self.size <= 0:  # error if the queue is empty
+			raise RuntimeError("Heap underflow.")
+		return self.root
+
+	def extract_min(self):
+		"""Return and delete the object with the minimum key."""
+		top = self.minimum()
+		self.in_queue[top] = False
+		self.size -= 1
+
+		# First pass: link the root's children in pairs, from left to right.
+		pairs = []
+		x = self.child[top]
+		while x != -1:
+			y = self.sibling[x]
+			if y == -1:
+				self.previous[x] = self.sibling[x] = -1
+				pairs.append(x)
+				break
+			following = self.sibling[y]
+			self.previous[x] = self.sibling[x] = self.previous[y] = self.sibling[y] = -1
+			pairs.append(self.link(x, y))
+			x = following
+
+		# Second pass: link the pairs into one tree, from right to left.
+		root = -1
+		for x in reversed(pairs):
+			root = x if root == -1 else self.link(x, root)
+		self.root = root
+		self.child[top] = -1
+		return top
+
+	def decrease_key(self, x, k):
+		"""Decrease the key of object x to value k. Error if k is greater than x's current key."""
+		if k > self.keys[x]:
+			raise RuntimeError("Error in decrease_key: new key " + str(k)
+							   + " is greater than current key " + str(self.keys[x]))
+		self.keys[x] = k
+		if x == self.root:
+			return
+
+		# Cut the subtree of x out of its parent's list of children and link it with the root.
+		before = self.previous[x]
+		after = self.sibling[x]
+		if self.child[before] == x:
+			self.child[before] = after
+		else:
+			self.sibling[before] = after
+		if after != -1:
+			self.previous[after] = before
+		self.previous[x] = self.sibling[x] = -1
+		self.root = self.link(self.root, x)
+
+	def is_heap(self):
+		"""Verify that no node's key is less than its parent's."""
+		if self.root == -1:
+			return self.size == 0
+		count = 0
+		stack = [self.root]
+		while len(stack) > 0:
+			x = stack.pop()
+			count += 1
+			y = self.child[x]
+			while y != -1:
+				if self.keys[y] < self.keys[x]:
+					return False
+				stack.append(y)
+				y = self.sibling[y]
+		return count == self.size
+
+
+# Testing
+if __name__ == "__main__":
+
+	from random import randint, random, seed
+
+	# Interleave inserts, decreases and extractions, checking the heap and that
+	# each extraction takes a minimum key of those in the queue.
+	seed(0)
+	pq1 = PairingHeapPriorityQueue(200)
+	live = {}
+	inserted = 0
+	all_heaps = True
+	all_minimum = True
+	while inserted < 200 or pq1.get_size() > 0:
+		if inserted < 200 and random() < 0.6:
+			live[inserted] = randint(0, 1000)
+			pq1.insert(inserted, live[inserted])
+			inserted += 1
+		elif pq1.get_size() > 0 and random() < 0.5:
+			x = randint(0, inserted - 1)
+			if pq1.contains(x):
+				live[x] -= randint(0, 500)
+				pq1.decrease_key(x, live[x])
+		elif pq1.get_size() > 0:
+			x = pq1.extract_min()
+			all_minimum = all_minimum and live.pop(x) == min(list(live.values()) + [pq1.get_key_of(x)])
+		all_heaps = all_heaps and pq1.is_heap()
+	print(all_heaps, all_minimum, len(live))
+
+	# Keys can come from a function, as for MinHeapPriorityQueue.
+	d = [5, 3, 8, 1]
+	pq2 = PairingHeapPriorityQueue(4, lambda u: d[u])
+	for u in range(4):
+		pq2.insert(u)
+	d[2] = 0
+	pq2.decrease_key(2, d[2])
+	print([pq2.extract_min() for i in range(4)])
+	try:
+		pq2.extract_min()
+	except RuntimeError as e:
+		print(e)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# parallel_apsp.py
+
+import numpy as np
+from multiprocessing import Pool, cpu_count, shared_memory
+from csr_graph import CSRGraph
+from dijkstra import dijkstra, select_weight
+from bfs import bfs, uniform_weight
+from all_pairs_shortest_paths import dijkstra_apsp
+
+# Fewest vertices for which a pool is started when the number of processes is
+# not given. Below it, starting the workers and exporting the graph take
+# longer than running dijkstra_apsp in this process.
+SEQUENTIAL_THRESHOLD = 1000
+
+
+class SharedArray:
+
+	def __init__(self, shape, dtype, name=None):
+		"""Create a NumPy array in shared memory, or attach to an existing one.
+
+		Arguments:
+		shape -- shape of the array
+		dtype -- NumPy data type of the array
+		name -- name of an existing shared memory block to attach to,
+		default is to create a new block
+		"""
+		size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+		self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+		self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+		self.spec = (shape, dtype, self.shm.name)  # enough to attach from another process
+
+	def close(self):
+		"""Detach from the shared memory block."""
+		del self.array
+		self.shm.close()
+
+	def unlink(self):
+		"""Detach from and free the shared memory block."""
+		self.close()
+		self.shm.unlink()
+
+
+def export_graph(G):
+	"""Copy the adjacency lists of G into shared memory in compressed sparse row
+	form, directly from its arrays if G is a CSRGraph. An unweighted graph's
+	edges get weight 1, as in uniform_weight. Returns the SharedArray objects
+	for the offsets, targets and weights."""
+	card_V = G.get_card_V()
+	if isinstance(G, CSRGraph):
+		weights = G.get_weights()
+		arrays = G.get_offsets(), G.get_targets(), np.ones(len(G.get_targets())) if weights is None else weights
+	else:
+		adj_lists = [[(edge.get_v(), 1 if edge.get_weight() is None else edge.get_weight())
+					  for edge in G.get_adj_list(u)] for u in range(card_V)]
+		entries = [entry for adj_list in adj_lists for entry in adj_list]
+		offsets = np.zeros(card_V + 1, dtype=np.int64)
+		offsets[1:] = np.cumsum([len(adj_list) for adj_list in adj_lists])
+		arrays = offsets, [v for v, weight in entries], [weight for v, weight in entries]
+
+	shared = []
+	for array, dtype in zip(arrays, (np.int64, np.int32, np.float64)):
+		shared.append(SharedArray((len(array),), dtype))
+		shared[-1].array[:] = array
+	return shared
+
+
+# State of each worker process, set once by init_worker.
+worker = {}
+
+
+def init_worker(offsets_spec, targets_spec, weights_spec, D_spec, Pi_spec):
+	"""Attach a worker process to the shared graph and output matrices. The
+	worker searches a CSRGraph over the shared arrays themselves, so no process
+	holds its own copy of the graph."""
+	worker["arrays"] = [SharedArray(*spec) for spec in (offsets_spec, targets_spec, weights_spec)]
+	worker["graph"] = CSRGraph(*(array.array for array in worker["arrays"]))
+	worker["uniform"] = uniform_weight(worker["graph"])
+	worker["D"] = SharedArray(*D_spec)
+	worker["Pi"] = SharedArray(*Pi_spec)
+
+
+def solve_sources(sources):
+	"""Run dijkstra from each source and write the rows of the output matrices."""
+	D = worker["D"].array
+	Pi = worker["Pi"].array
+	for s in sources:
+		if worker["uniform"] is not None:
+			d, pi = bfs(worker["graph"], s, weight=worker["uniform"])
+		else:
+			d, pi = dijkstra(worker["graph"], s, priority_queue="indexed")
+		D[s] = d
+		Pi[s] = [-1 if u is None else u for u in pi]
+
+
+def parallel_dijkstra_apsp(G, processes=None, chunk_size=16, weight=None):
+	"""Compute all-pairs shortest paths like dijkstra_apsp, with the sources
+	shared out among a pool of worker processes. The graph is exported once into
+	shared memory, and workers write their rows straight into shared output
+	matrices, so neither is pickled per task.
+
+	Arguments:
+	G -- a weighted graph with no negative-weight edges, such as an
+	AdjacencyListGraph or a CSRGraph
+	processes -- number of worker processes. The default is the number of CPUs,
+	or no pool at all, running dijkstra_apsp instead, if there is only one CPU
+	or G has fewer than SEQUENTIAL_THRESHOLD vertices.
+	chunk_size -- number of sources given to a worker at a time
+	weight -- optional name of the weight to use, as in dijkstra_apsp; only
+	that weight is exported to the workers
+	Returns:
+	D -- card_V x card_V array of shortest-path weights, infinity if there is no path
+	Pi -- card_V x card_V array of predecessors, -1 if there is none
+	"""
+	G = select_weight(G, weight)
+	card_V = G.get_card_V()
+	if processes is None:
+		processes = cpu_count()
+		if processes == 1 or card_V < SEQUENTIAL_THRESHOLD:
+			return dijkstra_apsp(G)
+
+	graph_arrays = export_graph(G)
+	D = SharedArray((card_V, card_V), np.float64)
+	Pi = SharedArray((card_V, card_V), np.int32)
+	try:
+		chunks = [range(s, min(s + chunk_size, card_V)) for s in range(0, card_V, chunk_size)]
+		initargs = [array.spec for array in graph_arrays] + [D.spec, Pi.spec]
+		with Pool(processes, initializer=init_worker, initargs=initargs) as pool:
+			pool.map(solve_sources, chunks)
+		# Copy the results out before the shared memory is freed.
+		return D.array.copy(), Pi.array.copy()
+	finally:
+		for array in list(graph_arrays) + [D, Pi]:
+			array.unlink()
+
+
+# Testing
+if __name__ == "__main__":
+
+	from generate_random_graph import generate_random_graph
+	from all_pairs_shortest_paths import dijkstra_apsp
+
+	# Parallel and sequential runs should give the same matrices.
+	card_V = 100
+	graph1 = generate_random_graph(card_V, 0.05, True, False, True, 1, 10)
+	D, Pi = parallel_dijkstra_apsp(graph1, processes=4)
+	sequential_D, sequential_Pi = dijkstra_apsp(graph1)
+	print(np.array_equal(D, sequential_D))
+	print(np.array_equal(Pi, sequential_Pi))
+
+	# A CSRGraph is copied into shared memory straight from its arrays.
+	csr_D, csr_Pi = parallel_dijkstra_apsp(CSRGraph.from_graph(graph1), processes=4)
+	print(np.array_equal(csr_D, sequential_D))
+
+	# A small graph with the default number of processes starts no pool.
+	default_D, default_Pi = parallel_dijkstra_apsp(graph1)
+	print(np.array_equal(default_D, sequential_D))
+
+	# Unweighted graphs count each edge as 1, from either representation.
+	graph2 = generate_random_graph(card_V, 0.05, True, False, False)
+	sequential_D, sequential_Pi = dijkstra_apsp(graph2)
+	print(np.array_equal(parallel_dijkstra_apsp(graph2, processes=4)[0], sequential_D))
+	print(np.array_equal(parallel_dijkstra_apsp(CSRGraph.from_graph(graph2), processes=4)[0], sequential_D))